@@ -0,0 +1,316 @@
+"""Teste de carga da API, em processo, com clientes concorrentes.
+
+Popula um banco (SQLite ou PostgreSQL) com um conjunto configurável de
+usuários, produtos e vendas e dispara requisições contra cada rota de
+leitura e escrita via ASGI (httpx), sem servidor HTTP. Para cada cenário
+mostra p50/p95/p99 e a vazão; com --baseline compara com um resultado
+salvo antes (--save-baseline) e termina com código 1 se algum cenário
+piorar além da tolerância.
+
+Os números dependem da máquina: compare sempre com um baseline gravado
+no mesmo ambiente.
+
+Uso:
+    python -m benchmarks.bench_api --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_api --baseline benchmarks/baseline.json
+    python -m benchmarks.bench_api --url postgresql+psycopg://... --async
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import timedelta
+from itertools import count
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+import httpx  # noqa: E402
+from sqlalchemy import create_engine, make_url, select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    AsyncSession,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session  # noqa: E402
+
+from benchmarks.bench_indexes import START_DATE, seed  # noqa: E402
+from benchmarks.bench_reports import UPDATE_TOTALS  # noqa: E402
+from fastapi_supermarket.core.database import (  # noqa: E402
+    get_session,
+    settings,
+)
+from fastapi_supermarket.core.security import get_password_hash  # noqa: E402
+from fastapi_supermarket.main import app  # noqa: E402
+from fastapi_supermarket.models import Product, Sales, User  # noqa: E402
+from fastapi_supermarket.services.rollup_service import rebuild  # noqa: E402
+
+WARMUP_REQUESTS = 5
+
+EMAIL = 'loadtest@bench.com'
+PASSWORD = 'Secret123'
+
+REPORT_PERIOD = {
+    'start_date': START_DATE.date().isoformat(),
+    'end_date': (START_DATE.date() + timedelta(days=89)).isoformat(),
+}
+
+
+def scenarios(data: dict) -> dict:
+    """Cada cenário sorteia (método, URL, kwargs do httpx)."""
+    products = data['products']
+    sales = data['sales']
+    return {
+        'POST /auth/token': lambda rnd: (
+            'POST',
+            '/auth/token',
+            {'data': {'username': EMAIL, 'password': PASSWORD}},
+        ),
+        'GET /products/': lambda rnd: (
+            'GET',
+            '/products/',
+            {'params': {'skip': rnd.randrange(1000), 'limit': 100}},
+        ),
+        'GET /products/{id}': lambda rnd: (
+            'GET',
+            f'/products/{rnd.choice(products)}',
+            {},
+        ),
+        'GET /products/search': lambda rnd: (
+            'GET',
+            '/products/search',
+            {'params': {'q': f'product{rnd.randrange(100)}'}},
+        ),
+        'GET /categories/': lambda rnd: (
+            'GET',
+            '/categories/',
+            {'params': {'limit': 50}},
+        ),
+        'GET /categories/{id}': lambda rnd: (
+            'GET',
+            f'/categories/{rnd.randint(1, 50)}',
+            {},
+        ),
+        'GET /sales/': lambda rnd: (
+            'GET',
+            '/sales/',
+            {'params': {'skip': rnd.randrange(len(sales)), 'limit': 50}},
+        ),
+        'GET /sales/{id}': lambda rnd: (
+            'GET',
+            f'/sales/{rnd.choice(sales)}',
+            {},
+        ),
+        'POST /sales/': lambda rnd: (
+            'POST',
+            '/sales/',
+            {
+                'json': {
+                    'id_user': data['user'],
+                    'products': [
+                        {'id_product': product, 'quantity': 1}
+                        for product in rnd.sample(products, 3)
+                    ],
+                }
+            },
+        ),
+        'GET /reports/summary': lambda rnd: (
+            'GET',
+            '/reports/summary',
+            {'params': REPORT_PERIOD},
+        ),
+        'GET /reports/revenue-by-category': lambda rnd: (
+            'GET',
+            '/reports/revenue-by-category',
+            {'params': REPORT_PERIOD},
+        ),
+    }
+
+
+def prepare(engine, args) -> dict:
+    seed(engine, args.users, args.products, args.sales, args.seed)
+    with engine.begin() as conn:
+        conn.execute(UPDATE_TOTALS)
+    with Session(engine) as session:
+        rebuild(session)
+        user = User(
+            name='loadtest',
+            cpf='99999999999',
+            email=EMAIL,
+            password=get_password_hash(PASSWORD),
+        )
+        session.add(user)
+        session.commit()
+        # Só registros ativos: os removidos responderiam 404
+        products = session.scalars(
+            select(Product.id).where(Product.deleted_at.is_(None))
+        ).all()
+        sales = session.scalars(
+            select(Sales.id).where(Sales.deleted_at.is_(None))
+        ).all()
+        return {'user': user.id, 'products': products, 'sales': sales}
+
+
+def override_session(engine, use_async: bool) -> None:
+    if use_async:
+        url = engine.url
+        if url.get_backend_name() == 'sqlite':
+            url = url.set(drivername='sqlite+aiosqlite')
+        async_engine = create_async_engine(url)
+        settings.DATABASE_ASYNC = True
+
+        async def get_session_override():
+            async with AsyncSession(async_engine) as session:
+                yield session.sync_session
+
+    else:
+
+        def get_session_override():
+            with Session(engine) as session:
+                yield session
+
+    app.dependency_overrides[get_session] = get_session_override
+
+
+async def run_scenario(  # noqa: PLR0913, PLR0917
+    client, headers, build, requests: int, concurrency: int, rnd
+) -> dict:
+    latencies = []
+    errors = 0
+    issued = count()
+
+    # Aquece caches, pool de conexões e os workers de hash antes de medir
+    for _ in range(WARMUP_REQUESTS):
+        method, url, kwargs = build(rnd)
+        await client.request(method, url, headers=headers, **kwargs)
+
+    async def worker():
+        nonlocal errors
+        while next(issued) < requests:
+            method, url, kwargs = build(rnd)
+            start = time.perf_counter()
+            response = await client.request(
+                method, url, headers=headers, **kwargs
+            )
+            latencies.append(time.perf_counter() - start)
+            errors += response.is_error
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        'requests': requests,
+        'errors': errors,
+        'throughput': round(requests / elapsed, 1),
+        'p50_ms': round(percentiles[49] * 1000, 3),
+        'p95_ms': round(percentiles[94] * 1000, 3),
+        'p99_ms': round(percentiles[98] * 1000, 3),
+    }
+
+
+async def run(data: dict, args) -> dict:
+    rnd = random.Random(args.seed)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url='http://bench'
+    ) as client:
+        response = await client.post(
+            '/auth/token', data={'username': EMAIL, 'password': PASSWORD}
+        )
+        headers = {
+            'Authorization': f'Bearer {response.json()["access_token"]}'
+        }
+        results = {}
+        for name, build in scenarios(data).items():
+            if args.only and args.only not in name:
+                continue
+            requests = (
+                args.auth_requests if name == 'POST /auth/token' else
+                args.requests
+            )  # fmt: skip
+            results[name] = await run_scenario(
+                client, headers, build, requests, args.concurrency, rnd
+            )
+            print(format_result(name, results[name]))
+        return results
+
+
+def format_result(name: str, result: dict) -> str:
+    return (
+        f'{name:32} {result["throughput"]:9.1f} req/s'
+        f'  p50 {result["p50_ms"]:8.2f}  p95 {result["p95_ms"]:8.2f}'
+        f'  p99 {result["p99_ms"]:8.2f} ms'
+        + (f'  errors {result["errors"]}' if result['errors'] else '')
+    )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Cenários com p95 ou vazão piores que o baseline além da tolerância."""
+    regressions = []
+    print(f'\nvs baseline (tolerance {tolerance:.0%})')
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        p95 = result['p95_ms'] / before['p95_ms'] - 1
+        throughput = result['throughput'] / before['throughput'] - 1
+        regressed = p95 > tolerance or throughput < -tolerance
+        print(
+            f'{name:32} p95 {p95:+7.1%}  throughput {throughput:+7.1%}'
+            + ('  REGRESSION' if regressed else '')
+        )
+        if regressed:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_api.db')
+    parser.add_argument('--async', action='store_true', dest='use_async')
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--sales', type=int, default=20_000)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--auth-requests', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--only', help='run scenarios containing this text')
+    parser.add_argument('--baseline', help='JSON to compare against')
+    parser.add_argument('--save-baseline', help='write results to this JSON')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    data = prepare(engine, args)
+    override_session(engine, args.use_async)
+
+    backend = make_url(args.url).get_backend_name()
+    mode = 'async' if args.use_async else 'sync'
+    print(
+        f'{backend} ({mode}), {args.users} users, {args.products} products,'
+        f' {args.sales} sales, concurrency {args.concurrency}\n'
+    )
+    results = asyncio.run(run(data, args))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+            file.write('\n')
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Mede a vazão da importação de catálogo (POST /products/import).
+
+Gera um CSV (ou NDJSON) sintético, importa uma vez (só INSERT) e de novo
+(tudo vira UPDATE pelo SKU), e compara com o caminho de um POST /products/
+por produto.
+
+Uso:
+    python -m benchmarks.bench_import --rows 200000
+    python -m benchmarks.bench_import --url postgresql+psycopg://...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from fastapi_supermarket.models import Category, table_registry  # noqa: E402
+from fastapi_supermarket.schemas.product_schema import (  # noqa: E402
+    ProductCreate,
+)
+from fastapi_supermarket.services import product_service  # noqa: E402
+from fastapi_supermarket.services.import_service import (  # noqa: E402
+    import_products,
+)
+
+CATEGORIES = 50
+
+# Tamanho dos pedaços em que o corpo da requisição chega
+BODY_CHUNK_SIZE = 64 * 1024
+
+
+def build_body(rows: int, import_format: str, random_seed: int) -> bytes:
+    rnd = random.Random(random_seed)
+    products = [
+        {
+            'sku': f'SKU{i:08d}',
+            'category': f'category{rnd.randrange(CATEGORIES)}',
+            'description': f'product {i} {rnd.randrange(10**6)}',
+            'price': round(rnd.uniform(1, 100), 2),
+        }
+        for i in range(rows)
+    ]
+    if import_format == 'ndjson':
+        lines = [json.dumps(product) for product in products]
+    else:
+        lines = ['sku,category,description,price'] + [
+            ','.join(str(value) for value in product.values())
+            for product in products
+        ]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+async def _stream(body: bytes):
+    for start in range(0, len(body), BODY_CHUNK_SIZE):
+        yield body[start : start + BODY_CHUNK_SIZE]
+
+
+def run_import(engine, body: bytes, import_format: str) -> tuple:
+    with Session(engine) as session:
+        start = time.perf_counter()
+        report = asyncio.run(
+            import_products(_stream(body), import_format, session)
+        )
+        return report, time.perf_counter() - start
+
+
+def run_single_posts(engine, rows: int) -> float:
+    with Session(engine) as session:
+        start = time.perf_counter()
+        for i in range(rows):
+            product_service.create(
+                ProductCreate(
+                    id_category=i % CATEGORIES + 1,
+                    description=f'single {i}',
+                    price=1.0,
+                ),
+                session,
+            )
+        return rows / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_import.db')
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument(
+        '--format', choices=['csv', 'ndjson'], default='csv', dest='fmt'
+    )
+    parser.add_argument('--single-rows', type=int, default=1_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Category.__table__),
+            [{'description': f'category{i}'} for i in range(CATEGORIES)],
+        )
+
+    body = build_body(args.rows, args.fmt, args.seed)
+    print(f'{args.rows} rows, {args.fmt}, {len(body) / 2**20:.1f} MiB')
+    for name in ['insert', 'update']:
+        report, seconds = run_import(engine, body, args.fmt)
+        print(
+            f'  {name:8} {args.rows / seconds:10,.0f} rows/s'
+            f'  (created {report.created}, updated {report.updated},'
+            f' invalid {report.invalid})'
+        )
+    throughput = run_single_posts(engine, args.single_rows)
+    print(f'  {"POST /":8} {throughput:10,.0f} rows/s (one product per call)')
+
+
+if __name__ == '__main__':
+    main()
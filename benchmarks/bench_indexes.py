@@ -0,0 +1,210 @@
+"""Compara planos (EXPLAIN) e latência das consultas com e sem índices.
+
+Popula um banco com dados sintéticos, mede as consultas do padrão de
+soft delete sem os índices secundários e, depois, com eles.
+
+Uso:
+    python -m benchmarks.bench_indexes --url sqlite:////tmp/bench.db
+    python -m benchmarks.bench_indexes --url postgresql+psycopg://...
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, select, text
+
+from fastapi_supermarket.models import (
+    Category,
+    Product,
+    ProductSales,
+    Sales,
+    User,
+    table_registry,
+)
+
+BATCH_SIZE = 10_000
+START_DATE = datetime(2024, 1, 1)
+
+
+def _batches(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _deleted_at(rnd: random.Random):
+    return START_DATE if rnd.random() < 0.1 else None  # noqa: PLR2004
+
+
+def seed(
+    engine, users: int, products: int, sales: int, random_seed: int
+) -> None:
+    rnd = random.Random(random_seed)
+    product_categories = []
+
+    def product_rows():
+        for i in range(products):
+            product_categories.append(rnd.randint(1, 50))
+            yield {
+                'id_category': product_categories[-1],
+                'description': f'product{i}',
+                'price': round(rnd.uniform(1, 100), 2),
+                'deleted_at': _deleted_at(rnd),
+            }
+
+    def item_rows():
+        for sale_id in range(1, sales + 1):
+            for _ in range(3):
+                product = rnd.randint(1, products)
+                yield {
+                    'id_sale': sale_id,
+                    'id_product': product,
+                    'id_category': product_categories[product - 1],
+                    'unit_price': round(rnd.uniform(1, 100), 2),
+                }
+
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+
+    tables = {
+        User: (
+            {
+                'name': f'user{i}',
+                'cpf': f'{i:011d}',
+                'email': f'user{i}@bench.com',
+                'password': 'x',
+                'deleted_at': _deleted_at(rnd),
+            }
+            for i in range(users)
+        ),
+        Category: ({'description': f'category{i}'} for i in range(50)),
+        Product: product_rows(),
+        Sales: (
+            {
+                'id_user': rnd.randint(1, users),
+                'created_at': START_DATE
+                + timedelta(minutes=rnd.randint(0, 365 * 24 * 60)),
+                'deleted_at': _deleted_at(rnd),
+            }
+            for _ in range(sales)
+        ),
+        ProductSales: item_rows(),
+    }
+    with engine.begin() as conn:
+        for model, rows in tables.items():
+            for batch in _batches(rows):
+                conn.execute(insert(model.__table__), batch)
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text('ANALYZE'))
+
+
+def queries(users: int, products: int) -> dict:
+    day = START_DATE + timedelta(days=180)
+    return {
+        'users by email': select(User).where(
+            User.deleted_at.is_(None)
+            & (User.email == f'user{users // 2}@bench.com')
+        ),
+        'users by cpf': select(User).where(
+            User.deleted_at.is_(None) & (User.cpf == f'{users // 2:011d}')
+        ),
+        'products by category': select(Product).where(
+            Product.deleted_at.is_(None) & (Product.id_category == 1)
+        ),
+        'sales by day': select(Sales).where(
+            Sales.deleted_at.is_(None)
+            & Sales.created_at.between(day, day + timedelta(days=1))
+        ),
+        'sales by user': select(Sales).where(
+            Sales.deleted_at.is_(None) & (Sales.id_user == users // 2)
+        ),
+        'items by sale': select(ProductSales).where(ProductSales.id_sale == 1),
+        'items by product': select(ProductSales).where(
+            ProductSales.id_product == products // 2
+        ),
+    }
+
+
+def explain(conn, query) -> str:
+    sql = str(
+        query.compile(
+            dialect=conn.dialect, compile_kwargs={'literal_binds': True}
+        )
+    )
+    if conn.dialect.name == 'sqlite':
+        rows = conn.execute(text(f'EXPLAIN QUERY PLAN {sql}')).all()
+        return ' | '.join(row[-1] for row in rows)
+    rows = conn.execute(text(f'EXPLAIN {sql}')).all()
+    return ' | '.join(row[0].strip() for row in rows)
+
+
+def measure(engine, query, repeat: int) -> float:
+    timings = []
+    with engine.connect() as conn:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(query).all()
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run(engine, users: int, products: int, repeat: int) -> dict:
+    results = {}
+    for name, query in queries(users, products).items():
+        with engine.connect() as conn:
+            plan = explain(conn, query)
+        results[name] = {
+            'ms': measure(engine, query, repeat),
+            'plan': plan,
+        }
+    return results
+
+
+def set_indexes(engine, create: bool) -> None:
+    with engine.begin() as conn:
+        for table in table_registry.metadata.sorted_tables:
+            for index in table.indexes:
+                if create:
+                    index.create(conn, checkfirst=True)
+                else:
+                    index.drop(conn, checkfirst=True)
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text('ANALYZE'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_indexes.db')
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--sales', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    seed(engine, args.users, args.products, args.sales, args.seed)
+
+    set_indexes(engine, create=False)
+    before = run(engine, args.users, args.products, args.repeat)
+    set_indexes(engine, create=True)
+    after = run(engine, args.users, args.products, args.repeat)
+
+    for name in before:
+        print(f'\n{name}')
+        print(
+            f'  before: {before[name]["ms"]:9.3f} ms  {before[name]["plan"]}'
+        )
+        print(f'  after:  {after[name]["ms"]:9.3f} ms  {after[name]["plan"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Mede a vazão do login e compara com a consulta anterior.
+
+A versão anterior calculava um hash Argon2 extra dentro do WHERE, além do
+verify_password; a atual faz uma busca por e-mail e um único verify.
+
+Uso:
+    python -m benchmarks.bench_login --logins 200 --concurrency 8
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from fastapi_supermarket.core.security import (  # noqa: E402
+    create_access_token,
+    get_password_hash,
+    password_hasher,
+    verify_password,
+)
+from fastapi_supermarket.models import User, table_registry  # noqa: E402
+from fastapi_supermarket.services.auth_service import (  # noqa: E402
+    generate_token,
+)
+
+PASSWORD = 'Secret123'
+
+
+def legacy_generate_token(session, form_data) -> str:
+    user = session.scalar(
+        select(User).where(
+            User.deleted_at.is_(None)
+            & (
+                (User.email == form_data.username)
+                | (User.password == get_password_hash(form_data.password))
+            )
+        )
+    )
+    if not user or not verify_password(form_data.password, user.password):
+        raise ValueError('invalid credentials')
+    return create_access_token(data_payload={'sub': user.email})
+
+
+def run(engine, login, logins: int, concurrency: int) -> float:
+    form_data = SimpleNamespace(username='bench@test.com', password=PASSWORD)
+
+    def task(_):
+        with Session(engine) as session:
+            login(session, form_data)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(task, range(logins)))
+    return logins / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_login.db')
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(
+            User(
+                name='bench',
+                cpf='00000000000',
+                email='bench@test.com',
+                password=get_password_hash(PASSWORD),
+            )
+        )
+        session.commit()
+
+    print(f'hash workers: {password_hasher.workers}')
+    for name, login in [
+        ('legacy', legacy_generate_token),
+        ('current', generate_token),
+    ]:
+        throughput = run(engine, login, args.logins, args.concurrency)
+        print(f'{name:8} {throughput:8.1f} logins/s')
+
+
+if __name__ == '__main__':
+    main()
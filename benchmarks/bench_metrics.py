@@ -0,0 +1,90 @@
+"""Mede o custo por requisição do MetricsMiddleware e do contador de SQL.
+
+Chama uma aplicação ASGI mínima direto (sem servidor HTTP), com e sem o
+middleware, e executa ``SELECT 1`` com e sem os eventos do engine.
+
+Uso:
+    python -m benchmarks.bench_metrics --requests 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import create_engine, text
+
+from fastapi_supermarket.core.request_metrics import (
+    MetricsMiddleware,
+    RequestMetrics,
+    RequestStats,
+    request_stats,
+)
+
+WARMUP = 2_000
+
+SCOPE = {'type': 'http', 'method': 'GET', 'path': '/bench'}
+
+
+async def app(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'{}'})
+
+
+async def receive():  # pragma: no cover
+    return {'type': 'http.request', 'body': b''}
+
+
+async def send(message):
+    pass
+
+
+async def call(asgi, requests: int) -> float:
+    for _ in range(WARMUP):
+        await asgi(dict(SCOPE), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await asgi(dict(SCOPE), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def run_statements(engine, statements: int) -> float:
+    token = request_stats.set(RequestStats())
+    try:
+        with engine.connect() as conn:
+            for _ in range(WARMUP):
+                conn.execute(text('SELECT 1'))
+            start = time.perf_counter()
+            for _ in range(statements):
+                conn.execute(text('SELECT 1'))
+            return (time.perf_counter() - start) / statements
+    finally:
+        request_stats.reset(token)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=100_000)
+    parser.add_argument('--statements', type=int, default=50_000)
+    args = parser.parse_args()
+
+    bare = asyncio.run(call(app, args.requests))
+    measured = asyncio.run(call(MetricsMiddleware(app), args.requests))
+    print(f'ASGI app       {bare * 1e6:7.2f} us/request')
+    print(
+        f'  + middleware {measured * 1e6:7.2f} us/request'
+        f'  (+{(measured - bare) * 1e6:.2f} us)'
+    )
+
+    engine = create_engine('sqlite://')
+    bare = run_statements(engine, args.statements)
+    RequestMetrics().instrument(engine)
+    counted = run_statements(engine, args.statements)
+    print(f'SELECT 1       {bare * 1e6:7.2f} us/statement')
+    print(
+        f'  + counters   {counted * 1e6:7.2f} us/statement'
+        f'  (+{(counted - bare) * 1e6:.2f} us)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Compara os relatórios em SQL com o backend NumPy (extra analytics).
+
+Popula o banco com vendas sintéticas (3 itens por venda), recalcula os
+agregados diários e mede cada relatório nos dois caminhos.
+
+Uso:
+    python -m benchmarks.bench_reports --line-items 1000000
+    python -m benchmarks.bench_reports --url postgresql+psycopg://...
+"""
+
+import argparse
+import os
+import statistics
+import time
+from datetime import timedelta
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from benchmarks.bench_indexes import START_DATE, seed  # noqa: E402
+from fastapi_supermarket.services import (  # noqa: E402
+    analytics_service,
+    sales_service,
+)
+from fastapi_supermarket.services.rollup_service import rebuild  # noqa: E402
+
+ITEMS_PER_SALE = 3
+
+UPDATE_TOTALS = text(
+    'UPDATE sales SET total_amount = COALESCE(('
+    'SELECT SUM(quantity * unit_price) FROM product_sales '
+    'WHERE product_sales.id_sale = sales.id), 0)'
+)
+
+
+def measure(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_reports.db')
+    parser.add_argument('--line-items', type=int, default=1_000_000)
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    sales = args.line_items // ITEMS_PER_SALE
+    seed(engine, 10_000, 5_000, sales, args.seed)
+    with engine.begin() as conn:
+        conn.execute(UPDATE_TOTALS)
+    with Session(engine) as session:
+        rebuild(session)
+
+    start_date = START_DATE.date()
+    end_date = start_date + timedelta(days=args.days)
+    reports = [
+        'get_sales_summary',
+        'get_top_product',
+        'get_top_customer',
+        'get_revenue_by_category',
+    ]
+    print(f'{args.line_items} line items, {args.days}-day range')
+    with Session(engine) as session:
+        for name in reports:
+            sql, numpy = (
+                measure(
+                    lambda backend=backend: getattr(backend, name)(
+                        start_date, end_date, session
+                    ),
+                    args.repeat,
+                )
+                for backend in [sales_service, analytics_service]
+            )
+            print(f'{name:26} sql {sql:9.1f} ms  numpy {numpy:9.1f} ms')
+        sql, numpy = (
+            measure(
+                lambda backend=backend: backend.get_monthly_average(session),
+                args.repeat,
+            )
+            for backend in [sales_service, analytics_service]
+        )
+        name = 'get_monthly_average'
+        print(f'{name:26} sql {sql:9.1f} ms  numpy {numpy:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""Mede a latência da busca de produtos (GET /products/search).
+
+Popula o catálogo com SKUs sintéticos e mede a busca por prefixo e por
+várias palavras, com e sem filtro de categoria.
+
+Uso:
+    python -m benchmarks.bench_search --products 500000
+    python -m benchmarks.bench_search --url postgresql+psycopg://...
+"""
+
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+from sqlalchemy import create_engine, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from benchmarks.bench_indexes import _batches  # noqa: E402
+from fastapi_supermarket.models import (  # noqa: E402
+    Category,
+    Product,
+    table_registry,
+)
+from fastapi_supermarket.services.product_service import search  # noqa: E402
+
+WORDS = [
+    'arroz',
+    'feijao',
+    'refrigerante',
+    'suco',
+    'leite',
+    'cafe',
+    'acucar',
+    'biscoito',
+    'sabao',
+    'detergente',
+    'queijo',
+    'presunto',
+    'iogurte',
+    'cerveja',
+    'agua',
+    'macarrao',
+    'molho',
+    'azeite',
+    'sal',
+    'farinha',
+]
+BRANDS = [f'marca{i}' for i in range(200)]
+SIZES = ['200ml', '350ml', '1l', '2l', '500g', '1kg', '5kg']
+
+QUERIES = {
+    'prefix': ('refri', None),
+    'two words': ('suco marca12', None),
+    'category filter': ('leite', 1),
+    'no match': ('xyzw', None),
+}
+
+
+def seed(engine, products: int, random_seed: int) -> None:
+    rnd = random.Random(random_seed)
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Category.__table__),
+            [{'description': f'category{i}'} for i in range(50)],
+        )
+        rows = (
+            {
+                'id_category': rnd.randint(1, 50),
+                'description': ' '.join([
+                    rnd.choice(WORDS),
+                    rnd.choice(BRANDS),
+                    rnd.choice(SIZES),
+                ]),
+                'price': round(rnd.uniform(1, 100), 2),
+            }
+            for _ in range(products)
+        )
+        for batch in _batches(rows):
+            conn.execute(insert(Product.__table__), batch)
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text('ANALYZE products'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='sqlite:////tmp/bench_search.db')
+    parser.add_argument('--products', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    seed(engine, args.products, args.seed)
+
+    print(f'{args.products} products')
+    with Session(engine) as session:
+        for name, (q, id_category) in QUERIES.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                search(q, session, id_category)
+                timings.append(time.perf_counter() - start)
+            print(
+                f'{name:16} median {statistics.median(timings) * 1000:7.2f} ms'
+                f'  p95 {statistics.quantiles(timings, n=20)[-1] * 1000:7.2f}'
+                ' ms'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Mede o custo de serialização por item das listagens de produtos e vendas.
+
+Compara, para o corpo de GET /products/?limit=1000 e GET /sales/?limit=100,
+o caminho do ``response_model`` (validação de novo + dict + JSON, com o
+json da biblioteca padrão e com orjson) com ``model_response``, que
+serializa o modelo montado pelo serviço direto em JSON.
+
+Uso:
+    python -m benchmarks.bench_serialization --repeat 50
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:///:memory:')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from benchmarks.bench_indexes import seed  # noqa: E402
+from benchmarks.bench_reports import UPDATE_TOTALS  # noqa: E402
+from fastapi_supermarket.core.responses import (  # noqa: E402
+    ORJSONResponse,
+    model_response,
+)
+from fastapi_supermarket.main import app  # noqa: E402
+from fastapi_supermarket.services import (  # noqa: E402
+    product_service,
+    sales_service,
+)
+from fastapi_supermarket.services.catalog_service import catalog  # noqa: E402
+
+
+def response_field(path: str):
+    """O campo clonado que o FastAPI usa para validar a resposta da rota."""
+    for route in app.routes:
+        if (
+            isinstance(route, APIRoute)
+            and route.path == path
+            and 'GET' in route.methods
+        ):
+            return route.response_field
+    raise LookupError(path)
+
+
+def via_response_model(field, content, response_class) -> bytes:
+    # serialize_response não aguarda nada: roda a corrotina sem event loop
+    coroutine = serialize_response(
+        field=field, response_content=content, exclude_none=True
+    )
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return response_class(done.value).body
+    raise RuntimeError('serialize_response awaited unexpectedly')
+
+
+def measure(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--url', default='sqlite:////tmp/bench_serialization.db'
+    )
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    seed(engine, 1_000, 5_000, 10_000, args.seed)
+    with engine.begin() as conn:
+        conn.execute(UPDATE_TOTALS)
+
+    with Session(engine) as session:
+        catalog.reset()
+        bodies = {
+            '/products/': product_service.find_all(session, 0, 1_000),
+            '/sales/': sales_service.find_all(session, 0, 100),
+        }
+
+    for path, content in bodies.items():
+        field = response_field(path)
+        items = len(
+            content.products if path == '/products/' else content.sales
+        )
+        paths = {
+            'response_model + json': lambda: via_response_model(
+                field, content, JSONResponse
+            ),
+            'response_model + orjson': lambda: via_response_model(
+                field, content, ORJSONResponse
+            ),
+            'model_response': lambda: model_response(
+                content, exclude_none=True
+            ).body,
+        }
+        print(f'\nGET {path} ({items} items)')
+        for name, fn in paths.items():
+            seconds = measure(fn, args.repeat)
+            print(
+                f'  {name:24} {seconds * 1000:8.2f} ms'
+                f'  {seconds / items * 1e6:7.2f} us/item'
+            )
+
+
+if __name__ == '__main__':
+    main()
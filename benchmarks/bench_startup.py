@@ -0,0 +1,161 @@
+"""Mede o tempo de importação e a latência das primeiras requisições.
+
+Cada medição roda em um processo novo, como depois de um deploy: importa
+``fastapi_supermarket.main`` e faz a primeira requisição de algumas rotas
+via ASGI (httpx), com e sem o aquecimento do lifespan. Mostra a mediana
+das repetições.
+
+Uso:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --url postgresql+psycopg://... --runs 9
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import nullcontext
+
+os.environ.setdefault('DATABASE_URL', 'sqlite:////tmp/bench_startup.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('ALGORITHM', 'HS256')
+os.environ.setdefault('ACCESS_TOKEN_EXPIRE_MINUTES', '30')
+
+FIRST_REQUESTS = ['POST /auth/token', 'GET /products/', 'GET /sales/']
+
+
+def child_import() -> dict:
+    start = time.perf_counter()
+    import fastapi_supermarket.main  # noqa: F401, PLC0415
+
+    return {'import': time.perf_counter() - start}
+
+
+async def first_requests(warm_up: bool) -> dict:
+    import httpx  # noqa: PLC0415
+
+    from benchmarks.bench_api import EMAIL, PASSWORD  # noqa: PLC0415
+    from fastapi_supermarket.core.readiness import readiness  # noqa: PLC0415
+    from fastapi_supermarket.main import app  # noqa: PLC0415
+
+    timings = {}
+
+    async def timed(name, client, method, url, **kwargs):
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        timings[name] = time.perf_counter() - start
+        response.raise_for_status()
+        return response
+
+    lifespan = app.router.lifespan_context(app) if warm_up else nullcontext()
+    async with lifespan:
+        if warm_up:
+            timings.update(
+                (f'warm-up {name}', seconds)
+                for name, seconds in readiness.steps.items()
+            )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url='http://bench'
+        ) as client:
+            response = await timed(
+                FIRST_REQUESTS[0],
+                client,
+                'POST',
+                '/auth/token',
+                data={'username': EMAIL, 'password': PASSWORD},
+            )
+            headers = {
+                'Authorization': f'Bearer {response.json()["access_token"]}'
+            }
+            await timed(
+                FIRST_REQUESTS[1], client, 'GET', '/products/', headers=headers
+            )
+            await timed(
+                FIRST_REQUESTS[2], client, 'GET', '/sales/', headers=headers
+            )
+    return timings
+
+
+def spawn(mode: str, runs: int) -> dict:
+    """Mediana, por etapa, de ``runs`` processos novos."""
+    samples: dict[str, list[float]] = {}
+    for _ in range(runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                '-m',
+                'benchmarks.bench_startup',
+                '--child',
+                mode,
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        for name, seconds in json.loads(output.splitlines()[-1]).items():
+            samples.setdefault(name, []).append(seconds)
+    return {
+        name: statistics.median(values) for name, values in samples.items()
+    }
+
+
+def prepare(args) -> None:
+    from sqlalchemy import create_engine  # noqa: PLC0415
+
+    from benchmarks.bench_api import prepare as prepare_api  # noqa: PLC0415
+
+    if args.url.startswith('sqlite:///') and os.path.exists(args.url[10:]):
+        os.remove(args.url[10:])
+    prepare_api(create_engine(args.url), args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default=os.environ['DATABASE_URL'])
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--sales', type=int, default=20_000)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument(
+        '--child', choices=['import', 'cold', 'warm'], help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        timings = {
+            'import': child_import,
+            'cold': lambda: asyncio.run(first_requests(warm_up=False)),
+            'warm': lambda: asyncio.run(first_requests(warm_up=True)),
+        }[args.child]()
+        print(json.dumps(timings))
+        return
+
+    os.environ['DATABASE_URL'] = args.url
+    prepare(args)
+
+    imported = spawn('import', args.runs)
+    print(
+        f'import fastapi_supermarket.main  {imported["import"] * 1000:8.1f} ms'
+    )
+    cold = spawn('cold', args.runs)
+    warm = spawn('warm', args.runs)
+    for name, seconds in warm.items():
+        if name.startswith('warm-up'):
+            print(f'{name:32} {seconds * 1000:8.1f} ms')
+    print()
+    print(f'{"first request":32} {"cold":>10} {"warm":>10}')
+    for name in FIRST_REQUESTS:
+        print(
+            f'{name:32} {cold[name] * 1000:7.1f} ms'
+            f' {warm[name] * 1000:7.1f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from fastapi_supermarket.core.database import (
+    get_async_session,
+    get_session,
+    settings,
+)
+
+T_Session = Annotated[
+    Session,
+    Depends(get_async_session if settings.DATABASE_ASYNC else get_session),
+]
@@ -0,0 +1,107 @@
+"""Gera dados sintéticos em volume (usuários, catálogo e vendas).
+
+Os IDs continuam a partir dos dados já gravados; a popularidade dos
+produtos segue a lei de Zipf e as vendas se concentram nos fins de semana,
+nos horários de pico e no fim do ano. A mesma semente gera o mesmo banco.
+
+Uso:
+    python -m fastapi_supermarket.commands.generate_data
+    python -m fastapi_supermarket.commands.generate_data \
+        --users 100000 --products 50000 --sales 2000000 --seed 7
+"""
+
+import argparse
+import time
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from fastapi_supermarket.core.database import engine
+from fastapi_supermarket.core.security import get_password_hash
+from fastapi_supermarket.factory.dataset import (
+    DatasetSpec,
+    SalesDataset,
+    bulk_insert,
+    first_ids,
+    reset_sequences,
+)
+from fastapi_supermarket.services.rollup_service import rebuild
+
+
+def _report(name: str, rows: int, seconds: float) -> None:
+    print(
+        f'{name:14} {rows:>10} rows  {seconds:7.2f} s'
+        f'  {rows / max(seconds, 1e-9):>10.0f} rows/s'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--products', type=int, default=5_000)
+    parser.add_argument('--sales', type=int, default=100_000)
+    parser.add_argument('--categories', type=int, default=50)
+    parser.add_argument(
+        '--start', type=date.fromisoformat, default=date(2024, 1, 1)
+    )
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--zipf', type=float, default=1.1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--password', default='Secret123')
+    parser.add_argument('--skip-rollup', action='store_true')
+    args = parser.parse_args()
+
+    spec = DatasetSpec(
+        users=args.users,
+        products=args.products,
+        sales=args.sales,
+        categories=args.categories,
+        start=args.start,
+        days=args.days,
+        zipf_exponent=args.zipf,
+        seed=args.seed,
+    )
+    with engine.connect() as conn:
+        ids = first_ids(conn)
+    # Um único hash: o Argon2 levaria minutos para milhares de usuários
+    dataset = SalesDataset(spec, ids, get_password_hash(args.password))
+
+    total_start = time.perf_counter()
+    total_rows = 0
+    for name, batches in [
+        ('categories', dataset.categories()),
+        ('users', dataset.users()),
+        ('products', dataset.products()),
+    ]:
+        start = time.perf_counter()
+        rows = 0
+        for batch in batches:
+            with engine.begin() as conn:
+                bulk_insert(conn, name, batch)
+            rows += len(batch)
+        _report(name, rows, time.perf_counter() - start)
+        total_rows += rows
+
+    start = time.perf_counter()
+    sales = items = 0
+    for sales_batch, items_batch in dataset.sales():
+        with engine.begin() as conn:
+            bulk_insert(conn, 'sales', sales_batch)
+            bulk_insert(conn, 'product_sales', items_batch)
+        sales += len(sales_batch)
+        items += len(items_batch)
+    _report('sales + items', sales + items, time.perf_counter() - start)
+    total_rows += sales + items
+
+    with engine.begin() as conn:
+        reset_sequences(conn)
+    _report('total', total_rows, time.perf_counter() - total_start)
+
+    if sales and not args.skip_rollup:
+        with Session(engine) as session:
+            rebuild(session)
+        print('sales rollup rebuilt')
+
+
+if __name__ == '__main__':
+    main()
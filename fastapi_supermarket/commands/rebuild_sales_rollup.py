@@ -0,0 +1,30 @@
+"""Recalcula os agregados diários de vendas a partir das vendas gravadas.
+
+Uso:
+    python -m fastapi_supermarket.commands.rebuild_sales_rollup
+    python -m fastapi_supermarket.commands.rebuild_sales_rollup \
+        --start 2025-01-01 --end 2025-01-31
+"""
+
+import argparse
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from fastapi_supermarket.core.database import engine
+from fastapi_supermarket.services.rollup_service import rebuild
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--start', type=date.fromisoformat)
+    parser.add_argument('--end', type=date.fromisoformat)
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        rebuild(session, args.start, args.end)
+    print('sales rollup rebuilt')
+
+
+if __name__ == '__main__':
+    main()
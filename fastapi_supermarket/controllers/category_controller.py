@@ -1,9 +1,12 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.core.http_cache import conditional_get
 from fastapi_supermarket.schemas.category_schema import (
     CategoryCreate,
     CategoryListResponse,
@@ -15,6 +18,8 @@ from fastapi_supermarket.services.category_service import (
     delete,
     find_all,
     find_by_id,
+    item_version,
+    list_version,
     update,
 )
 
@@ -24,24 +29,33 @@ router = APIRouter(prefix='/categories', tags=['Categories'])
 @router.post(
     '/', status_code=HTTPStatus.CREATED, response_model=CategoryResponse
 )
-def create_category(
+async def create_category(
     category: CategoryCreate, session: T_Session, current_user: T_CurrentUser
 ) -> CategoryResponse:
     """Cria uma nova categoria."""
-    return create(category, session)
+    return await run_db(create, category, session)
 
 
 @router.get(
-    '/', status_code=HTTPStatus.OK, response_model=CategoryListResponse
+    '/',
+    status_code=HTTPStatus.OK,
+    response_model=CategoryListResponse,
+    response_model_exclude_none=True,
 )
-def read_categories(
+async def read_categories(  # noqa: PLR0913, PLR0917
+    request: Request,
+    response: Response,
     session: T_Session,
     current_user: T_CurrentUser,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
 ) -> CategoryListResponse:
     """Retorna todas os categorias cadastrados."""
-    return find_all(session, skip, limit)
+    version = await run_db(list_version, session)
+    if not_modified := conditional_get(request, response, version):
+        return not_modified
+    return await run_db(find_all, session, skip, limit, cursor)
 
 
 @router.get(
@@ -49,11 +63,20 @@ def read_categories(
     status_code=HTTPStatus.OK,
     response_model=CategoryResponse,
 )
-def get_category(
-    category_id: int, session: T_Session, current_user: T_CurrentUser
+async def get_category(
+    request: Request,
+    response: Response,
+    category_id: int,
+    session: T_Session,
+    current_user: T_CurrentUser,
 ) -> CategoryResponse:
     """Retorna uma categoria por ID."""
-    return find_by_id(category_id, session)
+    version = await run_db(item_version, category_id, session)
+    if version and (
+        not_modified := conditional_get(request, response, version)
+    ):
+        return not_modified
+    return await run_db(find_by_id, category_id, session)
 
 
 @router.put(
@@ -61,19 +84,19 @@ def get_category(
     status_code=HTTPStatus.OK,
     response_model=CategoryResponse,
 )
-def update_category(
+async def update_category(
     category_id: int,
     category: CategoryUpdate,
     session: T_Session,
     current_user: T_CurrentUser,
 ) -> CategoryResponse:
     """Retorna uma categoria por ID e altera seus registros."""
-    return update(category_id, category, session)
+    return await run_db(update, category_id, category, session)
 
 
 @router.delete('/{category_id}', status_code=HTTPStatus.OK)
-def delete_category(
+async def delete_category(
     category_id: int, session: T_Session, current_user: T_CurrentUser
 ) -> dict[str, str]:
     """Retorna uma categoria por ID e remove o registro de consultas."""
-    return delete(category_id, session)
+    return await run_db(delete, category_id, session)
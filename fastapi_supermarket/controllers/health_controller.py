@@ -0,0 +1,43 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Response
+
+from fastapi_supermarket.core.readiness import readiness
+from fastapi_supermarket.core.responses import model_response
+from fastapi_supermarket.schemas.health_schema import (
+    HealthResponse,
+    ReadinessResponse,
+)
+
+router = APIRouter(prefix='/health', tags=['Health'])
+
+
+@router.get('/live', status_code=HTTPStatus.OK, response_model=HealthResponse)
+def read_liveness() -> HealthResponse:
+    """Indica que o processo está de pé (sem consultar o banco)."""
+    return HealthResponse(status='ok')
+
+
+@router.get(
+    '/ready',
+    status_code=HTTPStatus.OK,
+    response_model=ReadinessResponse,
+    responses={HTTPStatus.SERVICE_UNAVAILABLE: {'model': ReadinessResponse}},
+)
+def read_readiness() -> Response:
+    """Retorna 200 só depois do aquecimento da inicialização (lifespan)."""
+    if readiness.ready:
+        status = 'ready'
+    else:
+        status = 'retrying' if readiness.error else 'starting'
+    return model_response(
+        ReadinessResponse(
+            status=status, steps=readiness.steps, error=readiness.error
+        ),
+        status_code=(
+            HTTPStatus.OK
+            if readiness.ready
+            else HTTPStatus.SERVICE_UNAVAILABLE
+        ),
+        exclude_none=True,
+    )
@@ -0,0 +1,98 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from fastapi_supermarket.core.database import get_pool_stats
+from fastapi_supermarket.core.readiness import readiness
+from fastapi_supermarket.core.request_metrics import request_metrics
+from fastapi_supermarket.core.security import password_hasher, user_cache
+from fastapi_supermarket.services.catalog_service import catalog
+from fastapi_supermarket.services.report_service import report_cache
+
+router = APIRouter(prefix='/metrics', tags=['Metrics'])
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+_CACHE = {
+    'hits': ('counter', 'Lookups served from the cache.'),
+    'misses': ('counter', 'Lookups not found in the cache.'),
+    'size': ('gauge', 'Entries in the cache.'),
+    'maxsize': ('gauge', 'Maximum entries in the cache.'),
+}
+
+# Tipo e descrição de cada estatística interna; contadores só aumentam
+STATS = {
+    'pool': {
+        'connects': ('counter', 'Database connections opened.'),
+        'checkouts': ('counter', 'Connections taken from the pool.'),
+        'checkins': ('counter', 'Connections returned to the pool.'),
+        'invalidations': ('counter', 'Connections invalidated.'),
+        'overflow_checkouts': (
+            'counter',
+            'Checkouts served by overflow connections.',
+        ),
+        'timeouts': ('counter', 'Checkouts that timed out waiting.'),
+        'wait_seconds_total': (
+            'counter',
+            'Time spent waiting for a connection.',
+        ),
+        'wait_seconds_max': ('gauge', 'Longest wait for a connection.'),
+        'size': ('gauge', 'Configured pool size.'),
+        'checked_in': ('gauge', 'Idle connections in the pool.'),
+        'checked_out': ('gauge', 'Connections in use.'),
+        'overflow': ('gauge', 'Overflow connections open.'),
+    },
+    'user_cache': _CACHE,
+    'report_cache': _CACHE,
+    'password_hasher': {
+        'workers': ('gauge', 'Password hashing worker processes.'),
+        'queue_limit': ('gauge', 'Hashes allowed to wait for a worker.'),
+        'rejected': ('counter', 'Hashes rejected with 503 (queue full).'),
+    },
+    'catalog': {
+        'version': ('gauge', 'Catalog version, bumped on each write.'),
+        'loads': ('counter', 'Full reloads of the catalog copy.'),
+        'size': ('gauge', 'Products in the catalog copy.'),
+        'age_seconds': ('gauge', 'Age of the catalog copy.'),
+    },
+    'readiness': {
+        'ready': ('gauge', '1 once every warm-up step has finished.'),
+        'retries': ('counter', 'Retries of failed warm-up steps.'),
+    },
+}
+
+
+def _stats_lines(section: str, stats: dict[str, float]) -> list[str]:
+    """Exporta as estatísticas internas no formato do Prometheus."""
+    lines = []
+    for key, value in stats.items():
+        # As demais chaves são as durações das etapas de aquecimento
+        kind, help_text = STATS[section].get(
+            key,
+            ('gauge', f'Duration of the {key[:-8]} warm-up step.'),
+        )
+        name = f'supermarket_{section}_{key}'
+        if kind == 'counter' and not name.endswith('_total'):
+            name += '_total'
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        lines.append(f'{name} {value}')
+    return lines
+
+
+@router.get('/', status_code=HTTPStatus.OK, response_class=PlainTextResponse)
+def read_metrics() -> PlainTextResponse:
+    """Retorna as métricas da aplicação no formato texto do Prometheus."""
+    lines = request_metrics.render()
+    for section, stats in {
+        'pool': get_pool_stats(),
+        'user_cache': user_cache.stats(),
+        'password_hasher': password_hasher.stats(),
+        'report_cache': report_cache.stats(),
+        'catalog': catalog.stats(),
+        'readiness': readiness.stats(),
+    }.items():
+        lines.extend(_stats_lines(section, stats))
+    return PlainTextResponse('\n'.join(lines) + '\n', media_type=CONTENT_TYPE)
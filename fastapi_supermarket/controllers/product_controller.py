@@ -1,20 +1,33 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 
 from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.core.http_cache import conditional_get
+from fastapi_supermarket.core.pagination import MAX_PAGE_SIZE
+from fastapi_supermarket.core.responses import model_response
 from fastapi_supermarket.schemas.product_schema import (
     ProductCreate,
+    ProductImportResponse,
     ProductListResponse,
     ProductResponse,
     ProductUpdate,
 )
+from fastapi_supermarket.services.import_service import (
+    ImportFormat,
+    import_products,
+)
 from fastapi_supermarket.services.product_service import (
     create,
     delete,
     find_all,
     find_by_id,
+    item_version,
+    list_version,
+    search,
     update,
 )
 
@@ -24,22 +37,70 @@ router = APIRouter(prefix='/products', tags=['Products'])
 @router.post(
     '/', status_code=HTTPStatus.CREATED, response_model=ProductResponse
 )
-def create_product(
+async def create_product(
     product: ProductCreate, session: T_Session, current_user: T_CurrentUser
 ) -> ProductResponse:
     """Cria uma novo produto."""
-    return create(product, session)
+    return await run_db(create, product, session)
+
+
+@router.post('/import', response_model=ProductImportResponse)
+async def import_catalog(
+    request: Request,
+    session: T_Session,
+    current_user: T_CurrentUser,
+    import_format: ImportFormat = Query(default='csv', alias='format'),
+) -> ProductImportResponse:
+    """Cria ou atualiza (pelo SKU) produtos a partir de um CSV ou NDJSON.
 
+    O arquivo vai no corpo da requisição e é lido à medida que chega; as
+    colunas são sku, category (descrição da categoria), description e price.
+    """
+    return await import_products(request.stream(), import_format, session)
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=ProductListResponse)
-def read_products(
+
+@router.get(
+    '/',
+    status_code=HTTPStatus.OK,
+    response_model=ProductListResponse,
+    response_model_exclude_none=True,
+)
+async def read_products(  # noqa: PLR0913, PLR0917
+    request: Request,
+    response: Response,
     session: T_Session,
     current_user: T_CurrentUser,
     skip: int = 0,
     limit: int = 10,
-) -> ProductListResponse:
+    cursor: Optional[str] = None,
+) -> Response:
     """Retorna todos os produtos cadastrados."""
-    return find_all(session, skip=skip, limit=limit)
+    version = await run_db(list_version, session)
+    if not_modified := conditional_get(request, response, version):
+        return not_modified
+    products = await run_db(
+        find_all, session, skip=skip, limit=limit, cursor=cursor
+    )
+    return model_response(products, response, exclude_none=True)
+
+
+# Declarada antes de /{product_id} para não ser tratada como um ID
+@router.get(
+    '/search',
+    status_code=HTTPStatus.OK,
+    response_model=ProductListResponse,
+    response_model_exclude_none=True,
+)
+async def search_products(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    q: str = Query(min_length=1, max_length=100),
+    id_category: Optional[int] = None,
+    limit: int = Query(default=20, gt=0, le=MAX_PAGE_SIZE),
+) -> Response:
+    """Busca produtos pela descrição, dos mais relevantes aos menos."""
+    products = await run_db(search, q, session, id_category, limit)
+    return model_response(products, exclude_none=True)
 
 
 @router.get(
@@ -47,31 +108,39 @@ def read_products(
     status_code=HTTPStatus.OK,
     response_model=ProductResponse,
 )
-def get_product(
+async def get_product(
+    request: Request,
+    response: Response,
     product_id: int,
     session: T_Session,
     current_user: T_CurrentUser,
-) -> ProductResponse:
+) -> Response:
     """Retorna um produto por ID."""
-    return find_by_id(product_id, session)
+    version = await run_db(item_version, product_id, session)
+    if version and (
+        not_modified := conditional_get(request, response, version)
+    ):
+        return not_modified
+    product = await run_db(find_by_id, product_id, session)
+    return model_response(product, response)
 
 
 @router.put(
     '/{product_id}', status_code=HTTPStatus.OK, response_model=ProductResponse
 )
-def update_product(
+async def update_product(
     product_id: int,
     product: ProductUpdate,
     session: T_Session,
     current_user: T_CurrentUser,
 ) -> ProductResponse:
     """Retorna um produto por ID e altera seus registros."""
-    return update(product_id, product, session)
+    return await run_db(update, product_id, product, session)
 
 
 @router.delete('/{product_id}', status_code=HTTPStatus.OK)
-def delete_product(
+async def delete_product(
     product_id: int, session: T_Session, current_user: T_CurrentUser
 ) -> dict[str, str]:
     """Retorna um produto por ID e remove o registro de consultas."""
-    return delete(product_id, session)
+    return await run_db(delete, product_id, session)
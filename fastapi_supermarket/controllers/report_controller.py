@@ -0,0 +1,98 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request, Response
+
+from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db, settings
+from fastapi_supermarket.core.http_cache import cached_json
+from fastapi_supermarket.schemas.product_schema import ProductPublic
+from fastapi_supermarket.schemas.report_schema import (
+    CategoryRevenue,
+    MonthlyAverage,
+    ReportPeriod,
+    SalesSummary,
+)
+from fastapi_supermarket.schemas.user_schema import UserResponse
+from fastapi_supermarket.services import analytics_service, sales_service
+from fastapi_supermarket.services.report_service import (
+    cached_report,
+    is_closed,
+)
+
+router = APIRouter(prefix='/reports', tags=['Reports'])
+
+reports = (
+    analytics_service if settings.REPORTS_BACKEND == 'numpy' else sales_service
+)
+
+T_Period = Annotated[ReportPeriod, Query()]
+
+# Períodos que incluem hoje precisam ser revalidados a cada consulta
+OPEN_CACHE_CONTROL = 'private, no-cache'
+
+
+def _cache_control(period: ReportPeriod) -> str:
+    if is_closed(period):
+        return f'private, max-age={settings.REPORT_CACHE_TTL_SECONDS}'
+    return OPEN_CACHE_CONTROL
+
+
+async def _report(request, report, period, session) -> Response:
+    result = await run_db(cached_report, report, period, session)
+    return cached_json(request, result, _cache_control(period))
+
+
+@router.get('/summary', response_model=SalesSummary)
+async def sales_summary(
+    request: Request,
+    period: T_Period,
+    session: T_Session,
+    current_user: T_CurrentUser,
+) -> Response:
+    """Retorna o total vendido no período."""
+    return await _report(request, reports.get_sales_summary, period, session)
+
+
+@router.get('/top-product', response_model=ProductPublic)
+async def top_product(
+    request: Request,
+    period: T_Period,
+    session: T_Session,
+    current_user: T_CurrentUser,
+) -> Response:
+    """Retorna o produto com mais unidades vendidas no período."""
+    return await _report(request, reports.get_top_product, period, session)
+
+
+@router.get('/top-customer', response_model=UserResponse)
+async def top_customer(
+    request: Request,
+    period: T_Period,
+    session: T_Session,
+    current_user: T_CurrentUser,
+) -> Response:
+    """Retorna o cliente com mais compras no período."""
+    return await _report(request, reports.get_top_customer, period, session)
+
+
+@router.get('/revenue-by-category', response_model=list[CategoryRevenue])
+async def revenue_by_category(
+    request: Request,
+    period: T_Period,
+    session: T_Session,
+    current_user: T_CurrentUser,
+) -> Response:
+    """Retorna a receita de cada categoria no período."""
+    return await _report(
+        request, reports.get_revenue_by_category, period, session
+    )
+
+
+@router.get('/monthly-average', response_model=list[MonthlyAverage])
+async def monthly_average(
+    request: Request, session: T_Session, current_user: T_CurrentUser
+) -> Response:
+    """Retorna o valor médio das vendas de cada mês."""
+    result = await run_db(reports.get_monthly_average, session)
+    return cached_json(request, result, OPEN_CACHE_CONTROL)
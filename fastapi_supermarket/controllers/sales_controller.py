@@ -1,14 +1,30 @@
-from fastapi import APIRouter
+from http import HTTPStatus
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import StreamingResponse
 
 from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.core.pagination import MAX_PAGE_SIZE
+from fastapi_supermarket.core.responses import model_response
 from fastapi_supermarket.schemas.sales_schema import (
+    SalesBatchItem,
+    SalesBatchResponse,
     SalesCreate,
+    SalesExport,
     SalesListResponse,
     SalesResponse,
 )
+from fastapi_supermarket.services.export_service import (
+    MEDIA_TYPES,
+    export_sales,
+)
 from fastapi_supermarket.services.sales_service import (
     create,
+    create_batch,
+    delete,
     find_all,
     find_by_id,
 )
@@ -17,24 +33,71 @@ router = APIRouter(prefix='/sales', tags=['Sales'])
 
 
 @router.post('/', response_model=SalesResponse)
-def create_sale(
+async def create_sale(
     sale: SalesCreate, session: T_Session, current_user: T_CurrentUser
 ) -> SalesResponse:
     """Cria uma nova venda."""
-    return create(sale, session)
+    return await run_db(create, sale, session)
+
 
+@router.post('/batch', response_model=SalesBatchResponse)
+async def create_sales_batch(
+    sales: list[SalesBatchItem],
+    session: T_Session,
+    current_user: T_CurrentUser,
+) -> SalesBatchResponse:
+    """Cria vendas em lote, ignorando chaves já enviadas."""
+    return await run_db(create_batch, sales, session)
+
+
+@router.get(
+    '/', response_model=SalesListResponse, response_model_exclude_none=True
+)
+async def get_all_sales(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    skip: int = 0,
+    limit: int = Query(default=10, gt=0, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> Response:
+    """Retorna as vendas cadastradas, paginadas."""
+    sales = await run_db(find_all, session, skip, limit, cursor)
+    return model_response(sales, exclude_none=True)
 
-@router.get('/', response_model=SalesListResponse)
-def get_all_sales(
-    session: T_Session, current_user: T_CurrentUser
-) -> SalesListResponse:
-    """Retorna todas as vendas cadastradas."""
-    return find_all(session)
+
+# Declarada antes de /{sale_id} para não ser tratada como um ID
+@router.get('/export', response_class=StreamingResponse)
+async def export_all_sales(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    export: Annotated[SalesExport, Query()],
+) -> StreamingResponse:
+    """Exporta as vendas em blocos, sem carregar tudo em memória."""
+    return StreamingResponse(
+        export_sales(
+            export.export_format, export.from_date, export.to_date, session
+        ),
+        media_type=MEDIA_TYPES[export.export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="sales.{export.export_format}"'
+            )
+        },
+    )
 
 
 @router.get('/{sale_id}', response_model=SalesResponse)
-def get_sale(
+async def get_sale(
     sale_id: int, session: T_Session, current_user: T_CurrentUser
-) -> SalesResponse:
+) -> Response:
     """Retorna uma venda por ID."""
-    return find_by_id(sale_id, session)
+    sale = await run_db(find_by_id, sale_id, session)
+    return model_response(sale)
+
+
+@router.delete('/{sale_id}', status_code=HTTPStatus.OK)
+async def delete_sale(
+    sale_id: int, session: T_Session, current_user: T_CurrentUser
+) -> dict[str, str]:
+    """Remove uma venda e desconta seus valores dos relatórios."""
+    return await run_db(delete, sale_id, session)
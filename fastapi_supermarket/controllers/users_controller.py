@@ -1,9 +1,11 @@
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import APIRouter
 
 from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
 from fastapi_supermarket.schemas.user_schema import (
     UserCreate,
     UserListResponse,
@@ -22,26 +24,32 @@ router = APIRouter(prefix='/users', tags=['Users'])
 
 
 @router.post('/', status_code=HTTPStatus.CREATED, response_model=UserResponse)
-def create_user(user: UserCreate, session: T_Session) -> UserResponse:
+async def create_user(user: UserCreate, session: T_Session) -> UserResponse:
     """Cria uma novo usuário."""
-    return create(user, session)
+    return await run_db(create, user, session)
 
 
-@router.get('/', status_code=HTTPStatus.OK, response_model=UserListResponse)
-def read_users(
+@router.get(
+    '/',
+    status_code=HTTPStatus.OK,
+    response_model=UserListResponse,
+    response_model_exclude_none=True,
+)
+async def read_users(
     session: T_Session,
     current_user: T_CurrentUser,
     skip: int = 0,
     limit: int = 10,
+    cursor: Optional[str] = None,
 ) -> UserListResponse:
     """Retorna todos os usuários cadastrados."""
-    return find_all(session, skip, limit)
+    return await run_db(find_all, session, skip, limit, cursor)
 
 
 @router.get(
     '/{user_id}', status_code=HTTPStatus.OK, response_model=UserResponse
 )
-def get_user(
+async def get_user(
     user_id: int,
     current_user: T_CurrentUser,
 ) -> UserResponse:
@@ -52,21 +60,21 @@ def get_user(
 @router.put(
     '/{user_id}', status_code=HTTPStatus.OK, response_model=UserResponse
 )
-def update_user(
+async def update_user(
     user_id: int,
     user: UserUpdate,
     session: T_Session,
     current_user: T_CurrentUser,
 ) -> UserResponse:
     """Retorna um usuário por ID e altera seus registros."""
-    return update(user_id, user, session, current_user)
+    return await run_db(update, user_id, user, session, current_user)
 
 
 @router.delete('/{user_id}', status_code=HTTPStatus.OK)
-def delete_user(
+async def delete_user(
     user_id: int,
     session: T_Session,
     current_user: T_CurrentUser,
 ) -> dict[str, str]:
     """Retorna um usuário por ID e remove o registro de consultas."""
-    return delete(user_id, session, current_user)
+    return await run_db(delete, user_id, session, current_user)
@@ -1,11 +1,112 @@
-from sqlalchemy import create_engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
 
-from fastapi_supermarket.core.settings import Settings
+from fastapi_supermarket.core.db_diagnostics import DBDiagnostics
+from fastapi_supermarket.core.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_metrics,
+)
+from fastapi_supermarket.core.request_metrics import request_metrics
+from fastapi_supermarket.core.settings import get_settings
 
-engine = create_engine(Settings().DATABASE_URL)
+settings = get_settings()
+
+
+def engine_options(url: str, poolclass) -> dict:
+    options = {
+        'pool_pre_ping': settings.DATABASE_POOL_PRE_PING,
+        'pool_recycle': settings.DATABASE_POOL_RECYCLE,
+    }
+    # O SQLite usa pools próprios, sem limite de tamanho ou overflow
+    if make_url(url).get_backend_name() != 'sqlite':
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.DATABASE_POOL_SIZE,
+            max_overflow=settings.DATABASE_MAX_OVERFLOW,
+            pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        )
+    return options
+
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **engine_options(settings.DATABASE_URL, InstrumentedQueuePool),
+)
+async_engine = None
+if settings.DATABASE_ASYNC:
+    async_url = settings.ASYNC_DATABASE_URL or settings.DATABASE_URL
+    async_engine = create_async_engine(
+        async_url, **engine_options(async_url, InstrumentedAsyncQueuePool)
+    )
+    pool_metrics.instrument(async_engine.sync_engine)
+    request_metrics.instrument(async_engine.sync_engine)
+else:
+    pool_metrics.instrument(engine)
+    request_metrics.instrument(engine)
+
+if settings.DB_DIAGNOSTICS:
+    request_metrics.diagnostics = DBDiagnostics(
+        slow_query_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+        n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+    )
+
+
+def get_pool_stats() -> dict[str, float]:
+    pool = async_engine.pool if async_engine else engine.pool
+    return pool_metrics.stats(pool)
 
 
 def get_session():  # pragma: no cover
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():  # pragma: no cover
+    async with AsyncSession(async_engine) as session:
+        # Os serviços usam a API síncrona; o I/O segue assíncrono via greenlet
+        yield session.sync_session
+
+
+async def run_db(fn, *args, **kwargs):
+    """Executa um serviço síncrono sem bloquear o event loop.
+
+    No modo assíncrono o serviço roda em um greenlet sobre o AsyncSession;
+    no modo síncrono, no threadpool do FastAPI.
+    """
+    if settings.DATABASE_ASYNC:
+        return await greenlet_spawn(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, *args, **kwargs)
+
+
+async def run_with_session(fn, *args):
+    """Executa um serviço fora de uma requisição, com uma sessão própria."""
+    if async_engine is not None:
+        async with AsyncSession(async_engine) as session:
+            return await greenlet_spawn(fn, session.sync_session, *args)
+    with Session(engine) as session:
+        return await run_in_threadpool(fn, session, *args)
+
+
+async def warm_up_pool(connections: int) -> None:
+    """Abre conexões do pool antes da primeira requisição.
+
+    Todas são abertas ao mesmo tempo e devolvidas ao pool em seguida, onde
+    ficam ociosas (até DATABASE_POOL_SIZE) para as próximas requisições.
+    """
+    connections = min(connections, settings.DATABASE_POOL_SIZE)
+    if async_engine is not None:
+        opened = [await async_engine.connect() for _ in range(connections)]
+        for conn in opened:
+            await conn.close()
+        return
+
+    def open_connections():
+        opened = [engine.connect() for _ in range(connections)]
+        for conn in opened:
+            conn.close()
+
+    await run_in_threadpool(open_connections)
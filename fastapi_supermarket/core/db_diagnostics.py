@@ -0,0 +1,68 @@
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Tamanho máximo dos parâmetros no log (cargas em lote têm milhares)
+MAX_PARAMETERS_LENGTH = 500
+
+
+def _route(scope: dict) -> str:
+    route = scope.get('route')
+    return getattr(route, 'path', scope.get('path', ''))
+
+
+class QueryTrace:
+    """Consultas de uma requisição, para o log de lentas e de N+1."""
+
+    def __init__(self, diagnostics: 'DBDiagnostics', scope: dict):
+        self.diagnostics = diagnostics
+        self.scope = scope
+        # Consultas com o mesmo SQL diferem só nos parâmetros
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, parameters, seconds: float) -> None:
+        self.shapes[statement] += 1
+        if seconds * 1000 >= self.diagnostics.slow_query_ms:
+            logger.warning(
+                'Slow query (%.1f ms) on %s %s: %s parameters=%.*r',
+                seconds * 1000,
+                self.scope['method'],
+                _route(self.scope),
+                statement,
+                MAX_PARAMETERS_LENGTH,
+                parameters,
+            )
+
+    def repeated(self) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.shapes.most_common()
+            if count >= self.diagnostics.n_plus_one_threshold
+        ]
+
+    def finish(self) -> None:
+        for statement, count in self.repeated():
+            logger.warning(
+                'Possible N+1 on %s %s: %d executions of %s',
+                self.scope['method'],
+                _route(self.scope),
+                count,
+                statement,
+            )
+
+
+class DBDiagnostics:
+    """Modo de diagnóstico do banco (opcional, ver DB_DIAGNOSTICS).
+
+    Registra as consultas mais lentas que ``slow_query_ms`` e as que se
+    repetem ``n_plus_one_threshold`` vezes ou mais na mesma requisição;
+    as respostas ganham os cabeçalhos X-DB-Queries e X-DB-Time.
+    """
+
+    def __init__(self, slow_query_ms: float, n_plus_one_threshold: int):
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    def trace(self, scope: dict) -> QueryTrace:
+        return QueryTrace(self, scope)
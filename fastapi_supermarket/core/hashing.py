@@ -0,0 +1,108 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from multiprocessing import get_context
+from typing import Optional
+
+from fastapi import HTTPException
+from pwdlib import PasswordHash
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+pwd_context = PasswordHash.recommended()
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _ready() -> bool:
+    # Só de carregar este módulo o worker já importa o pwdlib/Argon2
+    return True
+
+
+class PasswordHasher:
+    """Executa o hash de senhas (Argon2) em um pool de processos limitado.
+
+    Quando todos os workers estão ocupados e a fila está cheia, recusa a
+    requisição com 503 em vez de ocupar mais threads do servidor.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=get_context('spawn')
+                )
+            return self._executor
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail='Server busy, try again later.',
+                headers={'Retry-After': '1'},
+            )
+        try:
+            future = self._get_executor().submit(fn, *args)
+            # No modo assíncrono aguarda sem bloquear o event loop
+            if in_greenlet():
+                return await_only(asyncio.wrap_future(future))
+            return future.result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(_verify, plain_password, hashed_password)
+
+    def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        return self._run(_verify_and_update, plain_password, hashed_password)
+
+    def warm_up(self) -> None:
+        """Inicia os workers antes do primeiro hash, fora das requisições."""
+        if not self.workers:
+            return
+        executor = self._get_executor()
+        for future in [executor.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'workers': self.workers,
+            'queue_limit': self.queue_limit,
+            'rejected': self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,90 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def etag_for(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def weak_etag(*parts) -> str:
+    """ETag fraco a partir de uma versão (datas, contagens, parâmetros)."""
+    return f'W/"{hashlib.sha256(repr(parts).encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Compara com If-None-Match usando a comparação fraca (RFC 9110)."""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return '*' in tags or etag.removeprefix('W/') in tags
+
+
+def cached_json(request: Request, content, cache_control: str) -> Response:
+    """Resposta JSON com ETag; devolve 304 se o cliente já tem a versão."""
+    body = JSONResponse(jsonable_encoder(content)).body
+    headers = {'ETag': etag_for(body), 'Cache-Control': cache_control}
+
+    if etag_matches(request, headers['ETag']):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+def _last_modified(version: tuple) -> Optional[datetime]:
+    # As datas do banco são gravadas em UTC, sem fuso
+    dates = [part for part in version if isinstance(part, datetime)]
+    if not dates:
+        return None
+    return max(dates).replace(tzinfo=UTC, microsecond=0)
+
+
+def _not_modified_since(request: Request, last_modified: datetime) -> bool:
+    if_modified_since = request.headers.get('if-modified-since')
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified <= since
+
+
+def conditional_get(
+    request: Request, response: Response, version: tuple
+) -> Optional[Response]:
+    """Valida If-None-Match / If-Modified-Since contra a versão do recurso.
+
+    Retorna um 304 quando o cliente já tem a versão atual; caso contrário
+    grava ETag e Last-Modified em ``response`` e retorna None, para que a
+    rota monte o corpo normalmente. Os parâmetros da URL (paginação)
+    entram no ETag.
+    """
+    headers = {
+        'ETag': weak_etag(
+            *version, sorted(request.query_params.multi_items())
+        ),
+        'Cache-Control': 'private, no-cache',
+    }
+    last_modified = _last_modified(version)
+    if last_modified:
+        headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+
+    # If-Modified-Since só vale quando não há If-None-Match (RFC 9110)
+    if 'if-none-match' in request.headers:
+        not_modified = etag_matches(request, headers['ETag'])
+    else:
+        not_modified = bool(last_modified) and _not_modified_since(
+            request, last_modified
+        )
+    if not_modified:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
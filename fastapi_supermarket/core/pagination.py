@@ -0,0 +1,66 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from bisect import bisect_right
+from http import HTTPStatus
+from typing import Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Select
+
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(last_id: int) -> str:
+    payload = json.dumps({'id': last_id}, separators=(',', ':'))
+    return urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        payload = json.loads(urlsafe_b64decode(cursor + padding))
+        last_id = payload['id']
+    except (BinasciiError, ValueError, TypeError, KeyError):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor.'
+        )
+
+    if not isinstance(last_id, int):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid cursor.'
+        )
+    return last_id
+
+
+def paginate(
+    query: Select,
+    column,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Select:
+    """Aplica paginação por cursor (keyset) ou, sem cursor, por offset."""
+    query = query.order_by(column).limit(limit)
+    if cursor:
+        return query.where(column > decode_cursor(cursor))
+    return query.offset(skip)
+
+
+def paginate_ids(
+    ids: Sequence[int],
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Sequence[int]:
+    """Mesma paginação de ``paginate`` sobre uma lista ordenada de IDs."""
+    if cursor:
+        start = bisect_right(ids, decode_cursor(cursor))
+        return ids[start : start + limit]
+    return ids[skip : skip + limit]
+
+
+def next_cursor(ids: list[int], limit: int) -> Optional[str]:
+    if not ids or len(ids) < limit:
+        return None
+    return encode_cursor(ids[-1])
@@ -0,0 +1,80 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Espera entre as tentativas de uma etapa que falhou, dobrando até o máximo
+RETRY_DELAY_SECONDS = 1.0
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+class Readiness:
+    """Aquecimento da aplicação e estado exposto em /health/ready.
+
+    As etapas rodam na inicialização (lifespan); a aplicação só se declara
+    pronta depois que todas terminam sem erro. Uma etapa que falha (banco
+    fora do ar durante o deploy, por exemplo) é repetida em segundo plano,
+    com espera crescente, a partir de onde parou.
+    """
+
+    def __init__(self):
+        self.retry_delay = RETRY_DELAY_SECONDS
+        self.max_retry_delay = MAX_RETRY_DELAY_SECONDS
+        self._retry_task: Optional[asyncio.Task] = None
+        self.reset()
+
+    def reset(self) -> None:
+        if self._retry_task is not None:
+            self._retry_task.cancel()
+            self._retry_task = None
+        self.ready = False
+        self.error: Optional[str] = None
+        self.steps: dict[str, float] = {}
+        self.retries = 0
+
+    async def _run_steps(self, steps: dict[str, Callable]) -> bool:
+        for name, step in steps.items():
+            if name in self.steps:
+                continue
+            start = time.perf_counter()
+            try:
+                result = step()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                # Sem derrubar o processo: o orquestrador vê o 503 e não
+                # envia tráfego para esta instância enquanto ela tenta de novo
+                logger.exception('Warm-up step %s failed', name)
+                self.error = f'{name}: {exc}'
+                return False
+            self.steps[name] = round(time.perf_counter() - start, 4)
+        self.error = None
+        self.ready = True
+        return True
+
+    async def _retry(self, steps: dict[str, Callable]) -> None:
+        delay = self.retry_delay
+        while True:
+            await asyncio.sleep(delay)
+            self.retries += 1
+            if await self._run_steps(steps):
+                return
+            delay = min(delay * 2, self.max_retry_delay)
+
+    async def run(self, steps: dict[str, Callable]) -> None:
+        self.reset()
+        if not await self._run_steps(steps):
+            self._retry_task = asyncio.create_task(self._retry(steps))
+
+    def stats(self) -> dict[str, float]:
+        return {
+            'ready': int(self.ready),
+            'retries': self.retries,
+            **{f'{name}_seconds': value for name, value in self.steps.items()},
+        }
+
+
+readiness = Readiness()
@@ -0,0 +1,268 @@
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+from fastapi_supermarket.core.db_diagnostics import DBDiagnostics, QueryTrace
+
+# Limites (inclusivos) dos buckets, como no cliente oficial do Prometheus
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+
+@dataclass
+class RequestStats:
+    """Consultas feitas ao banco durante uma requisição."""
+
+    statements: int = 0
+    db_seconds: float = 0.0
+    # Só existe com o modo de diagnóstico ligado
+    trace: Optional[QueryTrace] = None
+
+
+# Definida pelo middleware; o threadpool e os greenlets do SQLAlchemy
+# herdam o contexto, então os eventos do engine enxergam o mesmo objeto
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    'request_stats', default=None
+)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        samples = []
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            total += count
+            samples.append((str(bound), total))
+        return samples
+
+
+def _labels(**labels) -> str:
+    def escape(value) -> str:
+        return (
+            str(value)
+            .replace('\\', r'\\')
+            .replace('"', r'\"')
+            .replace('\n', r'\n')
+        )
+
+    return ','.join(
+        f'{key}="{escape(value)}"' for key, value in labels.items()
+    )
+
+
+class RequestMetrics:
+    """Latência, tamanho das respostas e consultas ao banco por rota."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.diagnostics: Optional[DBDiagnostics] = None
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.in_flight = 0
+            self.latency: dict[tuple, Histogram] = {}
+            self.size: dict[tuple, Histogram] = {}
+            self.db_statements: dict[tuple, int] = {}
+            self.db_seconds: dict[tuple, float] = {}
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(  # noqa: PLR0913, PLR0917
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        size: int,
+        stats: RequestStats,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            self.in_flight -= 1
+            latency = self.latency.get((*key, status))
+            if latency is None:
+                latency = self.latency[(*key, status)] = Histogram(
+                    LATENCY_BUCKETS
+                )
+            latency.observe(seconds)
+            response_size = self.size.get(key)
+            if response_size is None:
+                response_size = self.size[key] = Histogram(SIZE_BUCKETS)
+            response_size.observe(size)
+            self.db_statements[key] = (
+                self.db_statements.get(key, 0) + stats.statements
+            )
+            self.db_seconds[key] = (
+                self.db_seconds.get(key, 0.0) + stats.db_seconds
+            )
+
+    def instrument(self, engine: Engine) -> None:  # noqa: PLR6301
+        @event.listens_for(engine, 'before_cursor_execute')
+        def before_cursor_execute(conn, cursor, statement, *args):
+            conn.info['statement_start'] = time.perf_counter()
+
+        @event.listens_for(engine, 'after_cursor_execute')
+        def after_cursor_execute(conn, cursor, statement, parameters, *args):
+            stats = request_stats.get()
+            if stats is None:
+                return
+            seconds = time.perf_counter() - conn.info.pop('statement_start')
+            stats.statements += 1
+            stats.db_seconds += seconds
+            if stats.trace is not None:
+                stats.trace.record(statement, parameters, seconds)
+
+    def render(self) -> list[str]:
+        """Linhas no formato texto do Prometheus."""
+        with self._lock:
+            lines = [
+                '# HELP http_requests_in_flight Requests being served.',
+                '# TYPE http_requests_in_flight gauge',
+                f'http_requests_in_flight {self.in_flight}',
+            ]
+            lines.extend(
+                self._histogram(
+                    'http_request_duration_seconds',
+                    'Request latency by route.',
+                    {
+                        _labels(method=method, route=route, status=status): (
+                            histogram
+                        )
+                        for (method, route, status), histogram in sorted(
+                            self.latency.items()
+                        )
+                    },
+                )
+            )
+            lines.extend(
+                self._histogram(
+                    'http_response_size_bytes',
+                    'Response body size by route.',
+                    {
+                        _labels(method=method, route=route): histogram
+                        for (method, route), histogram in sorted(
+                            self.size.items()
+                        )
+                    },
+                )
+            )
+            for name, help_text, values in [
+                (
+                    'http_request_db_statements_total',
+                    'SQL statements issued by route.',
+                    self.db_statements,
+                ),
+                (
+                    'http_request_db_seconds_total',
+                    'Time spent in SQL statements by route.',
+                    self.db_seconds,
+                ),
+            ]:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} counter')
+                lines.extend(
+                    f'{name}{{{_labels(method=method, route=route)}}} {value}'
+                    for (method, route), value in sorted(values.items())
+                )
+            return lines
+
+    @staticmethod
+    def _histogram(
+        name: str, help_text: str, histograms: dict[str, Histogram]
+    ) -> list[str]:
+        lines = [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+        for labels, histogram in histograms.items():
+            lines.extend(
+                f'{name}_bucket{{{labels},le="{bound}"}} {count}'
+                for bound, count in histogram.cumulative()
+            )
+            lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    """Middleware ASGI puro que alimenta ``request_metrics``.
+
+    Não usa BaseHTTPMiddleware, que envolve cada resposta em uma task e
+    em um stream a mais; aqui só a mensagem de ``send`` é observada.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+        size = 0
+        stats = RequestStats()
+        if request_metrics.diagnostics is not None:
+            stats.trace = request_metrics.diagnostics.trace(scope)
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                if stats.trace is not None:
+                    # Consultas feitas até o início da resposta
+                    message['headers'] = [
+                        *message.get('headers', []),
+                        (b'x-db-queries', str(stats.statements).encode()),
+                        (
+                            b'x-db-time',
+                            f'{stats.db_seconds * 1000:.3f}'.encode(),
+                        ),
+                    ]
+            elif message['type'] == 'http.response.body':
+                size += len(message.get('body', b''))
+            await send(message)
+
+        token = request_stats.set(stats)
+        request_metrics.started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # O roteador grava a rota encontrada no próprio scope
+            route = getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)
+            request_metrics.finished(
+                scope['method'],
+                route,
+                int(status),
+                time.perf_counter() - start,
+                size,
+                stats,
+            )
+            if stats.trace is not None:
+                stats.trace.finish()
+            request_stats.reset(token)
@@ -0,0 +1,37 @@
+from http import HTTPStatus
+from typing import Optional
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+__all__ = ['ORJSONResponse', 'model_response']
+
+
+def model_response(
+    content: BaseModel,
+    response: Optional[Response] = None,
+    status_code: int = HTTPStatus.OK,
+    exclude_none: bool = False,
+) -> Response:
+    """Serializa um modelo já montado pelo serviço direto para JSON.
+
+    Devolver um ``Response`` pula o ``response_model`` da rota, que
+    validaria o modelo de novo e o converteria em dict antes do JSON; o
+    ``response_model`` continua declarado apenas para o OpenAPI. Os
+    cabeçalhos gravados em ``response`` (ETag, Last-Modified) são mantidos.
+
+    Por isso os serviços montam ``content`` com ``model_construct`` a
+    partir de linhas do banco, cujas colunas já têm os tipos do schema:
+    nenhum campo é validado, nem aqui nem na montagem.
+    """
+    fast_response = Response(
+        content.__pydantic_serializer__.to_json(
+            content, exclude_none=exclude_none
+        ),
+        status_code=status_code,
+        media_type='application/json',
+    )
+    if response is not None:
+        fast_response.headers.update(response.headers)
+    return fast_response
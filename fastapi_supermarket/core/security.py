@@ -1,32 +1,57 @@
 from datetime import datetime, timedelta
 from http import HTTPStatus
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import decode, encode
 from jwt.exceptions import DecodeError, ExpiredSignatureError
-from pwdlib import PasswordHash
 from sqlalchemy import select
+from sqlalchemy.orm import make_transient_to_detached
 
 from fastapi_supermarket.annotaded.t_session import T_Session
-from fastapi_supermarket.core.settings import Settings
+from fastapi_supermarket.core.cache import TTLCache
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.core.hashing import PasswordHasher
+from fastapi_supermarket.core.settings import get_settings
 from fastapi_supermarket.models import User
 
-settings = Settings()
+settings = get_settings()
 
-pwd_context = PasswordHash.recommended()
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='auth/token')
+# Hash fixo, com os parâmetros atuais, verificado quando o e-mail não
+# existe: a resposta leva o mesmo tempo e não revela os e-mails cadastrados
+DUMMY_PASSWORD_HASH = (
+    '$argon2id$v=19$m=65536,t=3,p=4$DoyyavSOd+IFg8pv91Vxxg'
+    '$qwf4bxbKkmhmeTYQPqudIJ3IEQm2xZnEqMhQsGF6bkI'
+)
+
+# Usuários autenticados por e-mail (subject do token)
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
 
 
 def get_password_hash(password: str) -> str:  # pragma: no cover
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def verify_password(
     plain_password: str, hashed_password: str
 ) -> bool:  # pragma: no cover
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:  # pragma: no cover
+    """Valida a senha e devolve um novo hash se os parâmetros mudaram."""
+    return password_hasher.verify_and_update(plain_password, hashed_password)
 
 
 def create_access_token(data_payload: dict) -> str:
@@ -41,7 +66,41 @@ def create_access_token(data_payload: dict) -> str:
     return encoded_jwt
 
 
-def get_current_user(
+def _cache_user(user: User) -> None:
+    user_cache.set(
+        user.email,
+        {
+            attr.key: getattr(user, attr.key)
+            for attr in User.__mapper__.column_attrs
+        },
+    )
+
+
+def _cached_user(subject_email: str, session: T_Session):
+    values = user_cache.get(subject_email)
+    if values is None:
+        return None
+
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in values.items():
+        setattr(user, key, value)
+    make_transient_to_detached(user)
+    # Anexa à sessão da requisição sem emitir SELECT
+    return session.merge(user, load=False)
+
+
+def _find_user(subject_email: str, session: T_Session):
+    user_db = session.scalar(
+        select(User).where(
+            User.deleted_at.is_(None) & (User.email == subject_email)
+        )
+    )
+    if user_db:
+        _cache_user(user_db)
+    return user_db
+
+
+async def get_current_user(
     session: T_Session,
     token: str = Depends(oauth2_scheme),
 ):
@@ -63,12 +122,11 @@ def get_current_user(
     except DecodeError:
         raise credentials_exception
 
-    user_db = session.scalar(
-        select(User).where(
-            User.deleted_at.is_(None) & (User.email == subject_email)
-        )
-    )
+    user_db = _cached_user(subject_email, session)
+    if user_db:
+        return user_db
 
+    user_db = await run_db(_find_user, subject_email, session)
     if not user_db:
         raise credentials_exception
 
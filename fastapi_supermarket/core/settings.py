@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +9,42 @@ class Settings(BaseSettings):  # pragma: no cover
         env_file='.env', env_file_encoding='utf-8'
     )
     DATABASE_URL: str
+    # Modo assíncrono: AsyncEngine com psycopg (async) ou aiosqlite
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 1024
+    # Hash de senhas em processos separados (0 executa na própria thread)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 8
+    # Relatórios de períodos encerrados ficam em cache até alguma venda
+    # do período mudar
+    REPORT_CACHE_TTL_SECONDS: int = 300
+    REPORT_CACHE_MAX_SIZE: int = 256
+    # 'numpy' calcula os relatórios em memória (extra analytics)
+    REPORTS_BACKEND: Literal['sql', 'numpy'] = 'sql'
+    # Tempo máximo para um processo enxergar escritas no catálogo feitas
+    # por outro (0 desativa a cópia em memória: leituras vão ao banco)
+    CATALOG_MAX_STALENESS_SECONDS: float = 30
+    # Diagnóstico do banco: log de consultas lentas e de N+1, e cabeçalhos
+    # X-DB-Queries / X-DB-Time nas respostas. Não deixar ligado em produção
+    DB_DIAGNOSTICS: bool = False
+    SLOW_QUERY_THRESHOLD_MS: float = 100
+    N_PLUS_ONE_THRESHOLD: int = 5
+    # Conexões abertas no pool antes de a aplicação se declarar pronta
+    # (limitado por DATABASE_POOL_SIZE)
+    WARMUP_POOL_CONNECTIONS: int = 2
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Instância única: o .env é lido uma vez por processo."""
+    return Settings()
@@ -0,0 +1,306 @@
+"""Dados sintéticos em volume para reproduzir a carga de produção.
+
+Não usa as factories, que montam um objeto por vez pelo ORM: as linhas
+saem como tuplas, em blocos, e são gravadas com COPY (PostgreSQL/psycopg)
+ou executemany. Tudo é determinístico a partir da semente.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+from typing import Iterator
+
+from sqlalchemy import Connection, func, insert, select, text
+
+from fastapi_supermarket.models import (
+    Category,
+    Product,
+    ProductSales,
+    Sales,
+    User,
+)
+
+BATCH_SIZE = 10_000
+
+COLUMNS = {
+    'categories': ('id', 'description'),
+    'users': ('id', 'name', 'cpf', 'email', 'password'),
+    'products': ('id', 'id_category', 'description', 'price', 'sku'),
+    'sales': ('id', 'id_user', 'total_amount', 'created_at'),
+    'product_sales': (
+        'id',
+        'id_sale',
+        'id_product',
+        'id_category',
+        'unit_price',
+        'quantity',
+    ),
+}
+
+TABLES = {
+    'categories': Category.__table__,
+    'users': User.__table__,
+    'products': Product.__table__,
+    'sales': Sales.__table__,
+    'product_sales': ProductSales.__table__,
+}
+
+DEPARTMENTS = [
+    'Bebidas', 'Mercearia', 'Hortifruti', 'Padaria', 'Açougue', 'Frios',
+    'Laticínios', 'Limpeza', 'Higiene', 'Pet', 'Bazar', 'Congelados',
+]  # fmt: skip
+PRODUCT_NAMES = [
+    'Arroz', 'Feijão', 'Café', 'Leite', 'Suco', 'Refrigerante', 'Biscoito',
+    'Macarrão', 'Sabão', 'Detergente', 'Queijo', 'Pão', 'Iogurte',
+    'Chocolate', 'Azeite', 'Açúcar', 'Farinha', 'Molho', 'Cerveja', 'Água',
+]  # fmt: skip
+BRANDS = [
+    'Bom Dia', 'Da Casa', 'Nativa', 'Serrana', 'Aurora', 'Vale Verde',
+    'Primor', 'Estrela',
+]  # fmt: skip
+SIZES = ['200g', '500g', '1kg', '2kg', '350ml', '1L', '2L', '6un']
+
+# Itens por venda (1 a 10) e quantidade por item
+ITEMS = range(1, 11)
+QUANTITIES = range(1, 5)
+ITEMS_WEIGHTS = [30, 22, 15, 10, 7, 5, 4, 3, 2, 2]
+QUANTITY_WEIGHTS = [80, 12, 5, 3]
+# Movimento por dia da semana (segunda a domingo) e por hora do dia
+WEEKDAY_WEIGHTS = [1.0, 0.9, 0.9, 1.0, 1.2, 1.5, 1.3]
+HOUR_WEIGHTS = [
+    0, 0, 0, 0, 0, 0, 0, 2, 4, 6, 8, 10, 9, 7, 6, 6, 7, 9, 10, 9, 7, 5, 3, 0,
+]  # fmt: skip
+_ITEMS = list(accumulate(ITEMS_WEIGHTS))
+_QUANTITIES = list(accumulate(QUANTITY_WEIGHTS))
+_HOURS = list(accumulate(HOUR_WEIGHTS))
+
+
+@dataclass
+class DatasetSpec:
+    users: int
+    products: int
+    sales: int
+    categories: int = 50
+    start: date = date(2024, 1, 1)
+    days: int = 365
+    # Expoente da lei de Zipf na popularidade dos produtos
+    zipf_exponent: float = 1.1
+    seed: int = 42
+
+
+def sku_for(n: int) -> str:
+    return f'SKU{n:08d}'
+
+
+def _batches(rows: Iterator[tuple]) -> Iterator[list[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _day_weight(day: date) -> float:
+    # Sazonalidade anual com pico no fim de dezembro
+    season = 1 + 0.3 * math.cos(
+        2 * math.pi * (day.timetuple().tm_yday - 355) / 365
+    )
+    return WEEKDAY_WEIGHTS[day.weekday()] * season
+
+
+class SalesDataset:
+    """Linhas de cada tabela, começando nos IDs informados."""
+
+    def __init__(
+        self, spec: DatasetSpec, first_ids: dict[str, int], password: str
+    ):
+        if spec.sales and not (spec.users and spec.products):
+            raise ValueError('Sales need users and products in the same run')
+        if spec.products and not spec.categories:
+            raise ValueError('Products need categories in the same run')
+        self.spec = spec
+        self.first_ids = first_ids
+        self.password = password
+        # Categoria e preço de cada produto gerado, copiados nos itens
+        self._categories: list[int] = []
+        self._prices: list[float] = []
+
+    def _random(self, table: str) -> random.Random:
+        # Uma sequência por tabela: mudar um volume não altera as outras
+        return random.Random(f'{self.spec.seed}:{table}')
+
+    def _ids(self, table: str, count: int) -> range:
+        return range(self.first_ids[table], self.first_ids[table] + count)
+
+    def categories(self) -> Iterator[list[tuple]]:
+        yield from _batches(
+            (
+                category_id,
+                DEPARTMENTS[n % len(DEPARTMENTS)]
+                + (
+                    f' {n // len(DEPARTMENTS) + 1}'
+                    if n >= len(DEPARTMENTS)
+                    else ''
+                ),
+            )
+            for n, category_id in enumerate(
+                self._ids('categories', self.spec.categories)
+            )
+        )
+
+    def users(self) -> Iterator[list[tuple]]:
+        yield from _batches(
+            (
+                user_id,
+                f'user{user_id}',
+                f'{user_id:011d}',
+                f'user{user_id}@example.com',
+                self.password,
+            )
+            for user_id in self._ids('users', self.spec.users)
+        )
+
+    def products(self) -> Iterator[list[tuple]]:
+        rnd = self._random('products')
+        categories = self._ids('categories', self.spec.categories)
+        self._categories, self._prices = [], []
+        for batch in _batches(
+            (
+                product_id,
+                rnd.choice(categories),
+                f'{rnd.choice(PRODUCT_NAMES)} {rnd.choice(BRANDS)} '
+                f'{rnd.choice(SIZES)} {product_id}',
+                round(rnd.lognormvariate(2.5, 0.8), 2),
+                sku_for(product_id),
+            )
+            for product_id in self._ids('products', self.spec.products)
+        ):
+            self._categories.extend(row[1] for row in batch)
+            self._prices.extend(row[3] for row in batch)
+            yield batch
+
+    def _sales_per_day(self) -> list[tuple[date, int]]:
+        """Distribui as vendas pelos dias (maiores restos)."""
+        days = [
+            self.spec.start + timedelta(days=n) for n in range(self.spec.days)
+        ]
+        weights = [_day_weight(day) for day in days]
+        total = sum(weights)
+        shares = [self.spec.sales * weight / total for weight in weights]
+        counts = [int(share) for share in shares]
+        remainders = sorted(
+            range(len(days)),
+            key=lambda n: counts[n] - shares[n],
+        )
+        for n in remainders[: self.spec.sales - sum(counts)]:
+            counts[n] += 1
+        return list(zip(days, counts))
+
+    def sales(self) -> Iterator[tuple[list[tuple], list[tuple]]]:
+        """Vendas e itens em blocos; os IDs crescem com a data da venda."""
+        if not self.spec.sales:
+            return
+        if not self._prices:
+            # Categorias e preços vêm dos produtos gerados (mesma semente)
+            for _ in self.products():
+                pass
+
+        rnd = self._random('sales')
+        product_ids = self._ids('products', self.spec.products)
+        users = self._ids('users', self.spec.users)
+        # Produtos em ordem de popularidade, sorteada
+        ranked = list(product_ids)
+        rnd.shuffle(ranked)
+        popularity = list(
+            accumulate(
+                1 / rank**self.spec.zipf_exponent
+                for rank in range(1, len(ranked) + 1)
+            )
+        )
+
+        sale_id = self.first_ids['sales']
+        item_id = self.first_ids['product_sales']
+        sales, items = [], []
+        for day, count in self._sales_per_day():
+            midnight = datetime.combine(day, time())
+            moments = sorted(
+                hour * 3600 + rnd.randrange(3600)
+                for hour in rnd.choices(range(24), cum_weights=_HOURS, k=count)
+            )
+            for seconds in moments:
+                lines = {}
+                for product_id in rnd.choices(
+                    ranked,
+                    cum_weights=popularity,
+                    k=rnd.choices(ITEMS, cum_weights=_ITEMS)[0],
+                ):
+                    quantity = rnd.choices(QUANTITIES, cum_weights=_QUANTITIES)
+                    lines[product_id] = lines.get(product_id, 0) + quantity[0]
+                total_amount = 0.0
+                for product_id, quantity in lines.items():
+                    index = product_id - product_ids.start
+                    unit_price = self._prices[index]
+                    total_amount += unit_price * quantity
+                    items.append((
+                        item_id,
+                        sale_id,
+                        product_id,
+                        self._categories[index],
+                        unit_price,
+                        quantity,
+                    ))
+                    item_id += 1
+                sales.append((
+                    sale_id,
+                    rnd.choice(users),
+                    round(total_amount, 2),
+                    midnight + timedelta(seconds=seconds),
+                ))
+                sale_id += 1
+                if len(sales) == BATCH_SIZE:
+                    yield sales, items
+                    sales, items = [], []
+        if sales:
+            yield sales, items
+
+
+def first_ids(conn: Connection) -> dict[str, int]:
+    """Próximo ID livre de cada tabela, para acrescentar aos dados atuais."""
+    return {
+        name: (conn.scalar(select(func.max(table.c.id))) or 0) + 1
+        for name, table in TABLES.items()
+    }
+
+
+def bulk_insert(conn: Connection, name: str, rows: list[tuple]) -> None:
+    """Grava um bloco com COPY no PostgreSQL (psycopg) ou executemany."""
+    columns = COLUMNS[name]
+    if conn.dialect.name == 'postgresql' and conn.dialect.driver == 'psycopg':
+        cursor = conn.connection.driver_connection.cursor()
+        with cursor.copy(
+            f'COPY {name} ({", ".join(columns)}) FROM STDIN'
+        ) as copy:
+            for row in rows:
+                copy.write_row(row)
+        return
+    conn.execute(
+        insert(TABLES[name]), [dict(zip(columns, row)) for row in rows]
+    )
+
+
+def reset_sequences(conn: Connection) -> None:
+    """Com IDs explícitos, o PostgreSQL precisa avançar as sequências."""
+    if conn.dialect.name != 'postgresql':
+        return
+    for name in TABLES:
+        conn.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+                f'(SELECT max(id) FROM {name}))'
+            )
+        )
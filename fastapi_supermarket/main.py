@@ -1,17 +1,54 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import configure_mappers
 
 from fastapi_supermarket.controllers import (
     auth_controller,
     category_controller,
+    health_controller,
+    metrics_controller,
     product_controller,
+    report_controller,
     sales_controller,
     users_controller,
 )
+from fastapi_supermarket.core.database import (
+    run_with_session,
+    settings,
+    warm_up_pool,
+)
+from fastapi_supermarket.core.readiness import readiness
+from fastapi_supermarket.core.request_metrics import MetricsMiddleware
+from fastapi_supermarket.core.responses import ORJSONResponse
+from fastapi_supermarket.core.security import password_hasher
+from fastapi_supermarket.services.catalog_service import catalog
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # O custo que cairia nas primeiras requisições depois de um deploy
+    steps = {
+        'mappers': configure_mappers,
+        'pool': lambda: warm_up_pool(settings.WARMUP_POOL_CONNECTIONS),
+        'password_hasher': lambda: run_in_threadpool(password_hasher.warm_up),
+    }
+    if catalog.enabled:
+        steps['catalog'] = lambda: run_with_session(catalog.snapshot)
+    await readiness.run(steps)
+    yield
+    readiness.reset()
+
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth_controller.router)
 app.include_router(users_controller.router)
 app.include_router(category_controller.router)
 app.include_router(product_controller.router)
 app.include_router(sales_controller.router)
+app.include_router(report_controller.router)
+app.include_router(metrics_controller.router)
+app.include_router(health_controller.router)
@@ -1,14 +1,29 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import DDL, ForeignKey, Index, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column, registry, relationship
 
 table_registry = registry()
 
 
+def active_index(name: str, *columns: str) -> Index:
+    """Índice parcial restrito aos registros não removidos (soft delete)."""
+    return Index(
+        name,
+        *columns,
+        postgresql_where=text('deleted_at IS NULL'),
+        sqlite_where=text('deleted_at IS NULL'),
+    )
+
+
 @table_registry.mapped_as_dataclass
 class User:
     __tablename__ = 'users'
+    __table_args__ = (
+        active_index('ix_users_email', 'email'),
+        active_index('ix_users_cpf', 'cpf'),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     name: Mapped[str]
@@ -47,11 +62,17 @@ class Category:
 @table_registry.mapped_as_dataclass
 class Product:
     __tablename__ = 'products'
+    __table_args__ = (
+        active_index('ix_products_id_category', 'id_category'),
+        Index('ix_products_sku', 'sku', unique=True),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     id_category: Mapped[int] = mapped_column(ForeignKey('categories.id'))
     description: Mapped[str]
     price: Mapped[float]
+    # Código do fornecedor, chave das importações de catálogo
+    sku: Mapped[Optional[str]] = mapped_column(default=None)
     created_at: Mapped[datetime] = mapped_column(
         init=False, server_default=func.now()
     )
@@ -66,12 +87,74 @@ class Product:
     )
 
 
+# Busca por descrição: índice pg_trgm no Postgres e FTS5 no SQLite. Esses
+# objetos dependem do banco, então ficam fora do metadata (o autogenerate
+# os ignora, ver migrations/env.py) e são criados junto com a tabela.
+SEARCH_OBJECTS_PREFIXES = ('ix_products_description_trgm', 'products_fts')
+
+POSTGRES_SEARCH_DDL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE INDEX IF NOT EXISTS ix_products_description_trgm '
+    'ON products USING gin (description gin_trgm_ops) '
+    'WHERE deleted_at IS NULL',
+]
+
+SQLITE_SEARCH_DDL = [
+    'CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5('
+    "description, content='products', content_rowid='id')",
+    'CREATE TRIGGER IF NOT EXISTS products_fts_insert '
+    'AFTER INSERT ON products BEGIN '
+    'INSERT INTO products_fts(rowid, description) '
+    'VALUES (new.id, new.description); END',
+    'CREATE TRIGGER IF NOT EXISTS products_fts_delete '
+    'AFTER DELETE ON products BEGIN '
+    'INSERT INTO products_fts(products_fts, rowid, description) '
+    "VALUES ('delete', old.id, old.description); END",
+    'CREATE TRIGGER IF NOT EXISTS products_fts_update '
+    'AFTER UPDATE OF description ON products BEGIN '
+    'INSERT INTO products_fts(products_fts, rowid, description) '
+    "VALUES ('delete', old.id, old.description); "
+    'INSERT INTO products_fts(rowid, description) '
+    'VALUES (new.id, new.description); END',
+]
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Product.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='postgresql'),
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Product.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='sqlite'),
+    )
+event.listen(
+    Product.__table__,
+    'before_drop',
+    DDL('DROP TABLE IF EXISTS products_fts').execute_if(dialect='sqlite'),
+)
+
+
 @table_registry.mapped_as_dataclass
 class Sales:
     __tablename__ = 'sales'
+    __table_args__ = (
+        active_index('ix_sales_created_at', 'created_at'),
+        active_index('ix_sales_id_user', 'id_user'),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     id_user: Mapped[int] = mapped_column(ForeignKey('users.id'))
+    # Chave de idempotência enviada pelo PDV nas cargas em lote
+    client_key: Mapped[Optional[str]] = mapped_column(
+        default=None, unique=True
+    )
+    # Soma de quantity * unit_price dos itens, gravada no checkout
+    total_amount: Mapped[float] = mapped_column(
+        default=0.0, server_default='0'
+    )
     created_at: Mapped[datetime] = mapped_column(
         init=False, server_default=func.now()
     )
@@ -91,9 +174,44 @@ class ProductSales:
     __tablename__ = 'product_sales'
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
-    id_sale: Mapped[int] = mapped_column(ForeignKey('sales.id'))
-    id_product: Mapped[int] = mapped_column(ForeignKey('products.id'))
+    id_sale: Mapped[int] = mapped_column(ForeignKey('sales.id'), index=True)
+    id_product: Mapped[int] = mapped_column(
+        ForeignKey('products.id'), index=True
+    )
+    # Categoria e preço do produto no momento da venda
+    id_category: Mapped[int] = mapped_column(ForeignKey('categories.id'))
+    unit_price: Mapped[float]
+    quantity: Mapped[int] = mapped_column(default=1, server_default='1')
 
     # Relacionamento com Sales e Product
     sale: Mapped['Sales'] = relationship(back_populates='products', init=False)
     product: Mapped['Product'] = relationship(init=False)
+
+
+@table_registry.mapped_as_dataclass
+class SalesDailyRollup:
+    """Vendas consolidadas por dia, categoria e produto."""
+
+    __tablename__ = 'sales_daily_rollup'
+
+    day: Mapped[date] = mapped_column(primary_key=True)
+    id_category: Mapped[int] = mapped_column(
+        ForeignKey('categories.id'), primary_key=True
+    )
+    id_product: Mapped[int] = mapped_column(
+        ForeignKey('products.id'), primary_key=True
+    )
+    units: Mapped[int]
+    revenue: Mapped[float]
+    sale_count: Mapped[int]
+
+
+@table_registry.mapped_as_dataclass
+class SalesDailyTotals:
+    """Totais de vendas por dia encerrado, usados nas médias mensais."""
+
+    __tablename__ = 'sales_daily_totals'
+
+    day: Mapped[date] = mapped_column(primary_key=True)
+    revenue: Mapped[float]
+    sale_count: Mapped[int]
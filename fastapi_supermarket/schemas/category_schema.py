@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -20,3 +22,4 @@ class CategoryResponse(CategoryBase):
 
 class CategoryListResponse(BaseModel):
     categories: list[CategoryResponse]
+    next_cursor: Optional[str] = None
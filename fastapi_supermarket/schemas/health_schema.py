@@ -0,0 +1,15 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class HealthResponse(BaseModel):
+    status: Literal['ok']
+
+
+class ReadinessResponse(BaseModel):
+    status: Literal['ready', 'starting', 'retrying']
+    # Duração, em segundos, de cada etapa de aquecimento concluída
+    steps: dict[str, float]
+    # Última falha, enquanto a etapa é repetida
+    error: Optional[str] = None
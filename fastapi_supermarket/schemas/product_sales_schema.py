@@ -1,6 +1,8 @@
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from fastapi_supermarket.schemas.product_schema import ProductPublic
 
 
 class ProductSalesBase(BaseModel):
@@ -8,12 +10,18 @@ class ProductSalesBase(BaseModel):
 
 
 class ProductSalesCreate(ProductSalesBase):
-    pass
+    quantity: int = Field(default=1, gt=0)
+
+
+class ProductSalesPublic(ProductPublic):
+    quantity: int
 
 
 class ProductSalesResponse(ProductSalesBase):
     id: int
     id_sale: int
+    quantity: int
+    unit_price: float
 
     class Config:
         from_attributes = True
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProductBase(BaseModel):
@@ -32,3 +32,23 @@ class ProductResponse(ProductPublic):
 
 class ProductListResponse(BaseModel):
     products: list[ProductResponse]
+    next_cursor: Optional[str] = None
+
+
+class ProductImportRow(BaseModel):
+    sku: str = Field(min_length=1)
+    category: str
+    description: str = Field(min_length=1)
+    price: float = Field(ge=0)
+
+
+class ProductImportError(BaseModel):
+    row: int
+    detail: str
+
+
+class ProductImportResponse(BaseModel):
+    created: int
+    updated: int
+    invalid: int
+    errors: list[ProductImportError]
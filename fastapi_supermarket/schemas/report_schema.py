@@ -0,0 +1,32 @@
+from datetime import date
+
+from pydantic import BaseModel, model_validator
+
+MAX_REPORT_DAYS = 366
+
+
+class ReportPeriod(BaseModel):
+    start_date: date
+    end_date: date
+
+    @model_validator(mode='after')
+    def check_range(self):
+        if self.end_date < self.start_date:
+            raise ValueError('end_date must not be before start_date')
+        if (self.end_date - self.start_date).days >= MAX_REPORT_DAYS:
+            raise ValueError(f'Period must not exceed {MAX_REPORT_DAYS} days')
+        return self
+
+
+class SalesSummary(BaseModel):
+    total_sales: float
+
+
+class CategoryRevenue(BaseModel):
+    category: str
+    total_revenue: float
+
+
+class MonthlyAverage(BaseModel):
+    month: date
+    avg_sales: float
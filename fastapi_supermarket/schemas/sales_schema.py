@@ -1,11 +1,14 @@
-from typing import List, Optional
+from datetime import date
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from fastapi_supermarket.schemas.product_sales_schema import (
     ProductSalesCreate,
+    ProductSalesPublic,
 )
-from fastapi_supermarket.schemas.product_schema import ProductPublic
+
+ExportFormat = Literal['csv', 'ndjson', 'parquet']
 
 
 class SalesBase(BaseModel):
@@ -16,14 +19,34 @@ class SalesCreate(SalesBase):
     products: List[ProductSalesCreate]
 
 
+class SalesBatchItem(SalesCreate):
+    client_key: str
+
+
 class SalesUpdate(BaseModel):
     id_user: Optional[int] = None
     products: Optional[List[ProductSalesCreate]] = None
 
 
+class SalesExport(BaseModel):
+    # Query string da exportação; o FastAPI lê pelo alias e monta pelo nome
+    model_config = ConfigDict(populate_by_name=True)
+
+    export_format: ExportFormat = Field(default='csv', alias='format')
+    from_date: Optional[date] = Field(default=None, alias='from')
+    to_date: Optional[date] = Field(default=None, alias='to')
+
+    @model_validator(mode='after')
+    def check_range(self):
+        if self.from_date and self.to_date and self.to_date < self.from_date:
+            raise ValueError('to must not be before from')
+        return self
+
+
 class SalesResponse(SalesBase):
     id: int
-    products: List[ProductPublic]
+    total_amount: float
+    products: List[ProductSalesPublic]
 
     class Config:
         from_attributes = True
@@ -31,3 +54,18 @@ class SalesResponse(SalesBase):
 
 class SalesListResponse(BaseModel):
     sales: List[SalesResponse]
+    next_cursor: Optional[str] = None
+
+
+class SalesBatchResult(BaseModel):
+    client_key: str
+    status: Literal['created', 'duplicate', 'invalid']
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class SalesBatchResponse(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: List[SalesBatchResult]
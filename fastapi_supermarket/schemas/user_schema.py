@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, EmailStr
 
 
@@ -25,3 +27,4 @@ class UserResponse(UserBase):
 
 class UserListResponse(BaseModel):
     users: list[UserResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,189 @@
+"""Relatórios de vendas calculados em memória com NumPy.
+
+Alternativa às consultas agregadas de ``sales_service`` para períodos
+longos: o banco só filtra e devolve colunas numéricas, em blocos, e os
+agrupamentos rodam em vetores. As respostas têm o mesmo formato das
+versões em SQL. Requer o extra ``analytics`` (numpy).
+"""
+
+from datetime import date
+from http import HTTPStatus
+
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.models import (
+    Category,
+    Product,
+    ProductSales,
+    Sales,
+    User,
+)
+from fastapi_supermarket.schemas.product_schema import ProductPublic
+from fastapi_supermarket.schemas.user_schema import UserResponse
+from fastapi_supermarket.services.sales_service import in_period
+
+CHUNK_SIZE = 50_000
+
+
+def _numpy():
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as error:  # pragma: no cover
+        raise RuntimeError(
+            'The numpy reports backend requires the "analytics" extra: '
+            'pip install fastapi_supermarket[analytics]'
+        ) from error
+    return np
+
+
+def _load(query, session: T_Session, columns: int):
+    """Carrega o resultado em blocos como uma matriz float64."""
+    np = _numpy()
+    result = session.execute(
+        query, execution_options={'yield_per': CHUNK_SIZE}
+    )
+    chunks = [
+        np.array(partition, dtype=np.float64)
+        for partition in result.partitions()
+    ]
+    if not chunks:
+        return np.empty((0, columns))
+    return np.concatenate(chunks)
+
+
+def _line_items(start_date: date, end_date: date, session: T_Session):
+    """Colunas: id da venda, usuário, produto, categoria, receita, qtd."""
+    query = (
+        select(
+            ProductSales.id_sale,
+            Sales.id_user,
+            ProductSales.id_product,
+            ProductSales.id_category,
+            ProductSales.quantity * ProductSales.unit_price,
+            ProductSales.quantity,
+        )
+        .join(Sales, Sales.id == ProductSales.id_sale)
+        .where(in_period(start_date, end_date))
+    )
+    return _load(query, session, columns=6)
+
+
+def _group_sum(keys, values):
+    """Soma values por chave; retorna as chaves únicas e as somas."""
+    np = _numpy()
+    unique, inverse = np.unique(keys.astype(np.int64), return_inverse=True)
+    return unique, np.bincount(inverse, weights=values)
+
+
+def get_sales_summary(
+    start_date: date, end_date: date, session: T_Session
+) -> dict:
+    query = select(Sales.total_amount).where(in_period(start_date, end_date))
+    totals = _load(query, session, columns=1)
+    return {'total_sales': float(totals.sum()) if len(totals) else 0}
+
+
+def get_top_product(
+    start_date: date, end_date: date, session: T_Session
+) -> ProductPublic:
+    items = _line_items(start_date, end_date, session)
+    if not len(items):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='No product found in the given period',
+        )
+
+    products, units = _group_sum(items[:, 2], items[:, 5])
+    # argmax devolve o primeiro máximo: empate fica com o menor ID
+    product_id = int(products[units.argmax()])
+    category, description, price = session.execute(
+        select(Category.description, Product.description, Product.price)
+        .join(Category, Category.id == Product.id_category)
+        .where(Product.id == product_id)
+    ).one()
+    return ProductPublic(
+        category=category, description=description, price=price
+    )
+
+
+def get_top_customer(
+    start_date: date, end_date: date, session: T_Session
+) -> UserResponse:
+    np = _numpy()
+    query = select(Sales.id_user).where(in_period(start_date, end_date))
+    sales = _load(query, session, columns=1)
+    if not len(sales):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='No customer found in the given period',
+        )
+
+    users, purchases = np.unique(
+        sales[:, 0].astype(np.int64), return_counts=True
+    )
+    user = session.get(User, int(users[purchases.argmax()]))
+    return UserResponse(
+        id=user.id, name=user.name, cpf=user.cpf, email=user.email
+    )
+
+
+def get_revenue_by_category(
+    start_date: date, end_date: date, session: T_Session
+) -> list[dict]:
+    np = _numpy()
+    items = _line_items(start_date, end_date, session)
+    if not len(items):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='No revenue data found for the given period',
+        )
+
+    categories, revenue = _group_sum(items[:, 3], items[:, 4])
+    descriptions = dict(
+        session.execute(
+            select(Category.id, Category.description).where(
+                Category.id.in_(categories.tolist())
+            )
+        )
+        .tuples()
+        .all()
+    )
+    order = np.argsort(-revenue, kind='stable')
+    return [
+        {
+            'category': descriptions[int(categories[index])],
+            'total_revenue': float(revenue[index]),
+        }
+        for index in order
+    ]
+
+
+def get_monthly_average(session: T_Session) -> list[dict]:
+    np = _numpy()
+    result = session.execute(
+        select(Sales.created_at, Sales.total_amount).where(
+            Sales.deleted_at.is_(None)
+        ),
+        execution_options={'yield_per': CHUNK_SIZE},
+    )
+    months, totals = [], []
+    for partition in result.partitions():
+        created_at, amount = zip(*partition)
+        # O mês é calculado aqui, sem depender do date_trunc do banco
+        months.append(np.array(created_at, dtype='datetime64[M]'))
+        totals.append(np.array(amount, dtype=np.float64))
+    if not months:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='No sales data found'
+        )
+
+    unique, inverse, counts = np.unique(
+        np.concatenate(months), return_inverse=True, return_counts=True
+    )
+    sums = np.bincount(inverse, weights=np.concatenate(totals))
+    return [
+        {'month': month.astype(date), 'avg_sales': float(total / count)}
+        for month, total, count in zip(unique, sums, counts)
+    ]
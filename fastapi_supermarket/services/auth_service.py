@@ -7,8 +7,10 @@ from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_oauth2form import T_OAuth2Form
 from fastapi_supermarket.annotaded.t_session import T_Session
 from fastapi_supermarket.core.security import (
+    DUMMY_PASSWORD_HASH,
     create_access_token,
-    get_password_hash,
+    user_cache,
+    verify_and_update_password,
     verify_password,
 )
 from fastapi_supermarket.models import User
@@ -21,18 +23,27 @@ def generate_token(
 ) -> Token:
     user = session.scalar(
         select(User).where(
-            User.deleted_at.is_(None)
-            & (
-                (User.email == form_data.username)
-                | (User.password == get_password_hash(form_data.password))
-            )
+            User.deleted_at.is_(None) & (User.email == form_data.username)
         )
     )
-    if not user or not verify_password(form_data.password, user.password):
+    if user:
+        verified, new_hash = verify_and_update_password(
+            form_data.password, user.password
+        )
+    else:
+        verify_password(form_data.password, DUMMY_PASSWORD_HASH)
+        verified, new_hash = False, None
+    if not verified:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail='Authentication credentials is invalid.',
         )
+
+    # Regrava o hash quando os parâmetros do Argon2 foram alterados
+    if new_hash:
+        user.password = new_hash
+        session.commit()
+        user_cache.invalidate(user.email)
     access_token = create_access_token(data_payload={'sub': user.email})
     return Token(access_token=access_token, token_type='Bearer')
 
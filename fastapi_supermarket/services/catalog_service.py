@@ -0,0 +1,138 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import func, select
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import settings
+from fastapi_supermarket.models import Category, Product
+from fastapi_supermarket.schemas.product_schema import ProductResponse
+
+
+def active_products():
+    """Produtos ativos com a categoria; as colunas da cópia e das versões."""
+    return (
+        select(
+            Product.id,
+            Product.id_category,
+            Category.description,
+            Product.description,
+            Product.price,
+            Product.updated_at,
+            Category.updated_at,
+        )
+        .join(Category, Category.id == Product.id_category)
+        .where(Product.deleted_at.is_(None))
+    )
+
+
+def product_response(row) -> ProductResponse:
+    product_id, _, category, description, price, *_ = row
+    return ProductResponse.model_construct(
+        id=product_id, category=category, description=description, price=price
+    )
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    loaded_at: float
+    products: Mapping[int, ProductResponse]
+    ids: tuple[int, ...]
+    # Categoria de cada produto, gravada nos itens das vendas
+    categories: Mapping[int, int]
+    # Versões usadas nos ETags, derivadas do próprio conteúdo da cópia
+    versions: Mapping[int, tuple]
+    digest: str
+    last_modified: Optional[datetime]
+
+
+class Catalog:
+    """Cópia imutável dos produtos ativos, mantida em memória.
+
+    Escritas em produtos e categorias incrementam a versão e a próxima
+    leitura recarrega a cópia inteira, trocando a referência de uma vez.
+    Escritas feitas por outros processos são vistas depois de no máximo
+    ``max_staleness`` segundos. Com ``max_staleness`` 0 a cópia fica
+    desligada (``enabled``) e os serviços consultam o banco direto.
+    """
+
+    def __init__(self, max_staleness: float):
+        self.max_staleness = max_staleness
+        self.version = 0
+        self.loads = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_staleness > 0
+
+    def bump(self) -> None:
+        """Invalida a cópia atual; chamar depois do commit da escrita."""
+        with self._lock:
+            self.version += 1
+
+    def _is_fresh(self, snapshot: Optional[CatalogSnapshot]) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == self.version
+            and time.monotonic() - snapshot.loaded_at < self.max_staleness
+        )
+
+    def _load(self, session: T_Session) -> CatalogSnapshot:
+        # A versão é lida antes da consulta: uma escrita concorrente faz a
+        # cópia nascer desatualizada e ser recarregada na leitura seguinte
+        version = self.version
+        rows = session.execute(active_products().order_by(Product.id)).all()
+        products = {row[0]: product_response(row) for row in rows}
+        versions = {row[0]: tuple(row) for row in rows}
+        dates = [date for row in rows for date in row[-2:]]
+        # Remover um produto tira a linha da cópia: a data da remoção
+        # entra no Last-Modified para o If-Modified-Since não dar 304
+        dates.append(session.scalar(select(func.max(Product.deleted_at))))
+        self.loads += 1
+        return CatalogSnapshot(
+            version=version,
+            loaded_at=time.monotonic(),
+            products=MappingProxyType(products),
+            ids=tuple(products),
+            categories=MappingProxyType({row[0]: row[1] for row in rows}),
+            versions=MappingProxyType(versions),
+            digest=hashlib.sha256(
+                repr(list(versions.values())).encode()
+            ).hexdigest(),
+            last_modified=max(filter(None, dates), default=None),
+        )
+
+    def snapshot(self, session: T_Session) -> CatalogSnapshot:
+        # Sem lock durante a carga: no modo assíncrono ela cede o event
+        # loop, e duas cargas simultâneas só repetem trabalho
+        snapshot = self._snapshot
+        if not self._is_fresh(snapshot):
+            snapshot = self._snapshot = self._load(session)
+        return snapshot
+
+    def reset(self) -> None:
+        self._snapshot = None
+
+    def stats(self) -> dict[str, float]:
+        snapshot = self._snapshot
+        return {
+            'version': self.version,
+            'loads': self.loads,
+            'size': len(snapshot.ids) if snapshot else 0,
+            'age_seconds': (
+                round(time.monotonic() - snapshot.loaded_at, 3)
+                if snapshot
+                else 0
+            ),
+        }
+
+
+catalog = Catalog(max_staleness=settings.CATALOG_MAX_STALENESS_SECONDS)
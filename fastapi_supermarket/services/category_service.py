@@ -1,9 +1,11 @@
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import HTTPException
 from sqlalchemy import func, select
 
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.pagination import next_cursor, paginate
 from fastapi_supermarket.models import Category
 from fastapi_supermarket.schemas.category_schema import (
     CategoryCreate,
@@ -11,6 +13,7 @@ from fastapi_supermarket.schemas.category_schema import (
     CategoryResponse,
     CategoryUpdate,
 )
+from fastapi_supermarket.services.catalog_service import catalog
 
 
 def create(category: CategoryCreate, session: T_Session) -> CategoryResponse:
@@ -25,14 +28,37 @@ def find_all(
     session: T_Session,
     skip: int,
     limit: int,
+    cursor: Optional[str] = None,
 ) -> CategoryListResponse:
+    query = select(Category).where(Category.deleted_at.is_(None))
     categories = session.scalars(
-        select(Category)
-        .where(Category.deleted_at.is_(None))
-        .limit(limit)
-        .offset(skip)
+        paginate(query, Category.id, skip, limit, cursor)
     ).all()
-    return {'categories': categories}
+    return {
+        'categories': categories,
+        'next_cursor': next_cursor([c.id for c in categories], limit),
+    }
+
+
+def list_version(session: T_Session) -> tuple:
+    """Versão da listagem: muda a cada categoria alterada ou removida."""
+    return tuple(
+        session.execute(
+            select(
+                func.count(Category.id).filter(Category.deleted_at.is_(None)),
+                func.max(Category.updated_at),
+                func.max(Category.deleted_at),
+            )
+        ).one()
+    )
+
+
+def item_version(category_id: int, session: T_Session) -> Optional[tuple]:
+    return session.execute(
+        select(Category.id, Category.updated_at).where(
+            Category.deleted_at.is_(None) & (Category.id == category_id)
+        )
+    ).one_or_none()
 
 
 def find_by_id(category_id: int, session: T_Session) -> CategoryResponse:
@@ -60,6 +86,7 @@ def update(
         db_category.updated_at = func.now()
 
     session.commit()
+    catalog.bump()
     session.refresh(db_category)
     return db_category
 
@@ -76,6 +103,7 @@ def delete(category_id: int, session: T_Session) -> dict[str, str]:
 
     db_category.deleted_at = func.now()
     session.commit()
+    catalog.bump()
     session.refresh(db_category)
 
     return {'message': 'Category deleted!'}
@@ -0,0 +1,205 @@
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.models import Category, Product, ProductSales, Sales
+from fastapi_supermarket.schemas.sales_schema import ExportFormat
+
+EXPORT_CHUNK_SIZE = 5_000
+
+MEDIA_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+COLUMNS = [
+    'id_sale',
+    'created_at',
+    'id_user',
+    'total_amount',
+    'id_product',
+    'category',
+    'product',
+    'quantity',
+    'unit_price',
+]
+
+
+def _export_query(from_date: Optional[date], to_date: Optional[date]):
+    """Uma linha por item vendido, em ordem de venda."""
+    sale_filter = Sales.deleted_at.is_(None)
+    if from_date:
+        sale_filter &= Sales.created_at >= from_date
+    if to_date:
+        sale_filter &= Sales.created_at < to_date + timedelta(days=1)
+
+    return (
+        select(
+            Sales.id,
+            Sales.created_at,
+            Sales.id_user,
+            Sales.total_amount,
+            ProductSales.id_product,
+            Category.description,
+            Product.description,
+            ProductSales.quantity,
+            ProductSales.unit_price,
+        )
+        .outerjoin(ProductSales, ProductSales.id_sale == Sales.id)
+        .outerjoin(Product, Product.id == ProductSales.id_product)
+        .outerjoin(Category, Category.id == Product.id_category)
+        .where(sale_filter)
+        .order_by(Sales.id, ProductSales.id)
+    )
+
+
+async def _fetch_chunks(query, bind) -> AsyncIterator[list]:
+    """Lê o resultado em blocos por um cursor do lado do servidor.
+
+    A sessão da requisição já foi fechada quando a resposta começa a ser
+    enviada, então a exportação abre a sua própria sobre o mesmo engine.
+    """
+    session = Session(bind)
+    try:
+        result = await run_db(
+            session.execute,
+            query.execution_options(yield_per=EXPORT_CHUNK_SIZE),
+        )
+        while rows := await run_db(result.fetchmany, EXPORT_CHUNK_SIZE):
+            yield rows
+    finally:
+        await run_db(session.close)
+
+
+async def _encode_csv(chunks: AsyncIterator[list]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    yield buffer.getvalue().encode()
+
+    async for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+async def _encode_ndjson(
+    chunks: AsyncIterator[list],
+) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        yield ''.join(
+            json.dumps(dict(zip(COLUMNS, row)), default=_json_default) + '\n'
+            for row in rows
+        ).encode()
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.parquet as pq  # noqa: PLC0415
+    except ImportError as error:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Parquet export requires the "export" extra (pyarrow).',
+        ) from error
+    return pa, pq
+
+
+class _ChunkSink(io.RawIOBase):
+    """Destino do ParquetWriter que entrega os bytes a cada bloco."""
+
+    def __init__(self):
+        self.position = 0
+        self._chunks = []
+
+    def writable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # O writer usa a posição para os offsets do rodapé do arquivo
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _encode_parquet(
+    chunks: AsyncIterator[list],
+) -> AsyncIterator[bytes]:
+    pa, pq = _pyarrow()
+    schema = pa.schema([
+        ('id_sale', pa.int64()),
+        ('created_at', pa.timestamp('us')),
+        ('id_user', pa.int64()),
+        ('total_amount', pa.float64()),
+        ('id_product', pa.int64()),
+        ('category', pa.string()),
+        ('product', pa.string()),
+        ('quantity', pa.int64()),
+        ('unit_price', pa.float64()),
+    ])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        async for rows in chunks:
+            # Cada bloco vira um row group do arquivo
+            columns = zip(*rows)
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array(values, type=field.type)
+                        for values, field in zip(columns, schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+ENCODERS = {
+    'csv': _encode_csv,
+    'ndjson': _encode_ndjson,
+    'parquet': _encode_parquet,
+}
+
+
+def export_sales(
+    export_format: ExportFormat,
+    from_date: Optional[date],
+    to_date: Optional[date],
+    session: T_Session,
+) -> AsyncIterator[bytes]:
+    if export_format == 'parquet':
+        # Falha antes de iniciar a resposta se o pyarrow não estiver instalado
+        _pyarrow()
+    chunks = _fetch_chunks(
+        _export_query(from_date, to_date), session.get_bind()
+    )
+    return ENCODERS[export_format](chunks)
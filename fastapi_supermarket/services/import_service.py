@@ -0,0 +1,226 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import AsyncIterator, Literal
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.database import run_db
+from fastapi_supermarket.models import Category, Product
+from fastapi_supermarket.schemas.product_schema import (
+    ProductImportError,
+    ProductImportResponse,
+    ProductImportRow,
+)
+from fastapi_supermarket.services.catalog_service import catalog
+
+ImportFormat = Literal['csv', 'ndjson']
+
+IMPORT_CHUNK_SIZE = 5_000
+
+MAX_REPORTED_ERRORS = 100
+
+COLUMNS = ['sku', 'category', 'description', 'price']
+
+
+@dataclass
+class _ImportReport:
+    created: int = 0
+    updated: int = 0
+    invalid: int = 0
+    errors: list[ProductImportError] = field(default_factory=list)
+
+    def reject(self, row: int, detail: str) -> None:
+        # Conta todas as linhas inválidas, mas só detalha as primeiras
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(ProductImportError(row=row, detail=detail))
+
+
+async def _lines(body: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """Quebra o corpo da requisição em linhas, à medida que ele chega."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ''
+    try:
+        async for data in body:
+            *lines, pending = (pending + decoder.decode(data)).split('\n')
+            if lines:
+                yield lines
+        pending += decoder.decode(b'', final=True)
+    except UnicodeDecodeError as error:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Upload must be UTF-8 encoded.',
+        ) from error
+    if pending:
+        yield [pending]
+
+
+async def _csv_rows(
+    batches: AsyncIterator[list[str]], report: _ImportReport
+) -> AsyncIterator[tuple[int, dict]]:
+    header = None
+    row = 0
+    partial = ''
+    async for lines in batches:
+        records = []
+        for line in lines:
+            record = partial + line
+            # Aspas abertas: o campo continua na próxima linha
+            if record.count('"') % 2:
+                partial = record + '\n'
+                continue
+            partial = ''
+            if record.strip():
+                records.append(record)
+
+        for values in csv.reader(records):
+            if header is None:
+                header = [column.strip() for column in values]
+                if missing := [c for c in COLUMNS if c not in header]:
+                    raise HTTPException(
+                        status_code=HTTPStatus.BAD_REQUEST,
+                        detail=f'Missing columns: {", ".join(missing)}',
+                    )
+                continue
+            row += 1
+            yield row, dict(zip(header, values))
+
+    if partial:
+        report.reject(row + 1, 'Unterminated quoted field')
+
+
+async def _ndjson_rows(
+    batches: AsyncIterator[list[str]], report: _ImportReport
+) -> AsyncIterator[tuple[int, dict]]:
+    row = 0
+    async for lines in batches:
+        for line in lines:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                data = json.loads(line)
+            except ValueError:
+                report.reject(row, 'Invalid JSON')
+                continue
+            if not isinstance(data, dict):
+                report.reject(row, 'Expected a JSON object')
+                continue
+            yield row, data
+
+
+PARSERS = {'csv': _csv_rows, 'ndjson': _ndjson_rows}
+
+
+async def _chunks(
+    rows: AsyncIterator[tuple[int, dict]],
+) -> AsyncIterator[list[tuple[int, dict]]]:
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) == IMPORT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _categories(session: T_Session) -> dict[str, int]:
+    """IDs das categorias pela descrição, em uma única consulta."""
+    rows = session.execute(
+        select(Category.description, Category.id)
+        .where(Category.deleted_at.is_(None))
+        .order_by(Category.id.desc())
+    )
+    # Com descrições repetidas, vale a categoria mais antiga
+    return dict(rows.tuples().all())
+
+
+def _upsert_chunk(
+    chunk: list[tuple[int, dict]],
+    categories: dict[str, int],
+    report: _ImportReport,
+    session: T_Session,
+) -> None:
+    products = {}
+    valid = 0
+    for row, data in chunk:
+        try:
+            product = ProductImportRow.model_validate(data)
+        except ValidationError as error:
+            detail = error.errors()[0]
+            location = '.'.join(str(part) for part in detail['loc'])
+            report.reject(row, f'{location}: {detail["msg"]}')
+            continue
+        id_category = categories.get(product.category)
+        if id_category is None:
+            report.reject(row, 'Invalid category')
+            continue
+        valid += 1
+        # O mesmo SKU duas vezes no bloco: vale a última linha
+        products[product.sku] = {
+            'sku': product.sku,
+            'id_category': id_category,
+            'description': product.description,
+            'price': product.price,
+        }
+    if not products:
+        return
+
+    existing = set(
+        session.scalars(select(Product.sku).where(Product.sku.in_(products)))
+    )
+    dialect = session.get_bind().dialect.name
+    insert_into = (
+        postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    )
+    statement = insert_into(Product.__table__)
+    statement = statement.on_conflict_do_update(
+        index_elements=['sku'],
+        set_={
+            'id_category': statement.excluded.id_category,
+            'description': statement.excluded.description,
+            'price': statement.excluded.price,
+            'updated_at': func.now(),
+            # Reimportar um produto removido o traz de volta ao catálogo
+            'deleted_at': None,
+        },
+    )
+    session.execute(statement, list(products.values()))
+    session.commit()
+    catalog.bump()
+
+    created = len(products.keys() - existing)
+    report.created += created
+    report.updated += valid - created
+
+
+async def import_products(
+    body: AsyncIterator[bytes],
+    import_format: ImportFormat,
+    session: T_Session,
+) -> ProductImportResponse:
+    """Cria ou atualiza produtos pelo SKU, em blocos de IMPORT_CHUNK_SIZE.
+
+    Cada bloco é gravado na sua própria transação; as linhas inválidas
+    são puladas e relatadas sem interromper a importação.
+    """
+    report = _ImportReport()
+    categories = await run_db(_categories, session)
+    rows = PARSERS[import_format](_lines(body), report)
+    async for chunk in _chunks(rows):
+        await run_db(_upsert_chunk, chunk, categories, report, session)
+
+    return ProductImportResponse(
+        created=report.created,
+        updated=report.updated,
+        invalid=report.invalid,
+        errors=sorted(report.errors, key=lambda error: error.row),
+    )
@@ -1,10 +1,16 @@
+import re
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import column, func, select, table, text
 
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.pagination import (
+    next_cursor,
+    paginate,
+    paginate_ids,
+)
 from fastapi_supermarket.models import Category, Product
 from fastapi_supermarket.schemas.product_schema import (
     ProductCreate,
@@ -12,6 +18,13 @@ from fastapi_supermarket.schemas.product_schema import (
     ProductResponse,
     ProductUpdate,
 )
+from fastapi_supermarket.services.catalog_service import (
+    active_products,
+    catalog,
+    product_response,
+)
+
+SEARCH_RANKED_MATCHES = 2_000
 
 
 def create(product: ProductCreate, session: T_Session) -> ProductResponse:
@@ -27,6 +40,7 @@ def create(product: ProductCreate, session: T_Session) -> ProductResponse:
     )
     session.add(db_product)
     session.commit()
+    catalog.bump()
     session.refresh(db_product)
     return ProductResponse(
         id=db_product.id,
@@ -40,53 +54,157 @@ def find_all(
     session: T_Session,
     skip: int,
     limit: int,
+    cursor: Optional[str] = None,
 ) -> ProductListResponse:
-    query = (
-        select(Product)
-        .where(Product.deleted_at.is_(None))
-        .options(joinedload(Product.category))
-    )
-    products = session.scalars(query.limit(limit).offset(skip)).all()
+    if catalog.enabled:
+        snapshot = catalog.snapshot(session)
+        ids = paginate_ids(snapshot.ids, skip, limit, cursor)
+        products = [snapshot.products[product_id] for product_id in ids]
+    else:
+        rows = session.execute(
+            paginate(active_products(), Product.id, skip, limit, cursor)
+        )
+        products = [product_response(row) for row in rows]
 
-    if not products:
+    # Com cursor, a página vazia é o fim da listagem, não um erro
+    if not products and not cursor:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='Product not found'
         )
 
-    return ProductListResponse(
-        products=[
-            {
-                'id': ps.id,
-                'description': ps.description,
-                'category': ps.category.description,
-                'price': ps.price,
-            }
-            for ps in products
-        ],
+    return ProductListResponse.model_construct(
+        products=products,
+        next_cursor=next_cursor([product.id for product in products], limit),
     )
 
 
+def list_version(session: T_Session) -> tuple:
+    """Versão da listagem, tirada da mesma cópia que monta o corpo."""
+    if catalog.enabled:
+        snapshot = catalog.snapshot(session)
+        return (snapshot.digest, snapshot.last_modified)
+
+    # Sem a cópia, muda a cada produto ou categoria alterado
+    products = session.execute(
+        select(
+            func.count(Product.id).filter(Product.deleted_at.is_(None)),
+            func.max(Product.updated_at),
+            func.max(Product.deleted_at),
+        )
+    ).one()
+    categories_updated_at = session.scalar(
+        select(func.max(Category.updated_at))
+    )
+    return (*products, categories_updated_at)
+
+
+def _find_row(product_id: int, session: T_Session):
+    return session.execute(
+        active_products().where(Product.id == product_id)
+    ).one_or_none()
+
+
+def item_version(product_id: int, session: T_Session) -> Optional[tuple]:
+    if catalog.enabled:
+        return catalog.snapshot(session).versions.get(product_id)
+    row = _find_row(product_id, session)
+    return tuple(row) if row else None
+
+
 def find_by_id(
     product_id: int,
     session: T_Session,
 ) -> ProductResponse:
-    query = (
-        select(Product)
-        .where(Product.deleted_at.is_(None), Product.id == product_id)
-        .options(joinedload(Product.category))
-    )
-    product = session.scalar(query)
+    if catalog.enabled:
+        product = catalog.snapshot(session).products.get(product_id)
+    else:
+        row = _find_row(product_id, session)
+        product = product_response(row) if row else None
 
     if not product:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='Product not found'
         )
 
-    return ProductResponse(
-        id=product.id,
-        description=product.description,
-        category=product.category.description,
-        price=product.price,
+    return product
+
+
+def _search_query(q: str, session: T_Session):
+    """Busca por descrição usando o índice de texto de cada banco."""
+    query = select(
+        Product.id,
+        Category.description,
+        Product.description,
+        Product.price,
+    ).join(Category, Category.id == Product.id_category)
+    dialect = session.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        # ILIKE e o operador % usam o índice GIN pg_trgm
+        return query.where(
+            Product.description.icontains(q, autoescape=True)
+            | Product.description.op('%')(q)
+        ).order_by(
+            func.word_similarity(q, Product.description).desc(), Product.id
+        )
+
+    if dialect == 'sqlite':
+        # Prefixo de cada palavra na tabela FTS5
+        terms = ' '.join(f'"{word}"*' for word in re.findall(r'\w+', q))
+        products_fts = table('products_fts', column('rowid'), column('rank'))
+        match = text('products_fts MATCH :terms').bindparams(terms=terms)
+        total = session.scalar(
+            select(func.count()).select_from(products_fts).where(match)
+        )
+        matches = (
+            select(
+                products_fts.c.rowid.label('id'),
+                products_fts.c.rank.label('rank'),
+            )
+            .where(match)
+            .subquery()
+        )
+        query = query.join(matches, matches.c.id == Product.id)
+        # O bm25 é calculado para cada resultado: em buscas muito amplas
+        # (um prefixo curto) a ordem fica a do índice, que para no limite
+        if total <= SEARCH_RANKED_MATCHES:
+            return query.order_by(matches.c.rank, matches.c.id)
+        return query.order_by(matches.c.id)
+
+    return query.where(
+        Product.description.icontains(q, autoescape=True)
+    ).order_by(Product.id)
+
+
+def search(
+    q: str,
+    session: T_Session,
+    id_category: Optional[int] = None,
+    limit: int = 20,
+) -> ProductListResponse:
+    if not re.search(r'\w', q):
+        return ProductListResponse(products=[])
+
+    query = (
+        _search_query(q, session)
+        .where(Product.deleted_at.is_(None))
+        .limit(limit)
+    )
+    if id_category:
+        query = query.where(Product.id_category == id_category)
+
+    return ProductListResponse.model_construct(
+        products=[
+            ProductResponse.model_construct(
+                id=product_id,
+                category=category,
+                description=description,
+                price=price,
+            )
+            for product_id, category, description, price in session.execute(
+                query
+            )
+        ]
     )
 
 
@@ -118,8 +236,14 @@ def update(
     db_product.updated_at = func.now()
 
     session.commit()
+    catalog.bump()
     session.refresh(db_product)
-    return db_product
+    return ProductResponse(
+        id=db_product.id,
+        description=db_product.description,
+        price=db_product.price,
+        category=db_product.category.description,
+    )
 
 
 def delete(product_id: int, session: T_Session) -> dict[str, str]:
@@ -134,6 +258,7 @@ def delete(product_id: int, session: T_Session) -> dict[str, str]:
 
     db_product.deleted_at = func.now()
     session.commit()
+    catalog.bump()
     session.refresh(db_product)
 
     return {'message': 'Product deleted!'}
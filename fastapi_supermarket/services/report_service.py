@@ -0,0 +1,47 @@
+from datetime import UTC, date, datetime
+from typing import Any, Callable
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.cache import TTLCache
+from fastapi_supermarket.core.database import settings
+from fastapi_supermarket.schemas.report_schema import ReportPeriod
+
+report_cache = TTLCache(
+    maxsize=settings.REPORT_CACHE_MAX_SIZE,
+    ttl=settings.REPORT_CACHE_TTL_SECONDS,
+)
+
+
+def _today() -> date:
+    # O dia corrente pode ser o local ou o UTC, conforme o banco
+    return min(date.today(), datetime.now(UTC).date())
+
+
+def is_closed(period: ReportPeriod) -> bool:
+    """Períodos que terminam antes de hoje não recebem vendas novas."""
+    return period.end_date < _today()
+
+
+def cached_report(
+    report: Callable[[date, date, T_Session], Any],
+    period: ReportPeriod,
+    session: T_Session,
+) -> Any:
+    """Executa o relatório, memorizando o resultado de períodos encerrados."""
+    if not is_closed(period):
+        return report(period.start_date, period.end_date, session)
+
+    key = (report.__name__, period.start_date, period.end_date)
+    result = report_cache.get(key)
+    if result is None:
+        result = report(period.start_date, period.end_date, session)
+        report_cache.set(key, result)
+    return result
+
+
+def invalidate_reports(days: set[date]) -> None:
+    """Descarta os relatórios em cache cujo período contém algum dos dias."""
+    if days:
+        report_cache.invalidate_where(
+            lambda key: any(key[1] <= day <= key[2] for day in days)
+        )
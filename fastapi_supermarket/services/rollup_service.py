@@ -0,0 +1,177 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import Date, delete, func, insert, select, true, type_coerce
+from sqlalchemy.dialects import postgresql, sqlite
+
+from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.models import (
+    ProductSales,
+    Sales,
+    SalesDailyRollup,
+    SalesDailyTotals,
+)
+from fastapi_supermarket.services.report_service import report_cache
+
+ROLLUP_KEYS = ['day', 'id_category', 'id_product']
+TOTALS_KEYS = ['day']
+
+
+def sale_day():
+    return type_coerce(func.date(Sales.created_at), Date)
+
+
+def _rollup_rows(sale_filter):
+    day = sale_day()
+    return (
+        select(
+            day.label('day'),
+            ProductSales.id_category,
+            ProductSales.id_product,
+            func.sum(ProductSales.quantity).label('units'),
+            func.sum(ProductSales.quantity * ProductSales.unit_price).label(
+                'revenue'
+            ),
+            func.count(func.distinct(ProductSales.id_sale)).label(
+                'sale_count'
+            ),
+        )
+        .select_from(ProductSales)
+        .join(Sales, Sales.id == ProductSales.id_sale)
+        .where(sale_filter)
+        .group_by(day, ProductSales.id_category, ProductSales.id_product)
+    )
+
+
+def _totals_rows(sale_filter):
+    day = sale_day()
+    return (
+        select(
+            day.label('day'),
+            func.sum(Sales.total_amount).label('revenue'),
+            func.count(Sales.id).label('sale_count'),
+        )
+        .where(sale_filter)
+        .group_by(day)
+    )
+
+
+def _insert_into(model, session: T_Session):
+    """INSERT do dialeto, que aceita ON CONFLICT."""
+    dialect = session.get_bind().dialect.name
+    insert_into = (
+        postgresql.insert if dialect == 'postgresql' else sqlite.insert
+    )
+    return insert_into(model.__table__)
+
+
+def _upsert(model, keys: list[str], rows, sign: int, session: T_Session):
+    """Soma as linhas aos agregados existentes (INSERT ... ON CONFLICT)."""
+    if not rows:
+        return
+    table = model.__table__
+    statement = _insert_into(model, session)
+    measures = [column for column in rows[0].keys() if column not in keys]
+    statement = statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={
+            column: table.c[column] + statement.excluded[column]
+            for column in measures
+        },
+    )
+    session.execute(
+        statement,
+        [
+            {
+                **row,
+                **{column: row[column] * sign for column in measures},
+            }
+            for row in rows
+        ],
+    )
+
+
+def apply_sales(
+    sale_ids: list[int], session: T_Session, sign: int = 1
+) -> set[date]:
+    """Soma as vendas aos agregados diários, ou subtrai com sign=-1.
+
+    Roda na mesma transação da gravação da venda; o commit fica com quem
+    chamou. Retorna os dias alterados.
+
+    Os totais por dia só guardam dias encerrados (``close_days``): o
+    checkout não grava neles, e todas as vendas do dia não disputam o
+    bloqueio da mesma linha. Remover uma venda de um dia já encerrado
+    desconta o total desse dia.
+    """
+    days = set()
+    if not sale_ids:
+        return days
+    sale_filter = Sales.id.in_(sale_ids)
+    closed_filter = sale_filter & (Sales.created_at < func.current_date())
+    for model, keys, query in [
+        (SalesDailyRollup, ROLLUP_KEYS, _rollup_rows(sale_filter)),
+        (SalesDailyTotals, TOTALS_KEYS, _totals_rows(closed_filter)),
+    ]:
+        rows = session.execute(query).mappings().all()
+        _upsert(model, keys, rows, sign, session)
+        if sign < 0:
+            session.execute(delete(model).where(model.sale_count <= 0))
+        days.update(row['day'] for row in rows)
+    return days
+
+
+def close_days(session: T_Session) -> None:
+    """Grava os totais dos dias encerrados desde o último fechamento.
+
+    Chamada antes dos relatórios que leem os totais; sem dias novos, custa
+    uma consulta pela chave e outra pelo índice de ``created_at``.
+    """
+    last_closed = session.scalar(select(func.max(SalesDailyTotals.day)))
+    sale_filter = Sales.deleted_at.is_(None) & (
+        Sales.created_at < func.current_date()
+    )
+    if last_closed:
+        sale_filter &= Sales.created_at >= last_closed + timedelta(days=1)
+    rows = session.execute(_totals_rows(sale_filter)).mappings().all()
+    if not rows:
+        return
+    # Dois relatórios simultâneos podem fechar o mesmo dia, com os mesmos
+    # valores
+    session.execute(
+        _insert_into(SalesDailyTotals, session).on_conflict_do_nothing(),
+        rows,
+    )
+    session.commit()
+
+
+def rebuild(
+    session: T_Session,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> None:
+    """Recalcula os agregados do período a partir das vendas gravadas."""
+    sale_filter = Sales.deleted_at.is_(None)
+    if start_date:
+        sale_filter &= Sales.created_at >= start_date
+    if end_date:
+        sale_filter &= Sales.created_at < end_date + timedelta(days=1)
+
+    closed_filter = sale_filter & (Sales.created_at < func.current_date())
+    for model, query in [
+        (SalesDailyRollup, _rollup_rows(sale_filter)),
+        (SalesDailyTotals, _totals_rows(closed_filter)),
+    ]:
+        day_filter = true()
+        if start_date:
+            day_filter &= model.day >= start_date
+        if end_date:
+            day_filter &= model.day <= end_date
+        session.execute(delete(model).where(day_filter))
+        session.execute(
+            insert(model).from_select(
+                [column.name for column in query.selected_columns], query
+            )
+        )
+    session.commit()
+    report_cache.clear()
@@ -1,132 +1,459 @@
-from datetime import datetime
+from datetime import date, timedelta
 from http import HTTPStatus
+from itertools import groupby
+from typing import NamedTuple, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Date,
+    func,
+    insert,
+    select,
+    type_coerce,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.pagination import next_cursor, paginate
 from fastapi_supermarket.models import (
     Category,
     Product,
     ProductSales,
     Sales,
+    SalesDailyRollup,
+    SalesDailyTotals,
     User,
 )
-from fastapi_supermarket.schemas.category_schema import CategoryResponse
+from fastapi_supermarket.schemas.product_sales_schema import (
+    ProductSalesPublic,
+)
 from fastapi_supermarket.schemas.product_schema import ProductPublic
 from fastapi_supermarket.schemas.sales_schema import (
+    SalesBatchItem,
+    SalesBatchResponse,
+    SalesBatchResult,
     SalesCreate,
     SalesListResponse,
     SalesResponse,
 )
 from fastapi_supermarket.schemas.user_schema import UserResponse
+from fastapi_supermarket.services.catalog_service import (
+    active_products,
+    catalog,
+)
+from fastapi_supermarket.services.report_service import invalidate_reports
+from fastapi_supermarket.services.rollup_service import (
+    apply_sales,
+    close_days,
+)
 
+BATCH_CHUNK_SIZE = 500
 
-def create(sale: SalesCreate, session: T_Session) -> SalesResponse:
-    new_sale = Sales(id_user=sale.id_user)
-    session.add(new_sale)
-    session.commit()
-    session.refresh(new_sale)
 
-    product_sales = [
-        ProductSales(id_sale=new_sale.id, id_product=product.id_product)
-        for product in sale.products
+class SaleProduct(NamedTuple):
+    """Produto como fica registrado nos itens da venda."""
+
+    id_category: int
+    category: str
+    description: str
+    price: float
+
+
+def _products_by_id(
+    product_ids: set[int], session: T_Session
+) -> dict[int, SaleProduct]:
+    """Produtos ativos da venda, da cópia do catálogo ou do banco."""
+    if not catalog.enabled:
+        rows = session.execute(
+            active_products().where(Product.id.in_(product_ids))
+        )
+        return {row[0]: SaleProduct(*row[1:5]) for row in rows}
+
+    snapshot = catalog.snapshot(session)
+    return {
+        product_id: SaleProduct(
+            snapshot.categories[product_id],
+            product.category,
+            product.description,
+            product.price,
+        )
+        for product_id in product_ids
+        if (product := snapshot.products.get(product_id)) is not None
+    }
+
+
+def _total_amount(
+    sale: SalesCreate, products: dict[int, SaleProduct]
+) -> float:
+    return round(
+        sum(
+            products[item.id_product].price * item.quantity
+            for item in sale.products
+        ),
+        2,
+    )
+
+
+def _line_items(
+    sale_id: int, sale: SalesCreate, products: dict[int, SaleProduct]
+) -> list[dict]:
+    """Itens da venda com quantidade, categoria e preço do checkout."""
+    return [
+        {
+            'id_sale': sale_id,
+            'id_product': item.id_product,
+            'id_category': products[item.id_product].id_category,
+            'quantity': item.quantity,
+            'unit_price': products[item.id_product].price,
+        }
+        for item in sale.products
     ]
-    session.add_all(product_sales)
+
+
+def create(sale: SalesCreate, session: T_Session) -> SalesResponse:
+    product_ids = {product.id_product for product in sale.products}
+    products = _products_by_id(product_ids, session)
+    if len(products) != len(product_ids):
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail='Invalid product ID'
+        )
+
+    total_amount = _total_amount(sale, products)
+    sale_id = session.scalar(
+        insert(Sales)
+        .values(id_user=sale.id_user, total_amount=total_amount)
+        .returning(Sales.id)
+    )
+    if sale.products:
+        session.execute(
+            insert(ProductSales), _line_items(sale_id, sale, products)
+        )
+    days = apply_sales([sale_id], session)
     session.commit()
+    invalidate_reports(days)
 
     return SalesResponse(
-        id=new_sale.id,
-        id_user=new_sale.id_user,
+        id=sale_id,
+        id_user=sale.id_user,
+        total_amount=total_amount,
         products=[
-            ProductPublic(
-                category=ps.product.category.description,
-                description=ps.product.description,
-                price=ps.product.price,
+            ProductSalesPublic(
+                category=products[item.id_product].category,
+                description=products[item.id_product].description,
+                price=products[item.id_product].price,
+                quantity=item.quantity,
             )
-            for ps in product_sales
+            for item in sale.products
         ],
     )
 
 
-def find_all(session: T_Session) -> SalesListResponse:
-    query = select(Sales).where(Sales.deleted_at.is_(None))
-    sales = session.scalars(query).all()
-
-    return SalesListResponse(
-        sales=[
-            SalesResponse(
-                id=sale.id,
-                id_user=sale.id_user,
-                products=[
-                    ProductPublic(
-                        category=ps.product.category.description,
-                        description=ps.product.description,
-                        price=ps.product.price,
-                    )
-                    for ps in sale.products
-                ],
+def _store_sales(
+    items: list[SalesBatchItem],
+    products: dict[int, SaleProduct],
+    session: T_Session,
+) -> dict[str, int]:
+    """Grava vendas e itens em uma transação e retorna os IDs por chave."""
+    sale_ids = dict(
+        session.execute(
+            insert(Sales).returning(
+                Sales.client_key, Sales.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    'id_user': item.id_user,
+                    'client_key': item.client_key,
+                    'total_amount': _total_amount(item, products),
+                }
+                for item in items
+            ],
+        )
+        .tuples()
+        .all()
+    )
+    line_items = [
+        line
+        for item in items
+        for line in _line_items(sale_ids[item.client_key], item, products)
+    ]
+    if line_items:
+        session.execute(insert(ProductSales), line_items)
+    days = apply_sales(list(sale_ids.values()), session)
+    session.commit()
+    invalidate_reports(days)
+    return sale_ids
+
+
+def _store_chunk(
+    items: list[SalesBatchItem],
+    products: dict[int, SaleProduct],
+    session: T_Session,
+) -> dict[str, int]:
+    if not items:
+        return {}
+    try:
+        return _store_sales(items, products, session)
+    except IntegrityError:
+        session.rollback()
+        if len(items) == 1:
+            return {}
+
+    # Isola a venda que violou alguma restrição e grava as demais
+    sale_ids = {}
+    for item in items:
+        sale_ids.update(_store_chunk([item], products, session))
+    return sale_ids
+
+
+def _stored_keys(keys: set[str], session: T_Session) -> dict[str, int]:
+    if not keys:
+        return {}
+    return dict(
+        session.execute(
+            select(Sales.client_key, Sales.id).where(
+                Sales.client_key.in_(keys)
             )
-            for sale in sales
-        ],
+        )
+        .tuples()
+        .all()
+    )
+
+
+def _create_chunk(
+    chunk: list[SalesBatchItem], stored: dict[str, int], session: T_Session
+) -> list[SalesBatchResult]:
+    stored.update(_stored_keys({item.client_key for item in chunk}, session))
+    products = _products_by_id(
+        {p.id_product for item in chunk for p in item.products}, session
+    )
+
+    results, pending = [], {}
+    for item in chunk:
+        key = item.client_key
+        if key in stored or key in pending:
+            results.append(
+                SalesBatchResult(client_key=key, status='duplicate')
+            )
+        elif any(p.id_product not in products for p in item.products):
+            results.append(
+                SalesBatchResult(
+                    client_key=key,
+                    status='invalid',
+                    detail='Invalid product ID',
+                )
+            )
+        else:
+            pending[key] = item
+            results.append(SalesBatchResult(client_key=key, status='created'))
+
+    stored.update(_store_chunk(list(pending.values()), products, session))
+    # Gravadas por outra requisição depois da consulta acima (retry do PDV
+    # em paralelo ao envio original): a venda já existe, não é inválida
+    raced = _stored_keys(set(pending) - set(stored), session)
+    stored.update(raced)
+    for result in results:
+        result.id = stored.get(result.client_key)
+        if result.client_key in raced and result.status == 'created':
+            result.status = 'duplicate'
+        elif result.id is None and result.status != 'invalid':
+            result.status = 'invalid'
+            result.detail = 'Could not store sale.'
+    return results
+
+
+def create_batch(
+    sales: list[SalesBatchItem], session: T_Session
+) -> SalesBatchResponse:
+    stored: dict[str, int] = {}
+    results = []
+    for start in range(0, len(sales), BATCH_CHUNK_SIZE):
+        results.extend(
+            _create_chunk(
+                sales[start : start + BATCH_CHUNK_SIZE], stored, session
+            )
+        )
+
+    statuses = [result.status for result in results]
+    return SalesBatchResponse(
+        created=statuses.count('created'),
+        duplicates=statuses.count('duplicate'),
+        invalid=statuses.count('invalid'),
+        results=results,
+    )
+
+
+def _sales_with_products(sales):
+    """Projeta vendas e seus produtos em uma única consulta."""
+    return (
+        select(
+            sales.c.id,
+            sales.c.id_user,
+            sales.c.total_amount,
+            Category.description,
+            Product.description,
+            ProductSales.unit_price,
+            ProductSales.quantity,
+        )
+        .select_from(sales)
+        .outerjoin(ProductSales, ProductSales.id_sale == sales.c.id)
+        .outerjoin(Product, Product.id == ProductSales.id_product)
+        .outerjoin(Category, Category.id == Product.id_category)
+        .order_by(sales.c.id, ProductSales.id)
+    )
+
+
+def _group_sales(rows) -> list[SalesResponse]:
+    return [
+        SalesResponse.model_construct(
+            id=sale_id,
+            id_user=id_user,
+            total_amount=total_amount,
+            products=[
+                ProductSalesPublic.model_construct(
+                    category=category,
+                    description=description,
+                    price=price,
+                    quantity=quantity,
+                )
+                for *_, category, description, price, quantity in lines
+                if description is not None
+            ],
+        )
+        for (sale_id, id_user, total_amount), lines in groupby(
+            rows, key=lambda row: (row[0], row[1], row[2])
+        )
+    ]
+
+
+def find_all(
+    session: T_Session,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> SalesListResponse:
+    query = select(Sales.id, Sales.id_user, Sales.total_amount).where(
+        Sales.deleted_at.is_(None)
+    )
+    sales = paginate(query, Sales.id, skip, limit, cursor).subquery()
+    rows = session.execute(_sales_with_products(sales)).all()
+    sales_page = _group_sales(rows)
+
+    return SalesListResponse.model_construct(
+        sales=sales_page,
+        next_cursor=next_cursor([sale.id for sale in sales_page], limit),
     )
 
 
 def find_by_id(sale_id: int, session: T_Session) -> SalesResponse:
-    sale = session.get(Sales, sale_id)
-    if not sale:
+    sale = (
+        select(Sales.id, Sales.id_user, Sales.total_amount)
+        .where(Sales.deleted_at.is_(None) & (Sales.id == sale_id))
+        .subquery()
+    )
+    rows = session.execute(_sales_with_products(sale)).all()
+    if not rows:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='Venda não encontrada'
         )
-    return SalesResponse(
-        id=sale.id,
-        id_user=sale.id_user,
-        products=[
-            ProductPublic(
-                category=ps.product.category.description,
-                description=ps.product.description,
-                price=ps.product.price,
-            )
-            for ps in sale.products
-        ],
+    return _group_sales(rows)[0]
+
+
+def delete(sale_id: int, session: T_Session) -> dict[str, str]:
+    # O UPDATE condicional evita descontar a mesma venda duas vezes
+    deleted = session.scalar(
+        update(Sales)
+        .where(Sales.deleted_at.is_(None) & (Sales.id == sale_id))
+        .values(deleted_at=func.now())
+        .returning(Sales.id)
     )
+    if deleted is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail='Venda não encontrada'
+        )
 
+    days = apply_sales([sale_id], session, sign=-1)
+    session.commit()
+    invalidate_reports(days)
 
-def get_sales_summary(
-    start_date: str, end_date: str, session: T_Session
-) -> dict:
-    start_date = datetime.strptime(start_date, '%Y-%m-%d')
-    end_date = datetime.strptime(end_date, '%Y-%m-%d')
+    return {'message': 'Sale deleted!'}
+
+
+def in_period(start_date: date, end_date: date):
+    """Vendas não removidas criadas entre as datas, inclusive."""
+    return (
+        Sales.deleted_at.is_(None)
+        & (Sales.created_at >= start_date)
+        & (Sales.created_at < end_date + timedelta(days=1))
+    )
 
-    total_sales = session.execute(
-        select(func.sum(ProductSales.quantity * Product.price))
-        .join(ProductSales, Product.id == ProductSales.id_product)
+
+def _closed_days(day, start_date: date, end_date: date):
+    """Dias já encerrados do período, lidos dos agregados diários."""
+    return day.between(start_date, end_date) & (day < func.current_date())
+
+
+def _open_day(start_date: date, end_date: date):
+    """Vendas do dia corrente, ainda em aberto, lidas das tabelas brutas."""
+    return in_period(start_date, end_date) & (
+        Sales.created_at >= func.current_date()
+    )
+
+
+def _product_sales(start_date: date, end_date: date):
+    """Unidades e receita por produto: agregados + vendas do dia."""
+    return union_all(
+        select(
+            SalesDailyRollup.id_category,
+            SalesDailyRollup.id_product,
+            SalesDailyRollup.units,
+            SalesDailyRollup.revenue,
+        ).where(_closed_days(SalesDailyRollup.day, start_date, end_date)),
+        select(
+            ProductSales.id_category,
+            ProductSales.id_product,
+            ProductSales.quantity,
+            ProductSales.quantity * ProductSales.unit_price,
+        )
         .join(Sales, Sales.id == ProductSales.id_sale)
-        .where(Sales.created_at.between(start_date, end_date))
-    ).scalar()
-    return {'total_sales': total_sales}
+        .where(_open_day(start_date, end_date)),
+    ).subquery()
+
+
+def get_sales_summary(
+    start_date: date, end_date: date, session: T_Session
+) -> dict:
+    close_days(session)
+    revenue = union_all(
+        select(SalesDailyTotals.revenue).where(
+            _closed_days(SalesDailyTotals.day, start_date, end_date)
+        ),
+        select(Sales.total_amount).where(_open_day(start_date, end_date)),
+    ).subquery()
+    total_sales = session.scalar(select(func.sum(revenue.c.revenue)))
+    return {'total_sales': total_sales or 0}
 
 
 def get_top_product(
-    start_date: str, end_date: str, session: T_Session
+    start_date: date, end_date: date, session: T_Session
 ) -> ProductPublic:
+    product_sales = _product_sales(start_date, end_date)
+    units = func.sum(product_sales.c.units)
     top_product = session.execute(
-        select(
-            Product.description,
-            Product.price,
-            func.sum(ProductSales.quantity).label('total_sold'),
-        )
-        .join(ProductSales, Product.id == ProductSales.id_product)
-        .join(Sales, Sales.id == ProductSales.id_sale)
-        .where(Sales.created_at.between(start_date, end_date))
-        .group_by(Product.id)
-        .order_by(func.sum(ProductSales.quantity).desc())
+        select(Category.description, Product.description, Product.price)
+        .select_from(product_sales)
+        .join(Product, Product.id == product_sales.c.id_product)
+        .join(Category, Category.id == Product.id_category)
+        .group_by(Product.id, Category.id)
+        .order_by(units.desc(), Product.id)
         .limit(1)
     ).fetchone()
 
     if not top_product:
         raise HTTPException(
-            status_code=404, detail='No product found in the given period'
+            status_code=HTTPStatus.NOT_FOUND,
+            detail='No product found in the given period',
         )
 
     return ProductPublic(
@@ -137,14 +464,14 @@ def get_top_product(
 
 
 def get_top_customer(
-    start_date: str, end_date: str, session: T_Session
+    start_date: date, end_date: date, session: T_Session
 ) -> UserResponse:
     top_customer = session.execute(
-        select(User.name, func.count(Sales.id).label('total_purchases'))
+        select(User.id, User.name, User.cpf, User.email)
         .join(Sales, Sales.id_user == User.id)
-        .where(Sales.created_at.between(start_date, end_date))
+        .where(in_period(start_date, end_date))
         .group_by(User.id)
-        .order_by(func.count(Sales.id).desc())
+        .order_by(func.count(Sales.id).desc(), User.id)
         .limit(1)
     ).fetchone()
 
@@ -163,21 +490,16 @@ def get_top_customer(
 
 
 def get_revenue_by_category(
-    start_date: str, end_date: str, session: T_Session
-) -> list[CategoryResponse]:
+    start_date: date, end_date: date, session: T_Session
+) -> list[dict]:
+    product_sales = _product_sales(start_date, end_date)
+    revenue = func.sum(product_sales.c.revenue)
     revenue_by_category = session.execute(
-        select(
-            Category.description,
-            func.sum(ProductSales.quantity * Product.price).label(
-                'total_revenue'
-            ),
-        )
-        .join(Product, Product.id_category == Category.id)
-        .join(ProductSales, ProductSales.id_product == Product.id)
-        .join(Sales, Sales.id == ProductSales.id_sale)
-        .where(Sales.created_at.between(start_date, end_date))
+        select(Category.description, revenue.label('total_revenue'))
+        .select_from(product_sales)
+        .join(Category, Category.id == product_sales.c.id_category)
         .group_by(Category.id)
-        .order_by(func.sum(ProductSales.quantity * Product.price).desc())
+        .order_by(revenue.desc())
     ).fetchall()
 
     if not revenue_by_category:
@@ -193,21 +515,39 @@ def get_revenue_by_category(
 
 
 def get_monthly_average(session: T_Session) -> list[dict]:
-    monthly_avg = session.execute(
-        select(
-            func.date_trunc('month', Sales.created_at).label('month'),
-            func.avg(Sales.total_amount).label('avg_sales'),
-        )
-        .group_by(func.date_trunc('month', Sales.created_at))
-        .order_by(func.date_trunc('month', Sales.created_at))
-    ).fetchall()
+    close_days(session)
+    today = type_coerce(func.current_date(), Date)
+    daily_totals = session.execute(
+        union_all(
+            select(
+                SalesDailyTotals.day,
+                SalesDailyTotals.revenue,
+                SalesDailyTotals.sale_count,
+            ).where(SalesDailyTotals.day < func.current_date()),
+            select(
+                today,
+                func.sum(Sales.total_amount),
+                func.count(Sales.id),
+            ).where(
+                Sales.deleted_at.is_(None)
+                & (Sales.created_at >= func.current_date())
+            ),
+        ).order_by('day')
+    ).all()
+
+    months: dict[date, list[float]] = {}
+    for day, revenue, sale_count in daily_totals:
+        if sale_count:
+            month = months.setdefault(day.replace(day=1), [0.0, 0])
+            month[0] += revenue
+            month[1] += sale_count
 
-    if not monthly_avg:
+    if not months:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail='No sales data found'
         )
 
     return [
-        {'month': month, 'avg_sales': avg_sales}
-        for month, avg_sales in monthly_avg
+        {'month': month, 'avg_sales': revenue / sale_count}
+        for month, (revenue, sale_count) in months.items()
     ]
@@ -1,12 +1,15 @@
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import HTTPException
 from sqlalchemy import func, select
 
 from fastapi_supermarket.annotaded.t_currentuser import T_CurrentUser
 from fastapi_supermarket.annotaded.t_session import T_Session
+from fastapi_supermarket.core.pagination import next_cursor, paginate
 from fastapi_supermarket.core.security import (
     get_password_hash,
+    user_cache,
 )
 from fastapi_supermarket.models import User
 from fastapi_supermarket.schemas.user_schema import (
@@ -48,11 +51,16 @@ def find_all(
     session: T_Session,
     skip: int,
     limit: int,
+    cursor: Optional[str] = None,
 ) -> UserListResponse:
+    query = select(User).where(User.deleted_at.is_(None))
     users = session.scalars(
-        select(User).where(User.deleted_at.is_(None)).limit(limit).offset(skip)
+        paginate(query, User.id, skip, limit, cursor)
     ).all()
-    return {'users': users}
+    return {
+        'users': users,
+        'next_cursor': next_cursor([u.id for u in users], limit),
+    }
 
 
 def find_by_id(user_id: int, current_user: T_CurrentUser) -> UserResponse:
@@ -76,6 +84,7 @@ def update(
             detail='Not enough permissions!',
         )
 
+    old_email = current_user.email
     current_user.name = user.name
     current_user.email = user.email
     current_user.cpf = user.cpf
@@ -84,6 +93,9 @@ def update(
     current_user.updated_at = func.now()
 
     session.commit()
+    # Só depois do commit: antes, outra requisição ainda leria a linha
+    # antiga do banco e a colocaria de volta no cache
+    user_cache.invalidate(old_email)
     session.refresh(current_user)
 
     return current_user
@@ -103,6 +115,7 @@ def delete(
     current_user.deleted_at = func.now()
 
     session.commit()
+    user_cache.invalidate(current_user.email)
     session.refresh(current_user)
 
     return {'message': 'User deleted!'}
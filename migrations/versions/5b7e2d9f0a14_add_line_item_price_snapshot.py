@@ -0,0 +1,75 @@
+"""add line item price snapshot
+
+Revision ID: 5b7e2d9f0a14
+Revises: 8e5c0d3a61f2
+Create Date: 2025-03-03 10:12:44.520913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9f0a14'
+down_revision: Union[str, None] = '8e5c0d3a61f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10_000
+
+BACKFILL_ITEMS = sa.text(
+    'UPDATE product_sales SET unit_price = ('
+    'SELECT products.price FROM products '
+    'WHERE products.id = product_sales.id_product'
+    ') WHERE product_sales.id > :start AND product_sales.id <= :end'
+)
+
+BACKFILL_SALES = sa.text(
+    'UPDATE sales SET total_amount = COALESCE(('
+    'SELECT SUM(product_sales.quantity * product_sales.unit_price) '
+    'FROM product_sales WHERE product_sales.id_sale = sales.id'
+    '), 0) WHERE sales.id > :start AND sales.id <= :end'
+)
+
+
+def _backfill(statement, table: str) -> None:
+    # Cada lote é confirmado em separado para não segurar locks longos
+    bind = op.get_bind()
+    max_id = bind.scalar(sa.text(f'SELECT MAX(id) FROM {table}')) or 0
+    for start in range(0, max_id, BATCH_SIZE):
+        bind.execute(statement, {'start': start, 'end': start + BATCH_SIZE})
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                'quantity', sa.Integer(), server_default='1', nullable=False
+            )
+        )
+        batch_op.add_column(sa.Column('unit_price', sa.Float(), nullable=True))
+    with op.batch_alter_table('sales') as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                'total_amount', sa.Float(), server_default='0', nullable=False
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        _backfill(BACKFILL_ITEMS, 'product_sales')
+        _backfill(BACKFILL_SALES, 'sales')
+
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.alter_column(
+            'unit_price', existing_type=sa.Float(), nullable=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('sales') as batch_op:
+        batch_op.drop_column('total_amount')
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.drop_column('unit_price')
+        batch_op.drop_column('quantity')
@@ -0,0 +1,57 @@
+"""create soft delete indexes
+
+Revision ID: 8e5c0d3a61f2
+Revises: 4f1a2b9c7d10
+Create Date: 2025-02-24 09:31:05.118240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e5c0d3a61f2'
+down_revision: Union[str, None] = '4f1a2b9c7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text('deleted_at IS NULL')
+
+PARTIAL_INDEXES = [
+    ('ix_users_email', 'users', ['email']),
+    ('ix_users_cpf', 'users', ['cpf']),
+    ('ix_products_id_category', 'products', ['id_category']),
+    ('ix_sales_created_at', 'sales', ['created_at']),
+    ('ix_sales_id_user', 'sales', ['id_user']),
+]
+
+INDEXES = [
+    ('ix_product_sales_id_sale', 'product_sales', ['id_sale']),
+    ('ix_product_sales_id_product', 'product_sales', ['id_product']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação
+    with op.get_context().autocommit_block():
+        for name, table, columns in PARTIAL_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=ACTIVE,
+                sqlite_where=ACTIVE,
+                postgresql_concurrently=True,
+            )
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(PARTIAL_INDEXES + INDEXES):
+            op.drop_index(name, table, postgresql_concurrently=True)
@@ -0,0 +1,67 @@
+"""create sales daily rollup
+
+Revision ID: a2c4e6f8b031
+Revises: 5b7e2d9f0a14
+Create Date: 2025-03-10 08:47:19.602311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c4e6f8b031'
+down_revision: Union[str, None] = '5b7e2d9f0a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_ROLLUP = sa.text(
+    'INSERT INTO sales_daily_rollup '
+    '(day, id_category, id_product, units, revenue, sale_count) '
+    'SELECT date(sales.created_at), products.id_category, '
+    'product_sales.id_product, SUM(product_sales.quantity), '
+    'SUM(product_sales.quantity * product_sales.unit_price), '
+    'COUNT(DISTINCT product_sales.id_sale) '
+    'FROM product_sales '
+    'JOIN sales ON sales.id = product_sales.id_sale '
+    'JOIN products ON products.id = product_sales.id_product '
+    'WHERE sales.deleted_at IS NULL '
+    'GROUP BY date(sales.created_at), products.id_category, '
+    'product_sales.id_product'
+)
+
+BACKFILL_TOTALS = sa.text(
+    'INSERT INTO sales_daily_totals (day, revenue, sale_count) '
+    'SELECT date(created_at), SUM(total_amount), COUNT(id) '
+    'FROM sales WHERE deleted_at IS NULL '
+    'GROUP BY date(created_at)'
+)
+
+
+def upgrade() -> None:
+    op.create_table('sales_daily_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('id_category', sa.Integer(), nullable=False),
+    sa.Column('id_product', sa.Integer(), nullable=False),
+    sa.Column('units', sa.Integer(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('sale_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['id_category'], ['categories.id'], ),
+    sa.ForeignKeyConstraint(['id_product'], ['products.id'], ),
+    sa.PrimaryKeyConstraint('day', 'id_category', 'id_product')
+    )
+    op.create_table('sales_daily_totals',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('revenue', sa.Float(), nullable=False),
+    sa.Column('sale_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.execute(BACKFILL_ROLLUP)
+    op.execute(BACKFILL_TOTALS)
+
+
+def downgrade() -> None:
+    op.drop_table('sales_daily_totals')
+    op.drop_table('sales_daily_rollup')
@@ -0,0 +1,38 @@
+"""keep only closed days in sales totals
+
+Revision ID: b6d2f8a4c917
+Revises: f1c9a7e3b254
+Create Date: 2025-03-29 10:02:41.387215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2f8a4c917'
+down_revision: Union[str, None] = 'f1c9a7e3b254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# O dia corrente passa a ser gravado só no fechamento (close_days)
+DELETE_OPEN_DAY = sa.text(
+    'DELETE FROM sales_daily_totals WHERE day >= CURRENT_DATE'
+)
+
+RESTORE_OPEN_DAY = sa.text(
+    'INSERT INTO sales_daily_totals (day, revenue, sale_count) '
+    'SELECT date(created_at), SUM(total_amount), COUNT(id) '
+    'FROM sales WHERE deleted_at IS NULL AND created_at >= CURRENT_DATE '
+    'GROUP BY date(created_at)'
+)
+
+
+def upgrade() -> None:
+    op.execute(DELETE_OPEN_DAY)
+
+
+def downgrade() -> None:
+    op.execute(RESTORE_OPEN_DAY)
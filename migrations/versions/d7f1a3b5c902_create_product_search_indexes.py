@@ -0,0 +1,75 @@
+"""create product search indexes
+
+Revision ID: d7f1a3b5c902
+Revises: a2c4e6f8b031
+Create Date: 2025-03-17 14:05:51.338170
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f1a3b5c902'
+down_revision: Union[str, None] = 'a2c4e6f8b031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text('deleted_at IS NULL')
+
+SQLITE_SEARCH = [
+    'CREATE VIRTUAL TABLE products_fts USING fts5('
+    "description, content='products', content_rowid='id')",
+    'CREATE TRIGGER products_fts_insert '
+    'AFTER INSERT ON products BEGIN '
+    'INSERT INTO products_fts(rowid, description) '
+    'VALUES (new.id, new.description); END',
+    'CREATE TRIGGER products_fts_delete '
+    'AFTER DELETE ON products BEGIN '
+    'INSERT INTO products_fts(products_fts, rowid, description) '
+    "VALUES ('delete', old.id, old.description); END",
+    'CREATE TRIGGER products_fts_update '
+    'AFTER UPDATE OF description ON products BEGIN '
+    'INSERT INTO products_fts(products_fts, rowid, description) '
+    "VALUES ('delete', old.id, old.description); "
+    'INSERT INTO products_fts(rowid, description) '
+    'VALUES (new.id, new.description); END',
+    # Indexa os produtos já cadastrados
+    "INSERT INTO products_fts(products_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_products_description_trgm',
+                'products',
+                ['description'],
+                postgresql_using='gin',
+                postgresql_ops={'description': 'gin_trgm_ops'},
+                postgresql_where=ACTIVE,
+                postgresql_concurrently=True,
+            )
+    elif dialect == 'sqlite':
+        for statement in SQLITE_SEARCH:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                'ix_products_description_trgm',
+                'products',
+                postgresql_concurrently=True,
+            )
+    elif dialect == 'sqlite':
+        for trigger in ['insert', 'delete', 'update']:
+            op.execute(f'DROP TRIGGER products_fts_{trigger}')
+        op.execute('DROP TABLE products_fts')
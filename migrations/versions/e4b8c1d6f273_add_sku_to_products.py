@@ -0,0 +1,40 @@
+"""add sku to products
+
+Revision ID: e4b8c1d6f273
+Revises: d7f1a3b5c902
+Create Date: 2025-03-24 11:42:17.604391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8c1d6f273'
+down_revision: Union[str, None] = 'd7f1a3b5c902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Sem batch_alter_table: ADD COLUMN e CREATE INDEX rodam direto no
+    # SQLite, e recriar a tabela apagaria os triggers da busca (FTS5)
+    op.add_column('products', sa.Column('sku', sa.String(), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_products_sku',
+            'products',
+            ['sku'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_products_sku', 'products', postgresql_concurrently=True
+        )
+    op.drop_column('products', 'sku')
@@ -0,0 +1,66 @@
+"""add category snapshot to line items
+
+Revision ID: f1c9a7e3b254
+Revises: e4b8c1d6f273
+Create Date: 2025-03-27 09:18:05.113742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c9a7e3b254'
+down_revision: Union[str, None] = 'e4b8c1d6f273'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 10_000
+
+# Itens antigos ficam com a categoria atual do produto, a mesma usada
+# até aqui pelos agregados diários
+BACKFILL_ITEMS = sa.text(
+    'UPDATE product_sales SET id_category = ('
+    'SELECT products.id_category FROM products '
+    'WHERE products.id = product_sales.id_product'
+    ') WHERE product_sales.id > :start AND product_sales.id <= :end'
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.add_column(
+            sa.Column('id_category', sa.Integer(), nullable=True)
+        )
+
+    with op.get_context().autocommit_block():
+        # Cada lote é confirmado em separado para não segurar locks longos
+        bind = op.get_bind()
+        max_id = (
+            bind.scalar(sa.text('SELECT MAX(id) FROM product_sales')) or 0
+        )
+        for start in range(0, max_id, BATCH_SIZE):
+            bind.execute(
+                BACKFILL_ITEMS, {'start': start, 'end': start + BATCH_SIZE}
+            )
+
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.alter_column(
+            'id_category', existing_type=sa.Integer(), nullable=False
+        )
+        batch_op.create_foreign_key(
+            'fk_product_sales_id_category_categories',
+            'categories',
+            ['id_category'],
+            ['id'],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('product_sales') as batch_op:
+        batch_op.drop_constraint(
+            'fk_product_sales_id_category_categories', type_='foreignkey'
+        )
+        batch_op.drop_column('id_category')
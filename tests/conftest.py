@@ -1,36 +1,81 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
-from fastapi_supermarket.core.database import get_session
-from fastapi_supermarket.core.security import get_password_hash
+from fastapi_supermarket.core import database
+from fastapi_supermarket.core.database import get_session, settings
+from fastapi_supermarket.core.request_metrics import request_metrics
+from fastapi_supermarket.core.security import get_password_hash, user_cache
 from fastapi_supermarket.factory.user_factory import UserFactory
 from fastapi_supermarket.main import app
-from fastapi_supermarket.models import table_registry
+from fastapi_supermarket.models import (
+    Category,
+    Product,
+    ProductSales,
+    Sales,
+    table_registry,
+)
+from fastapi_supermarket.services.catalog_service import catalog
+from fastapi_supermarket.services.report_service import report_cache
 
 
 @pytest.fixture
-def client(session):
-    def get_session_override():
-        return session
-
+def client(session, async_engine, monkeypatch):
+    if async_engine:
+        monkeypatch.setattr(settings, 'DATABASE_ASYNC', True)
+
+        async def get_session_override():
+            async with AsyncSession(async_engine) as async_session:
+                yield async_session.sync_session
+
+    else:
+
+        def get_session_override():
+            return session
+
+    # O aquecimento do lifespan também usa o banco de teste
+    monkeypatch.setattr(database, 'engine', session.get_bind())
+    monkeypatch.setattr(database, 'async_engine', async_engine)
+    user_cache.clear()
+    report_cache.clear()
+    request_metrics.reset()
+    request_metrics.instrument(
+        async_engine.sync_engine if async_engine else session.get_bind()
+    )
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
+        # Os fixtures gravam produtos sem passar pelo catálogo
+        catalog.reset()
         yield client
 
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def session():
-    engine = create_engine(
-        'sqlite:///:memory:',
-        connect_args={'check_same_thread': False},
-        poolclass=StaticPool,
+@pytest.fixture(params=['sync', 'async'])
+def async_engine(request, tmp_path):
+    """No modo assíncrono a aplicação acessa o banco via aiosqlite."""
+    if request.param == 'sync':
+        return None
+    return create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path}/test.db', poolclass=NullPool
     )
+
+
+@pytest.fixture
+def session(async_engine):
+    if async_engine:
+        engine = create_engine(async_engine.url.set(drivername='sqlite'))
+    else:
+        engine = create_engine(
+            'sqlite:///:memory:',
+            connect_args={'check_same_thread': False},
+            poolclass=StaticPool,
+        )
     table_registry.metadata.create_all(engine)
+    catalog.reset()
 
     with Session(engine) as session:
         yield session
@@ -62,3 +107,60 @@ def token(client, user):
         },
     )
     return response.json()['access_token']
+
+
+@pytest.fixture
+def category(session):
+    category = Category(description='Bebidas')
+
+    session.add(category)
+    session.commit()
+    session.refresh(category)
+
+    return category
+
+
+@pytest.fixture
+def product(session, category):
+    product = Product(
+        id_category=category.id, description='Refrigerante', price=8.5
+    )
+
+    session.add(product)
+    session.commit()
+    session.refresh(product)
+
+    return product
+
+
+@pytest.fixture
+def create_sales(session, user, product):
+    def create(total):
+        for _ in range(total):
+            sale = Sales(id_user=user.id, total_amount=product.price)
+            session.add(sale)
+            session.flush()
+            session.add(
+                ProductSales(
+                    id_sale=sale.id,
+                    id_product=product.id,
+                    id_category=product.id_category,
+                    unit_price=product.price,
+                )
+            )
+        session.commit()
+
+    return create
+
+
+@pytest.fixture
+def count_queries(session, async_engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = async_engine.sync_engine if async_engine else session.get_bind()
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', before_cursor_execute)
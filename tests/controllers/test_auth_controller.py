@@ -1,6 +1,13 @@
 from http import HTTPStatus
 
 from freezegun import freeze_time
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from fastapi_supermarket.core.hashing import pwd_context
+from fastapi_supermarket.core.security import (
+    DUMMY_PASSWORD_HASH,
+    password_hasher,
+)
 
 
 def test_auth(client, user):
@@ -15,6 +22,24 @@ def test_auth(client, user):
     assert 'access_token' in token
 
 
+def test_auth_rehashes_outdated_password(client, session, user):
+    outdated_hash = Argon2Hasher(time_cost=1, memory_cost=1024).hash(
+        user.clean_password
+    )
+    user.password = outdated_hash
+    session.commit()
+
+    response = client.post(
+        '/auth/token',
+        data={'username': user.email, 'password': user.clean_password},
+    )
+    session.refresh(user)
+
+    assert response.status_code == HTTPStatus.OK
+    assert user.password != outdated_hash
+    assert user.password.startswith('$argon2id$')
+
+
 def test_authentication_credentials_is_invalid_password_in_auth(client, user):
     response = client.post(
         '/auth/token',
@@ -37,6 +62,29 @@ def test_authentication_credentials_is_invalid_email_in_auth(client, user):
     }
 
 
+def test_unknown_email_still_verifies_a_password(client, monkeypatch):
+    verified = []
+
+    def verify(plain_password, hashed_password):
+        verified.append(hashed_password)
+        return False
+
+    monkeypatch.setattr(password_hasher, 'verify', verify)
+    response = client.post(
+        '/auth/token',
+        data={'username': 'wrong@teste.com', 'password': 'secret-invalid'},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert verified == [DUMMY_PASSWORD_HASH]
+
+
+def test_dummy_password_hash_uses_current_parameters():
+    assert not pwd_context.current_hasher.check_needs_rehash(
+        DUMMY_PASSWORD_HASH
+    )
+
+
 def test_token_expired_after_time(client, user):
     with freeze_time('2025-02-10 12:00:00'):
         response = client.post(
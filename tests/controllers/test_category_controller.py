@@ -0,0 +1,30 @@
+from http import HTTPStatus
+
+
+def test_read_categories_not_modified(client, token, category):
+    headers = {'Authorization': f'Bearer {token}'}
+    response = client.get('/categories/', headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['categories'][0]['description'] == 'Bebidas'
+
+    response = client.get(
+        '/categories/',
+        headers={**headers, 'If-None-Match': response.headers['ETag']},
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_delete_category_changes_etag(client, token, category):
+    headers = {'Authorization': f'Bearer {token}'}
+    etag = client.get(f'/categories/{category.id}', headers=headers).headers[
+        'ETag'
+    ]
+    list_etag = client.get('/categories/', headers=headers).headers['ETag']
+
+    client.delete(f'/categories/{category.id}', headers=headers)
+
+    response = client.get(
+        '/categories/', headers={**headers, 'If-None-Match': list_etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert etag != list_etag
@@ -0,0 +1,62 @@
+import asyncio
+from http import HTTPStatus
+
+from fastapi_supermarket.core.readiness import readiness
+from fastapi_supermarket.services.catalog_service import catalog
+
+
+def test_liveness(client):
+    response = client.get('/health/live')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'status': 'ok'}
+
+
+def test_ready_after_warm_up(client):
+    response = client.get('/health/ready')
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data['status'] == 'ready'
+    assert set(data['steps']) == {
+        'mappers',
+        'pool',
+        'password_hasher',
+        'catalog',
+    }
+    # A cópia do catálogo já foi carregada pelo lifespan
+    assert catalog.loads >= 1
+
+
+def test_not_ready_until_warm_up_finishes(client, monkeypatch):
+    monkeypatch.setattr(readiness, 'ready', False)
+
+    response = client.get('/health/ready')
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.json()['status'] == 'starting'
+
+
+def test_failed_warm_up_step_is_retried(monkeypatch):
+    monkeypatch.setattr(readiness, 'retry_delay', 0)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:  # noqa: PLR2004
+            raise RuntimeError('database is down')
+
+    async def warm_up():
+        await readiness.run({'mappers': lambda: None, 'pool': flaky})
+        assert not readiness.ready
+        assert readiness.error == 'pool: database is down'
+        assert list(readiness.steps) == ['mappers']
+        while not readiness.ready:
+            await asyncio.sleep(0)
+
+    asyncio.run(asyncio.wait_for(warm_up(), timeout=1))
+
+    assert readiness.error is None
+    assert readiness.retries == 2  # noqa: PLR2004
+    assert list(readiness.steps) == ['mappers', 'pool']
+    readiness.reset()
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+
+
+def test_read_metrics_user_cache(client, user, token):
+    client.get(
+        f'/users/{user.id}', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    response = client.get('/metrics')
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['Content-Type'].startswith('text/plain')
+    assert 'supermarket_user_cache_size 1\n' in response.text
+    assert 'supermarket_readiness_ready 1\n' in response.text
+    lines = response.text.splitlines()
+    assert '# TYPE supermarket_pool_checkouts_total counter' in lines
+    assert '# TYPE supermarket_user_cache_size gauge' in lines
+    assert '# TYPE supermarket_user_cache_hits_total counter' in lines
+    assert '# TYPE supermarket_pool_wait_seconds_total counter' in lines
+    # Todas as métricas têm HELP e TYPE
+    names = {
+        line.split(' ')[0].split('{')[0]
+        for line in lines
+        if line.startswith('supermarket_')
+    }
+    for name in names:
+        assert any(line.startswith(f'# HELP {name} ') for line in lines)
+
+
+def test_read_metrics_per_route(client, user, token):
+    headers = {'Authorization': f'Bearer {token}'}
+    client.get(f'/users/{user.id}', headers=headers)
+    client.get('/users/999999', headers=headers)
+    client.get('/missing')
+
+    lines = client.get('/metrics').text.splitlines()
+    route = 'method="GET",route="/users/{user_id}"'
+    assert (
+        f'http_request_duration_seconds_count{{{route},status="200"}} 1'
+        in lines
+    )
+    assert (
+        f'http_request_duration_seconds_count{{{route},status="403"}} 1'
+        in lines
+    )
+    assert (
+        'http_request_duration_seconds_count'
+        '{method="GET",route="<unmatched>",status="404"} 1'
+    ) in lines
+    assert f'http_response_size_bytes_bucket{{{route},le="+Inf"}} 2' in lines
+    # O /metrics em andamento é a única requisição em curso
+    assert 'http_requests_in_flight 1' in lines
+
+    statements = next(
+        line
+        for line in lines
+        if line.startswith(f'http_request_db_statements_total{{{route}}}')
+    )
+    assert int(statements.rsplit(' ', 1)[1]) > 0
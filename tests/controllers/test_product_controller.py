@@ -0,0 +1,329 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+
+from fastapi_supermarket.models import Product
+from fastapi_supermarket.services.catalog_service import catalog
+
+
+def test_read_products_not_modified(client, token, product, count_queries):
+    headers = {'Authorization': f'Bearer {token}'}
+    response = client.get('/products/', headers=headers)
+    assert response.status_code == HTTPStatus.OK
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+
+    count_queries.clear()
+    response = client.get(
+        '/products/', headers={**headers, 'If-None-Match': etag}
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers['ETag'] == etag
+    assert not response.content
+    # Só as consultas de versão; a listagem não é carregada
+    assert all('count' in s or 'max' in s for s in count_queries)
+
+
+def test_read_products_etag_changes_with_catalog(client, token, product):
+    headers = {'Authorization': f'Bearer {token}'}
+    etag = client.get('/products/', headers=headers).headers['ETag']
+
+    client.post(
+        '/products/',
+        headers=headers,
+        json={
+            'id_category': product.id_category,
+            'description': 'Suco',
+            'price': 6.0,
+        },
+    )
+    response = client.get(
+        '/products/', headers={**headers, 'If-None-Match': etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['ETag'] != etag
+    assert len(response.json()['products']) == 2  # noqa: PLR2004
+
+
+def test_catalog_picks_up_external_writes_after_staleness(
+    client, session, token, product, monkeypatch
+):
+    headers = {'Authorization': f'Bearer {token}'}
+    client.get('/products/', headers=headers)
+
+    # Escrita feita por outro processo: não passa pelo product_service
+    session.add(
+        Product(id_category=product.id_category, description='Suco', price=6.0)
+    )
+    session.commit()
+    response = client.get('/products/', headers=headers)
+    assert len(response.json()['products']) == 1
+
+    monkeypatch.setattr(catalog, 'max_staleness', 0)
+    response = client.get('/products/', headers=headers)
+    assert len(response.json()['products']) == 2  # noqa: PLR2004
+
+
+def test_disabled_catalog_reads_from_database(  # noqa: PLR0913, PLR0917
+    client, token, user, product, monkeypatch, count_queries
+):
+    monkeypatch.setattr(catalog, 'max_staleness', 0)
+    headers = {'Authorization': f'Bearer {token}'}
+    loads = catalog.loads
+
+    for _ in range(3):
+        response = client.get(f'/products/{product.id}', headers=headers)
+        assert response.json()['description'] == 'Refrigerante'
+    assert client.get('/products/', headers=headers).json()['products'] == [
+        response.json()
+    ]
+    response = client.post(
+        '/sales/',
+        headers=headers,
+        json={
+            'id_user': user.id,
+            'products': [{'id_product': product.id, 'quantity': 2}],
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['total_amount'] == product.price * 2
+
+    assert catalog.loads == loads
+    # Só consultas pontuais ou paginadas: nenhuma carga do catálogo inteiro
+    assert all(
+        any(
+            bound in statement
+            for bound in ('products.id = ', 'products.id IN ', 'LIMIT ')
+        )
+        for statement in count_queries
+        if 'FROM products JOIN categories' in statement
+    )
+
+
+@pytest.mark.parametrize('max_staleness', [30, 0])
+def test_read_products_cursor_until_the_end(  # noqa: PLR0913, PLR0917
+    client, session, token, product, monkeypatch, max_staleness
+):
+    monkeypatch.setattr(catalog, 'max_staleness', max_staleness)
+    session.add(
+        Product(id_category=product.id_category, description='Suco', price=6.0)
+    )
+    session.commit()
+    catalog.bump()
+    headers = {'Authorization': f'Bearer {token}'}
+
+    first_page = client.get('/products/?limit=2', headers=headers).json()
+    response = client.get(
+        f'/products/?limit=2&cursor={first_page["next_cursor"]}',
+        headers=headers,
+    )
+
+    assert len(first_page['products']) == 2  # noqa: PLR2004
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'products': []}
+
+
+def test_read_products_etag_changes_with_category(
+    client, session, token, product, category
+):
+    headers = {'Authorization': f'Bearer {token}'}
+    etag = client.get('/products/', headers=headers).headers['ETag']
+
+    category.description = 'Bebidas geladas'
+    category.updated_at = datetime.now() + timedelta(minutes=1)
+    session.commit()
+    catalog.bump()
+    response = client.get(
+        '/products/', headers={**headers, 'If-None-Match': etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['products'][0]['category'] == 'Bebidas geladas'
+
+
+def test_read_products_etag_depends_on_page(client, token, product):
+    headers = {'Authorization': f'Bearer {token}'}
+    etag = client.get('/products/', headers=headers).headers['ETag']
+
+    response = client.get(
+        '/products/?limit=1', headers={**headers, 'If-None-Match': etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_get_product_not_modified_since(client, token, product):
+    headers = {'Authorization': f'Bearer {token}'}
+    response = client.get(f'/products/{product.id}', headers=headers)
+    last_modified = response.headers['Last-Modified']
+
+    response = client.get(
+        f'/products/{product.id}',
+        headers={**headers, 'If-Modified-Since': last_modified},
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    response = client.get(
+        f'/products/{product.id}',
+        headers={**headers, 'If-None-Match': 'W/"outdated"'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['description'] == 'Refrigerante'
+
+
+def test_read_products_modified_since_delete(
+    client, session, token, product, category
+):
+    hour_ago = datetime.now() - timedelta(hours=1)
+    other = Product(id_category=category.id, description='Suco', price=6.0)
+    session.add(other)
+    session.flush()
+    for row in (product, other, category):
+        row.updated_at = hour_ago
+    session.commit()
+    catalog.bump()
+    headers = {'Authorization': f'Bearer {token}'}
+    last_modified = client.get('/products/', headers=headers).headers[
+        'Last-Modified'
+    ]
+
+    client.delete(f'/products/{other.id}', headers=headers)
+    response = client.get(
+        '/products/', headers={**headers, 'If-Modified-Since': last_modified}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [item['id'] for item in response.json()['products']] == [product.id]
+
+
+def test_get_product_not_found(client, token):
+    response = client.get(
+        '/products/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_search_products(client, session, token, product):
+    session.add_all([
+        Product(
+            id_category=product.id_category,
+            description='Refresco de uva',
+            price=4.0,
+        ),
+        Product(
+            id_category=product.id_category,
+            description='Suco de laranja',
+            price=6.0,
+        ),
+    ])
+    session.commit()
+
+    response = client.get(
+        '/products/search',
+        params={'q': 'refr'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert {p['description'] for p in response.json()['products']} == {
+        'Refrigerante',
+        'Refresco de uva',
+    }
+
+    response = client.get(
+        '/products/search',
+        params={'q': 'suco laranja', 'id_category': product.id_category},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert [p['description'] for p in response.json()['products']] == [
+        'Suco de laranja'
+    ]
+
+
+def test_search_products_follows_writes(client, token, product):
+    headers = {'Authorization': f'Bearer {token}'}
+    client.put(
+        f'/products/{product.id}',
+        headers=headers,
+        json={'description': 'Cola'},
+    )
+    response = client.get(
+        '/products/search', params={'q': 'cola'}, headers=headers
+    )
+    assert response.json()['products'][0]['id'] == product.id
+
+    client.delete(f'/products/{product.id}', headers=headers)
+    response = client.get(
+        '/products/search', params={'q': 'cola'}, headers=headers
+    )
+    assert response.json() == {'products': []}
+
+
+def test_search_products_without_words(client, token, product):
+    response = client.get(
+        '/products/search',
+        params={'q': '"*'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'products': []}
+
+
+def test_import_products_csv_upserts_by_sku(client, token, category):
+    headers = {'Authorization': f'Bearer {token}'}
+    body = (
+        'sku,category,description,price\n'
+        '001,Bebidas,Suco,5.5\n'
+        '002,Bebidas,"Água, sem gás",2\n'
+        '003,Limpeza,Sabão,3\n'
+        '004,Bebidas,Chá,abc\n'
+    )
+    response = client.post(
+        '/products/import', headers=headers, content=body.encode()
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'created': 2,
+        'updated': 0,
+        'invalid': 2,
+        'errors': [
+            {'row': 3, 'detail': 'Invalid category'},
+            {
+                'row': 4,
+                'detail': (
+                    'price: Input should be a valid number, '
+                    'unable to parse string as a number'
+                ),
+            },
+        ],
+    }
+
+    response = client.post(
+        '/products/import',
+        headers=headers,
+        params={'format': 'ndjson'},
+        content=(
+            '{"sku": "002", "category": "Bebidas", '
+            '"description": "Água", "price": 2.5}\n'
+            '{"sku": "005", "category": "Bebidas", '
+            '"description": "Café", "price": 9}\n'
+            'not json\n'
+        ).encode(),
+    )
+    assert response.json()['created'] == 1
+    assert response.json()['updated'] == 1
+    assert response.json()['errors'] == [{'row': 3, 'detail': 'Invalid JSON'}]
+
+    response = client.get('/products/', headers=headers)
+    assert [
+        (product['description'], product['price'])
+        for product in response.json()['products']
+    ] == [('Suco', 5.5), ('Água', 2.5), ('Café', 9.0)]
+
+
+def test_import_products_missing_columns(client, token):
+    response = client.post(
+        '/products/import',
+        headers={'Authorization': f'Bearer {token}'},
+        content=b'sku,description\n001,Suco\n',
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Missing columns: category, price'}
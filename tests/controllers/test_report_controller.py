@@ -0,0 +1,135 @@
+from datetime import date, timedelta
+from http import HTTPStatus
+
+from sqlalchemy import update
+
+from fastapi_supermarket.models import Sales
+from fastapi_supermarket.services.report_service import report_cache
+from fastapi_supermarket.services.rollup_service import rebuild
+
+PRODUCT_PRICE = 8.5
+
+
+def _period(day: date) -> dict[str, str]:
+    return {'start_date': day.isoformat(), 'end_date': day.isoformat()}
+
+
+def _sell_yesterday(session, create_sales) -> date:
+    yesterday = date.today() - timedelta(days=1)
+    create_sales(1)
+    session.execute(update(Sales).values(created_at=yesterday))
+    rebuild(session)
+    return yesterday
+
+
+def test_sales_summary_for_today(client, token, create_sales):
+    create_sales(2)
+
+    response = client.get(
+        '/reports/summary',
+        params=_period(date.today()),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'total_sales': PRODUCT_PRICE * 2}
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+    assert report_cache.stats()['size'] == 0
+
+
+def test_report_with_invalid_period(client, token):
+    response = client.get(
+        '/reports/summary',
+        params={'start_date': '2025-02-01', 'end_date': '2025-01-01'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_closed_period_is_cached_until_a_sale_changes(
+    client, session, token, create_sales
+):
+    yesterday = _sell_yesterday(session, create_sales)
+    hits = report_cache.hits
+
+    for _ in range(2):
+        response = client.get(
+            '/reports/summary',
+            params=_period(yesterday),
+            headers={'Authorization': f'Bearer {token}'},
+        )
+        assert response.json() == {'total_sales': PRODUCT_PRICE}
+    assert response.headers['Cache-Control'].startswith('private, max-age=')
+    assert report_cache.hits == hits + 1
+
+    client.delete('/sales/1', headers={'Authorization': f'Bearer {token}'})
+    response = client.get(
+        '/reports/summary',
+        params=_period(yesterday),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.json() == {'total_sales': 0}
+
+
+def test_report_not_modified(client, token, create_sales):
+    create_sales(1)
+    response = client.get(
+        '/reports/revenue-by-category',
+        params=_period(date.today()),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.json() == [
+        {'category': 'Bebidas', 'total_revenue': PRODUCT_PRICE}
+    ]
+
+    response = client.get(
+        '/reports/revenue-by-category',
+        params=_period(date.today()),
+        headers={
+            'Authorization': f'Bearer {token}',
+            'If-None-Match': response.headers['ETag'],
+        },
+    )
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert not response.content
+
+
+def test_top_product_and_customer(client, user, token, create_sales):
+    create_sales(1)
+
+    response = client.get(
+        '/reports/top-product',
+        params=_period(date.today()),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.json() == {
+        'category': 'Bebidas',
+        'description': 'Refrigerante',
+        'price': PRODUCT_PRICE,
+    }
+
+    response = client.get(
+        '/reports/top-customer',
+        params=_period(date.today()),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.json()['id'] == user.id
+
+
+def test_top_product_not_found(client, token):
+    response = client.get(
+        '/reports/top-product',
+        params=_period(date.today()),
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_monthly_average(client, token, create_sales):
+    create_sales(2)
+
+    response = client.get(
+        '/reports/monthly-average',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()[-1]['avg_sales'] == PRODUCT_PRICE
@@ -0,0 +1,415 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+from http import HTTPStatus
+
+import pytest
+
+from fastapi_supermarket.core.pagination import MAX_PAGE_SIZE
+from fastapi_supermarket.models import Sales
+from fastapi_supermarket.services import sales_service
+
+TOTAL_SALES = 2
+MANY_SALES = 20
+EXPORTED_SALES = 3
+PRODUCT_PRICE = 8.5
+
+
+def test_get_all_sales(client, user, token, create_sales):
+    create_sales(TOTAL_SALES)
+
+    response = client.get(
+        '/sales/', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    sales = response.json()['sales']
+    assert len(sales) == TOTAL_SALES
+    assert sales[0]['id_user'] == user.id
+    assert sales[0]['products'] == [
+        {
+            'category': 'Bebidas',
+            'description': 'Refrigerante',
+            'price': 8.5,
+            'quantity': 1,
+        }
+    ]
+
+
+def test_get_all_sales_query_count_is_constant(
+    client, token, create_sales, count_queries
+):
+    create_sales(1)
+    client.get('/sales/', headers={'Authorization': f'Bearer {token}'})
+    count_queries.clear()
+    client.get(
+        f'/sales/?limit={MAX_PAGE_SIZE}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    queries_with_one_sale = len(count_queries)
+
+    create_sales(MANY_SALES)
+    count_queries.clear()
+    response = client.get(
+        f'/sales/?limit={MAX_PAGE_SIZE}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+
+    assert len(response.json()['sales']) == MANY_SALES + 1
+    assert len(count_queries) == queries_with_one_sale
+
+
+def test_get_sale(client, user, token, create_sales):
+    create_sales(1)
+
+    response = client.get(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'id': 1,
+        'id_user': user.id,
+        'total_amount': 8.5,
+        'products': [
+            {
+                'category': 'Bebidas',
+                'description': 'Refrigerante',
+                'price': 8.5,
+                'quantity': 1,
+            }
+        ],
+    }
+
+
+def test_sale_not_found_in_get_sale(client, token):
+    response = client.get(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {'detail': 'Venda não encontrada'}
+
+
+def test_get_all_sales_with_cursor(client, token, create_sales):
+    create_sales(3)
+
+    response = client.get(
+        '/sales/?limit=2', headers={'Authorization': f'Bearer {token}'}
+    )
+    first_page = response.json()
+    assert [sale['id'] for sale in first_page['sales']] == [1, 2]
+
+    response = client.get(
+        f'/sales/?limit=2&cursor={first_page["next_cursor"]}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    second_page = response.json()
+    assert response.status_code == HTTPStatus.OK
+    assert [sale['id'] for sale in second_page['sales']] == [3]
+    assert 'next_cursor' not in second_page
+
+
+def test_invalid_cursor_in_get_all_sales(client, token):
+    response = client.get(
+        '/sales/?cursor=invalid', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Invalid cursor.'}
+
+
+def test_limit_above_max_page_size_in_get_all_sales(client, token):
+    response = client.get(
+        '/sales/?limit=1000', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_create_sale(client, user, product, token):
+    response = client.post(
+        '/sales/',
+        headers={'Authorization': f'Bearer {token}'},
+        json={
+            'id_user': user.id,
+            'products': [
+                {'id_product': product.id},
+                {'id_product': product.id, 'quantity': 3},
+            ],
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'id': 1,
+        'id_user': user.id,
+        'total_amount': 34.0,
+        'products': [
+            {
+                'category': 'Bebidas',
+                'description': 'Refrigerante',
+                'price': 8.5,
+                'quantity': 1,
+            },
+            {
+                'category': 'Bebidas',
+                'description': 'Refrigerante',
+                'price': 8.5,
+                'quantity': 3,
+            },
+        ],
+    }
+
+
+def test_price_change_keeps_sale_price(client, user, product, token):
+    sale_price = product.price
+    client.post(
+        '/sales/',
+        headers={'Authorization': f'Bearer {token}'},
+        json={'id_user': user.id, 'products': [{'id_product': product.id}]},
+    )
+    client.put(
+        f'/products/{product.id}',
+        headers={'Authorization': f'Bearer {token}'},
+        json={'price': 10.0},
+    )
+
+    response = client.get(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.json()['total_amount'] == sale_price
+    assert response.json()['products'][0]['price'] == sale_price
+
+
+def test_invalid_product_in_create_sale(client, user, product, token):
+    response = client.post(
+        '/sales/',
+        headers={'Authorization': f'Bearer {token}'},
+        json={
+            'id_user': user.id,
+            'products': [{'id_product': product.id}, {'id_product': 99}],
+        },
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': 'Invalid product ID'}
+
+
+def test_create_sales_batch(client, user, product, token):
+    sales = [
+        {
+            'client_key': 'pos-1:1',
+            'id_user': user.id,
+            'products': [{'id_product': product.id}],
+        },
+        {
+            'client_key': 'pos-1:2',
+            'id_user': user.id,
+            'products': [{'id_product': 99}],
+        },
+        {
+            'client_key': 'pos-1:1',
+            'id_user': user.id,
+            'products': [{'id_product': product.id}],
+        },
+    ]
+
+    response = client.post(
+        '/sales/batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=sales,
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        'created': 1,
+        'duplicates': 1,
+        'invalid': 1,
+        'results': [
+            {
+                'client_key': 'pos-1:1',
+                'status': 'created',
+                'id': 1,
+                'detail': None,
+            },
+            {
+                'client_key': 'pos-1:2',
+                'status': 'invalid',
+                'id': None,
+                'detail': 'Invalid product ID',
+            },
+            {
+                'client_key': 'pos-1:1',
+                'status': 'duplicate',
+                'id': 1,
+                'detail': None,
+            },
+        ],
+    }
+
+
+def test_retry_sales_batch_does_not_duplicate(client, user, product, token):
+    sales = [
+        {
+            'client_key': f'pos-1:{i}',
+            'id_user': user.id,
+            'products': [{'id_product': product.id}],
+        }
+        for i in range(3)
+    ]
+    client.post(
+        '/sales/batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=sales[:2],
+    )
+
+    response = client.post(
+        '/sales/batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=sales,
+    )
+    assert [r['status'] for r in response.json()['results']] == [
+        'duplicate',
+        'duplicate',
+        'created',
+    ]
+
+    response = client.get(
+        '/sales/', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert len(response.json()['sales']) == len(sales)
+
+
+def test_sales_batch_key_stored_by_concurrent_request(  # noqa: PLR0913, PLR0917
+    client, session, user, product, token, monkeypatch
+):
+    products_by_id = sales_service._products_by_id
+
+    def store_concurrently(product_ids, app_session):
+        # O envio original grava a chave depois da verificação de duplicatas
+        session.add(Sales(id_user=user.id, client_key='pos-1:1'))
+        session.commit()
+        return products_by_id(product_ids, app_session)
+
+    monkeypatch.setattr(sales_service, '_products_by_id', store_concurrently)
+    response = client.post(
+        '/sales/batch',
+        headers={'Authorization': f'Bearer {token}'},
+        json=[
+            {
+                'client_key': 'pos-1:1',
+                'id_user': user.id,
+                'products': [{'id_product': product.id}],
+            }
+        ],
+    )
+
+    assert response.json()['results'] == [
+        {
+            'client_key': 'pos-1:1',
+            'status': 'duplicate',
+            'id': 1,
+            'detail': None,
+        }
+    ]
+
+
+def test_delete_sale(client, token, create_sales):
+    create_sales(1)
+
+    response = client.delete(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'message': 'Sale deleted!'}
+
+    response = client.get(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_sale_not_found_in_delete_sale(client, token):
+    response = client.delete(
+        '/sales/1', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {'detail': 'Venda não encontrada'}
+
+
+def test_export_sales_csv(client, token, create_sales):
+    create_sales(EXPORTED_SALES)
+
+    response = client.get(
+        '/sales/export', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'].startswith('text/csv')
+    assert 'sales.csv' in response.headers['content-disposition']
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == EXPORTED_SALES
+    assert rows[0]['id_sale'] == '1'
+    assert rows[0]['product'] == 'Refrigerante'
+    assert float(rows[0]['unit_price']) == PRODUCT_PRICE
+
+
+def test_export_sales_ndjson(client, token, create_sales):
+    create_sales(EXPORTED_SALES)
+
+    response = client.get(
+        '/sales/export',
+        params={'format': 'ndjson'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['id_sale'] for row in rows] == [1, 2, 3]
+    assert rows[0]['category'] == 'Bebidas'
+    assert rows[0]['quantity'] == 1
+
+
+def test_export_sales_by_period(client, token, create_sales):
+    create_sales(1)
+    tomorrow = date.today() + timedelta(days=1)
+
+    response = client.get(
+        '/sales/export',
+        params={'format': 'ndjson', 'from': tomorrow.isoformat()},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert not response.text
+
+
+def test_export_sales_with_invalid_period(client, token):
+    today = date.today()
+
+    response = client.get(
+        '/sales/export',
+        params={
+            'from': today.isoformat(),
+            'to': (today - timedelta(days=1)).isoformat(),
+        },
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_export_sales_parquet(client, token, create_sales):
+    pq = pytest.importorskip('pyarrow.parquet')
+    create_sales(EXPORTED_SALES)
+
+    response = client.get(
+        '/sales/export',
+        params={'format': 'parquet'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == EXPORTED_SALES
+    assert (
+        table.column('unit_price').to_pylist()
+        == [PRODUCT_PRICE] * EXPORTED_SALES
+    )
+
+
+def test_export_sales_invalid_format(client, token):
+    response = client.get(
+        '/sales/export',
+        params={'format': 'xlsx'},
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -1,5 +1,10 @@
 from http import HTTPStatus
 
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from fastapi_supermarket.core.security import user_cache
+from fastapi_supermarket.models import User
 from fastapi_supermarket.schemas.user_schema import UserResponse
 
 request_user_create = {
@@ -63,6 +68,25 @@ def test_read_users_with_users(client, user, token):
     assert response.json() == {'users': [user_schema]}
 
 
+def test_read_users_with_cursor(client, user, token):
+    client.post('/users', json=request_user_create)
+
+    response = client.get(
+        '/users?limit=1', headers={'Authorization': f'Bearer {token}'}
+    )
+    first_page = response.json()
+    assert [u['id'] for u in first_page['users']] == [user.id]
+
+    response = client.get(
+        f'/users?limit=1&cursor={first_page["next_cursor"]}',
+        headers={'Authorization': f'Bearer {token}'},
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [u['email'] for u in response.json()['users']] == [
+        request_user_create['email']
+    ]
+
+
 def test_get_user(client, user, token):
     response = client.get(
         f'/users/{user.id}', headers={'Authorization': f'Bearer {token}'}
@@ -74,6 +98,33 @@ def test_get_user(client, user, token):
     assert data['email'] == user.email
 
 
+def test_get_user_uses_cached_current_user(client, user, token, count_queries):
+    client.get(
+        f'/users/{user.id}', headers={'Authorization': f'Bearer {token}'}
+    )
+    count_queries.clear()
+
+    response = client.get(
+        f'/users/{user.id}', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['email'] == user.email
+    assert count_queries == []
+
+
+def test_update_user_invalidates_cached_user(client, user, token):
+    client.put(
+        f'/users/{user.id}',
+        headers={'Authorization': f'Bearer {token}'},
+        json=request_user_update,
+    )
+
+    response = client.get(
+        f'/users/{user.id}', headers={'Authorization': f'Bearer {token}'}
+    )
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
 def test_not_enough_permissions_in_get_user(client, user, token):
     response = client.get(
         '/users/7', headers={'Authorization': f'Bearer {token}'}
@@ -113,6 +164,27 @@ def test_delete_user(client, user, token):
     assert response.json() == {'message': 'User deleted!'}
 
 
+def test_deleted_user_is_rejected_on_next_request(client, user, token):
+    headers = {'Authorization': f'Bearer {token}'}
+    stale = {
+        attr.key: getattr(user, attr.key)
+        for attr in User.__mapper__.column_attrs
+    }
+
+    def cache_stale_user(session):
+        # Outra requisição com o mesmo token, no meio da remoção
+        user_cache.set(user.email, stale)
+
+    event.listen(Session, 'before_commit', cache_stale_user)
+    try:
+        client.delete(f'/users/{user.id}', headers=headers)
+    finally:
+        event.remove(Session, 'before_commit', cache_stale_user)
+
+    response = client.get(f'/users/{user.id}', headers=headers)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
 def test_not_enough_permissions_in_delete_user(client, user, token):
     response = client.delete(
         '/users/7', headers={'Authorization': f'Bearer {token}'}
@@ -0,0 +1,49 @@
+from fastapi_supermarket.core.cache import TTLCache
+
+
+def test_cache_hit_and_miss():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2}
+
+
+def test_cache_expires_entries():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1, ttl=0)
+
+    assert cache.get('a') is None
+    assert cache.stats()['size'] == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3  # noqa: PLR2004
+
+
+def test_cache_invalidate():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.invalidate('a')
+
+    assert cache.get('a') is None
+
+
+def test_cache_invalidate_where():
+    cache = TTLCache(maxsize=3, ttl=60)
+    cache.set(('a', 1), 1)
+    cache.set(('b', 2), 2)
+
+    cache.invalidate_where(lambda key: key[1] > 1)
+
+    assert cache.get(('a', 1)) == 1
+    assert cache.get(('b', 2)) is None
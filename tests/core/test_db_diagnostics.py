@@ -0,0 +1,47 @@
+import logging
+
+from fastapi_supermarket.core.db_diagnostics import DBDiagnostics
+from fastapi_supermarket.core.request_metrics import request_metrics
+
+
+def test_trace_flags_repeated_statements():
+    trace = DBDiagnostics(slow_query_ms=1000, n_plus_one_threshold=3).trace({
+        'method': 'GET',
+        'path': '/sales/',
+    })
+    for product_id in range(3):
+        trace.record('SELECT * FROM products WHERE id = ?', (product_id,), 0)
+    trace.record('SELECT * FROM sales', (), 0)
+
+    assert trace.repeated() == [('SELECT * FROM products WHERE id = ?', 3)]
+
+
+def test_diagnostics_headers_and_logs(
+    client, token, product, monkeypatch, caplog
+):
+    monkeypatch.setattr(
+        request_metrics,
+        'diagnostics',
+        DBDiagnostics(slow_query_ms=0, n_plus_one_threshold=1),
+    )
+    with caplog.at_level(logging.WARNING):
+        response = client.get(
+            '/products/', headers={'Authorization': f'Bearer {token}'}
+        )
+
+    assert int(response.headers['X-DB-Queries']) > 0
+    assert float(response.headers['X-DB-Time']) >= 0
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(
+        message.startswith('Slow query') and 'GET /products/' in message
+        for message in messages
+    )
+    assert any(message.startswith('Possible N+1') for message in messages)
+
+
+def test_diagnostics_off_by_default(client, token):
+    response = client.get(
+        '/products/', headers={'Authorization': f'Bearer {token}'}
+    )
+
+    assert 'X-DB-Queries' not in response.headers
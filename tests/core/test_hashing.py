@@ -0,0 +1,37 @@
+from http import HTTPStatus
+
+import pytest
+from fastapi import HTTPException
+
+from fastapi_supermarket.core.hashing import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(workers=1, queue_limit=0)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_and_verify_in_process_pool(hasher):
+    hashed = hasher.hash('Secret123')
+
+    assert hasher.verify('Secret123', hashed)
+    assert not hasher.verify('secret-invalid', hashed)
+
+
+def test_hash_inline_without_workers():
+    hasher = PasswordHasher(workers=0, queue_limit=0)
+
+    assert hasher.verify('Secret123', hasher.hash('Secret123'))
+
+
+def test_hash_rejected_when_queue_is_full(hasher):
+    hasher._slots.acquire()
+
+    with pytest.raises(HTTPException) as exc:
+        hasher.hash('Secret123')
+
+    assert exc.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert exc.value.headers == {'Retry-After': '1'}
+    assert hasher.rejected == 1
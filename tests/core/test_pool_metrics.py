@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from fastapi_supermarket.core.pool_metrics import (
+    InstrumentedQueuePool,
+    pool_metrics,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f'sqlite:///{tmp_path}/pool.db',
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    pool_metrics.reset()
+    pool_metrics.instrument(engine)
+    yield engine
+    engine.dispose()
+    pool_metrics.reset()
+
+
+def test_pool_metrics_count_overflow_and_timeouts(engine):
+    first = engine.connect()
+    second = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    stats = pool_metrics.stats(engine.pool)
+    assert stats['checkouts'] == 2  # noqa: PLR2004
+    assert stats['overflow_checkouts'] == 1
+    assert stats['timeouts'] == 1
+    assert stats['checked_out'] == 2  # noqa: PLR2004
+    assert stats['wait_seconds_max'] > 0
+
+    first.close()
+    second.close()
+    assert pool_metrics.stats(engine.pool)['checkins'] == 2  # noqa: PLR2004
@@ -0,0 +1,28 @@
+from fastapi import Response
+
+from fastapi_supermarket.core.responses import model_response
+from fastapi_supermarket.schemas.product_schema import (
+    ProductListResponse,
+    ProductResponse,
+)
+
+
+def test_model_response_skips_none_and_keeps_headers():
+    products = ProductListResponse.model_construct(
+        products=[
+            ProductResponse.model_construct(
+                id=1, category='Bebidas', description='Suco', price=5.5
+            )
+        ]
+    )
+    response = Response()
+    response.headers['ETag'] = 'W/"1"'
+
+    fast_response = model_response(products, response, exclude_none=True)
+
+    assert fast_response.body == (
+        b'{"products":[{"category":"Bebidas","description":"Suco",'
+        b'"price":5.5,"id":1}]}'
+    )
+    assert fast_response.headers['ETag'] == 'W/"1"'
+    assert fast_response.headers['Content-Type'] == 'application/json'
@@ -0,0 +1,71 @@
+from sqlalchemy import func, select
+
+from fastapi_supermarket.factory.dataset import (
+    DatasetSpec,
+    SalesDataset,
+    bulk_insert,
+    first_ids,
+)
+from fastapi_supermarket.models import Product, ProductSales, Sales
+
+SPEC = DatasetSpec(users=20, products=30, sales=200, categories=5, days=30)
+
+
+def _rows(dataset):
+    return (
+        list(dataset.categories()),
+        list(dataset.users()),
+        list(dataset.products()),
+        list(dataset.sales()),
+    )
+
+
+def test_same_seed_generates_same_rows(session):
+    ids = first_ids(session.connection())
+
+    assert _rows(SalesDataset(SPEC, ids, 'hash')) == _rows(
+        SalesDataset(SPEC, ids, 'hash')
+    )
+
+
+def test_generated_data_is_consistent(session, product):
+    conn = session.connection()
+    dataset = SalesDataset(SPEC, first_ids(conn), 'hash')
+    for name, batches in [
+        ('categories', dataset.categories()),
+        ('users', dataset.users()),
+        ('products', dataset.products()),
+    ]:
+        for batch in batches:
+            bulk_insert(conn, name, batch)
+    for sales, items in dataset.sales():
+        bulk_insert(conn, 'sales', sales)
+        bulk_insert(conn, 'product_sales', items)
+
+    assert session.scalar(select(func.count(Sales.id))) == SPEC.sales
+    # Os IDs continuam após os dados existentes
+    assert session.scalar(select(func.min(ProductSales.id_product))) > (
+        product.id
+    )
+    mismatched = session.scalar(
+        select(func.count()).select_from(
+            select(Sales.id)
+            .join(ProductSales, ProductSales.id_sale == Sales.id)
+            .group_by(Sales.id, Sales.total_amount)
+            .having(
+                func.abs(
+                    func.sum(ProductSales.unit_price * ProductSales.quantity)
+                    - Sales.total_amount
+                )
+                > 0.01  # noqa: PLR2004
+            )
+            .subquery()
+        )
+    )
+    assert mismatched == 0
+    unit_prices = session.execute(
+        select(ProductSales.unit_price, Product.price).join(
+            Product, Product.id == ProductSales.id_product
+        )
+    ).all()
+    assert all(unit == price for unit, price in unit_prices)
@@ -0,0 +1,51 @@
+from datetime import date, timedelta
+
+import pytest
+
+from fastapi_supermarket.schemas.sales_schema import SalesCreate
+from fastapi_supermarket.services import sales_service
+
+np = pytest.importorskip('numpy')
+
+from fastapi_supermarket.services import analytics_service  # noqa: E402
+
+REPORTS = [
+    'get_sales_summary',
+    'get_top_product',
+    'get_top_customer',
+    'get_revenue_by_category',
+]
+
+
+@pytest.fixture
+def sales(session, user, product):
+    for quantity in [1, 3]:
+        sales_service.create(
+            SalesCreate(
+                id_user=user.id,
+                products=[{'id_product': product.id, 'quantity': quantity}],
+            ),
+            session,
+        )
+
+
+@pytest.mark.parametrize('report', REPORTS)
+def test_numpy_backend_matches_sql(session, sales, report):
+    start_date = date.today() - timedelta(days=1)
+    end_date = date.today() + timedelta(days=1)
+
+    assert getattr(analytics_service, report)(
+        start_date, end_date, session
+    ) == getattr(sales_service, report)(start_date, end_date, session)
+
+
+def test_numpy_monthly_average_matches_sql(session, sales):
+    assert analytics_service.get_monthly_average(
+        session
+    ) == sales_service.get_monthly_average(session)
+
+
+def test_numpy_backend_without_sales(session):
+    assert analytics_service.get_sales_summary(
+        date.today(), date.today(), session
+    ) == {'total_sales': 0}
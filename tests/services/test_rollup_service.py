@@ -0,0 +1,159 @@
+from datetime import datetime, time, timedelta
+
+from sqlalchemy import Date, func, select, type_coerce, update
+
+from fastapi_supermarket.models import (
+    Category,
+    Sales,
+    SalesDailyRollup,
+    SalesDailyTotals,
+)
+from fastapi_supermarket.schemas.sales_schema import SalesCreate
+from fastapi_supermarket.services import sales_service
+from fastapi_supermarket.services.catalog_service import catalog
+from fastapi_supermarket.services.rollup_service import close_days, rebuild
+
+UNITS = 3
+YESTERDAY_REVENUE = 100.0
+
+
+def _sell(session, user, product, quantity):
+    return sales_service.create(
+        SalesCreate(
+            id_user=user.id,
+            products=[{'id_product': product.id, 'quantity': quantity}],
+        ),
+        session,
+    )
+
+
+def _rollup(session):
+    return session.execute(
+        select(
+            SalesDailyRollup.id_product,
+            SalesDailyRollup.units,
+            SalesDailyRollup.revenue,
+            SalesDailyRollup.sale_count,
+        )
+    ).all()
+
+
+def test_create_sale_updates_rollup(session, user, product):
+    _sell(session, user, product, UNITS)
+    _sell(session, user, product, 1)
+
+    assert _rollup(session) == [
+        (product.id, UNITS + 1, product.price * (UNITS + 1), 2)
+    ]
+    # O dia corrente só entra nos totais depois de encerrado
+    assert session.scalars(select(SalesDailyTotals)).all() == []
+
+
+def test_delete_sale_decrements_rollup(session, user, product):
+    sale = _sell(session, user, product, UNITS)
+    _sell(session, user, product, 1)
+
+    sales_service.delete(sale.id, session)
+    assert _rollup(session) == [(product.id, 1, product.price, 1)]
+
+    sales_service.delete(sale.id + 1, session)
+    assert _rollup(session) == []
+    assert session.scalars(select(SalesDailyTotals)).all() == []
+
+
+def test_closed_day_totals(session, user, product):
+    today = session.scalar(select(type_coerce(func.current_date(), Date)))
+    yesterday = today - timedelta(days=1)
+    sale = _sell(session, user, product, UNITS)
+    session.execute(
+        update(Sales)
+        .where(Sales.id == sale.id)
+        .values(created_at=datetime.combine(yesterday, time(12)))
+    )
+    session.commit()
+    _sell(session, user, product, 1)
+
+    close_days(session)
+    close_days(session)
+    assert session.execute(
+        select(
+            SalesDailyTotals.day,
+            SalesDailyTotals.revenue,
+            SalesDailyTotals.sale_count,
+        )
+    ).all() == [(yesterday, product.price * UNITS, 1)]
+
+    sales_service.delete(sale.id, session)
+    assert session.scalars(select(SalesDailyTotals)).all() == []
+
+
+def _move_to_new_category(session, product):
+    category = Category(description='Mercearia')
+    session.add(category)
+    session.commit()
+    product.id_category = category.id
+    session.commit()
+    catalog.bump()
+
+
+def test_delete_sale_after_product_changes_category(session, user, product):
+    sale = _sell(session, user, product, UNITS)
+    _move_to_new_category(session, product)
+
+    sales_service.delete(sale.id, session)
+    assert _rollup(session) == []
+    assert session.scalars(select(SalesDailyTotals)).all() == []
+
+
+def test_rebuild_keeps_category_of_the_sale(session, user, product):
+    category_at_sale = product.id_category
+    _sell(session, user, product, UNITS)
+    _move_to_new_category(session, product)
+    _sell(session, user, product, 1)
+
+    rebuild(session)
+    assert session.execute(
+        select(SalesDailyRollup.id_category, SalesDailyRollup.units).order_by(
+            SalesDailyRollup.id_category
+        )
+    ).all() == [(category_at_sale, UNITS), (product.id_category, 1)]
+
+
+def test_rebuild_matches_incremental_rollup(session, user, product):
+    _sell(session, user, product, UNITS)
+    sale = _sell(session, user, product, 1)
+    sales_service.delete(sale.id, session)
+    incremental = _rollup(session)
+
+    rebuild(session)
+    assert _rollup(session) == incremental
+
+
+def test_reports_read_rollup_for_closed_days(session, user, product):
+    # O dia corrente é o do banco, o mesmo usado nos relatórios
+    today = session.scalar(select(type_coerce(func.current_date(), Date)))
+    yesterday = today - timedelta(days=1)
+    session.add(
+        SalesDailyRollup(
+            day=yesterday,
+            id_category=product.id_category,
+            id_product=product.id,
+            units=10,
+            revenue=YESTERDAY_REVENUE,
+            sale_count=2,
+        )
+    )
+    session.add(
+        SalesDailyTotals(
+            day=yesterday, revenue=YESTERDAY_REVENUE, sale_count=2
+        )
+    )
+    session.commit()
+    _sell(session, user, product, 1)
+
+    summary = sales_service.get_sales_summary(yesterday, today, session)
+    assert summary == {'total_sales': YESTERDAY_REVENUE + product.price}
+    assert sales_service.get_revenue_by_category(
+        yesterday, yesterday, session
+    ) == [{'category': 'Bebidas', 'total_revenue': YESTERDAY_REVENUE}]
+    assert sales_service.get_monthly_average(session)[-1]['avg_sales'] > 0